@@ -0,0 +1,400 @@
+# OpenAI / Maven Central 모의 서버
+# 실제 비용 없이 LibGuard 성능을 재기 위해 /v1/chat/completions 와 /solrsearch/select 를 흉내 낸다.
+#   - 응답 지연, 5xx 오류 비율, 무작위 429 주입, 어긋난 JSON(설명 문장/코드 블록/잘림) 비율을 설정할 수 있다
+#   - 분당 요청/토큰 한도를 주면 실제처럼 x-ratelimit-* 헤더를 보내고 한도를 넘으면 429 로 거절한다
+#   - stream=true 요청에는 SSE(chunked) 로 응답한다 (stream_options.include_usage 면 마지막에 usage 조각)
+#   - /maven2/.../maven-metadata.xml 은 좌표별 합성 버전 이력을 ETag / Last-Modified 와 함께 주고 조건부 GET 에는 304 로 답한다
+#     (publish() 로 새 릴리스를 추가하면 검색 결과와 메타데이터가 함께 바뀐다)
+# 요청 수와 토큰 수는 서버 쪽에서 세므로 분석기 코드를 건드리지 않고 비용을 비교할 수 있다.
+
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from libguard.analyzer import estimate_tokens
+
+CHAT_PATH = "/v1/chat/completions"
+SEARCH_PATH = "/solrsearch/select"
+REPOSITORY_PATH = "/maven2"
+
+_COORDINATE_QUERY = re.compile(r'g:"([^"]+)" AND a:"([^"]+)"')
+_BATCH_ENTRY = re.compile(r"^### (.+)$", re.MULTILINE)
+_STREAM_CHUNK_CHARS = 16
+
+
+def synthetic_latest_version(coordinate: str) -> str:
+    """좌표마다 고정된 가짜 최신 버전 (벤치마크 카탈로그가 같은 값을 기준으로 버전을 정한다)"""
+    digest = int(hashlib.sha256(coordinate.encode("utf-8")).hexdigest()[:8], 16)
+    return f"{2 + digest % 5}.{digest % 13 + 1}.{digest % 7 + 1}"
+
+
+def synthetic_versions(coordinate: str) -> List[str]:
+    """synthetic_latest_version 까지의 가짜 릴리스 이력 (라인마다 패치 몇 개 + 다음 메이저의 사전 릴리스)"""
+    major, minor, patch = (int(part) for part in synthetic_latest_version(coordinate).split("."))
+    versions = []
+    for line_major in range(1, major + 1):
+        last_minor = minor if line_major == major else 3
+        for line_minor in range(last_minor + 1):
+            last_patch = patch if (line_major, line_minor) == (major, minor) else 2
+            versions.extend(f"{line_major}.{line_minor}.{line_patch}" for line_patch in range(last_patch + 1))
+    versions.append(f"{major + 1}.0.0-alpha01")
+    return versions
+
+
+@dataclass
+class MockConfig:
+    latency: float = 0.05
+    latency_jitter: float = 0.0
+    maven_latency: float = 0.01
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    malformed_rate: float = 0.0
+    retry_after: float = 0.2
+    requests_per_minute: Optional[int] = None
+    tokens_per_minute: Optional[int] = None
+    seed: Optional[int] = None
+
+
+class _Window:
+    def __init__(self, limit: Optional[int]):
+        """분 단위 고정 창 카운터 (limit 이 None 이면 제한 없음)"""
+        self.limit = limit
+        self.used = 0
+        self.started = time.monotonic()
+
+    def remaining(self, now: float) -> Optional[int]:
+        if self.limit is None:
+            return None
+        if now - self.started >= 60.0:
+            self.started, self.used = now, 0
+        return max(0, self.limit - self.used)
+
+    def reset_in(self, now: float) -> float:
+        return max(0.0, 60.0 - (now - self.started))
+
+
+class MockUpstream:
+    def __init__(self, config: Optional[MockConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        """백그라운드 스레드에서 도는 모의 서버 (with 문으로 시작/종료)"""
+        self.config = config or MockConfig()
+        self._random = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._requests = _Window(self.config.requests_per_minute)
+        self._tokens = _Window(self.config.tokens_per_minute)
+        # publish() 로 추가한 릴리스 (좌표 → (버전 목록, 게시 시각))
+        self._published: Dict[str, Tuple[List[str], float]] = {}
+        self.reset_stats()
+
+        upstream = self
+
+        class Handler(_Handler):
+            server_upstream = upstream
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def chat_url(self) -> str:
+        return self.base_url + CHAT_PATH
+
+    @property
+    def search_url(self) -> str:
+        return self.base_url + SEARCH_PATH
+
+    @property
+    def repository_url(self) -> str:
+        return self.base_url + REPOSITORY_PATH
+
+    def publish(self, coordinate: str, version: str):
+        """좌표에 새 릴리스 추가 (이후 검색 결과의 latestVersion 과 maven-metadata.xml 에 반영)"""
+        with self._lock:
+            versions, _ = self._published.get(coordinate, ([], 0.0))
+            self._published[coordinate] = (versions + [version], time.time())
+
+    def versions(self, coordinate: str) -> Tuple[List[str], float]:
+        """(릴리스 이력, 마지막 게시 시각)"""
+        with self._lock:
+            published, published_at = self._published.get(coordinate, ([], 0.0))
+        return synthetic_versions(coordinate) + published, published_at
+
+    def latest_version(self, coordinate: str) -> str:
+        with self._lock:
+            published = self._published.get(coordinate)
+        return published[0][-1] if published else synthetic_latest_version(coordinate)
+
+    def start(self) -> "MockUpstream":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="libguard-mock", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "MockUpstream":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def reset_stats(self):
+        with self._lock:
+            self.stats: Dict[str, int] = {
+                "chat_requests": 0,
+                "chat_throttled": 0,
+                "chat_errors": 0,
+                "search_requests": 0,
+                "metadata_requests": 0,
+                "metadata_not_modified": 0,
+                "prompt_tokens": 0,
+                "completion_tokens": 0,
+            }
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self.stats)
+
+    def _count(self, name: str, amount: int = 1):
+        with self._lock:
+            self.stats[name] += amount
+
+    def _roll(self, probability: float) -> bool:
+        if probability <= 0:
+            return False
+        with self._lock:
+            return self._random.random() < probability
+
+    def _sleep(self, base: float):
+        if base <= 0 and self.config.latency_jitter <= 0:
+            return
+        with self._lock:
+            jitter = self._random.uniform(0, self.config.latency_jitter) if self.config.latency_jitter else 0.0
+        time.sleep(max(0.0, base + jitter))
+
+    def admit(self, tokens: int) -> Tuple[bool, Dict[str, str]]:
+        """한도 확인 후 (허용 여부, x-ratelimit-* 헤더) 반환"""
+        with self._lock:
+            now = time.monotonic()
+            headers: Dict[str, str] = {}
+            remaining_requests = self._requests.remaining(now)
+            remaining_tokens = self._tokens.remaining(now)
+            allowed = (remaining_requests is None or remaining_requests >= 1) and (
+                remaining_tokens is None or remaining_tokens >= tokens
+            )
+            if allowed:
+                self._requests.used += 1
+                self._tokens.used += tokens
+
+            for kind, window in (("requests", self._requests), ("tokens", self._tokens)):
+                remaining = window.remaining(now)
+                if remaining is None:
+                    continue
+                headers[f"x-ratelimit-limit-{kind}"] = str(window.limit)
+                headers[f"x-ratelimit-remaining-{kind}"] = str(remaining)
+                headers[f"x-ratelimit-reset-{kind}"] = f"{window.reset_in(now):.3f}s"
+            if not allowed:
+                reset = min(
+                    window.reset_in(now)
+                    for window in (self._requests, self._tokens)
+                    if window.limit is not None
+                )
+                headers["retry-after-ms"] = str(int(reset * 1000))
+            return allowed, headers
+
+
+def _answer(prompt: str) -> str:
+    """프롬프트 모양(단독/묶음)에 맞는 JSON 답변"""
+    names = _BATCH_ENTRY.findall(prompt)
+    if names and '"results"' in prompt:
+        return json.dumps({"results": [_analysis(name.strip()) for name in names]}, ensure_ascii=False)
+    match = re.search(r"라이브러리: (.+)", prompt)
+    analysis = _analysis(match.group(1).strip() if match else "library")
+    analysis.pop("name")
+    return json.dumps(analysis, ensure_ascii=False)
+
+
+def _malform(content: str) -> str:
+    """JSON 모드를 무시한 모델처럼 답을 감싸거나 자른다 (분석기의 로컬 복구 확인용)"""
+    variant = int(hashlib.sha256(content.encode("utf-8")).hexdigest(), 16) % 3
+    if variant == 0:
+        return f"분석 결과는 다음과 같습니다.\n```json\n{content}\n```\n참고하세요."
+    if variant == 1:
+        return content[:-1] + ",}"
+    return content[:len(content) * 3 // 4]
+
+
+def _analysis(name: str) -> dict:
+    return {
+        "name": name,
+        "latest_version": "",
+        "priority": "중간",
+        "summary": f"{name} 의 모의 분석 요약입니다. 버그 수정과 성능 개선이 포함되어 있습니다.",
+        "recommendation": "업데이트 권장",
+    }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_upstream: MockUpstream
+
+    def log_message(self, *args):
+        pass
+
+    def _send_json(self, status: int, body: dict, headers: Optional[Dict[str, str]] = None):
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _write_chunk(self, data: bytes):
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+        self.wfile.flush()
+
+    def do_GET(self):
+        upstream = self.server_upstream
+        url = urlparse(self.path)
+        if url.path.startswith(REPOSITORY_PATH + "/") and url.path.endswith("/maven-metadata.xml"):
+            self._send_metadata(url.path[len(REPOSITORY_PATH) + 1:-len("/maven-metadata.xml")])
+            return
+        if url.path != SEARCH_PATH:
+            self._send_json(404, {"error": "not found"})
+            return
+
+        upstream._count("search_requests")
+        upstream._sleep(upstream.config.maven_latency)
+
+        params = parse_qs(url.query)
+        query = params.get("q", [""])[0]
+        rows = int(params.get("rows", ["20"])[0])
+        start = int(params.get("start", ["0"])[0])
+
+        coordinates = [f"{g}:{a}" for g, a in _COORDINATE_QUERY.findall(query)]
+        if not coordinates and query:
+            coordinates = [f"com.example:{query}"]
+        docs = [
+            {"g": c.split(":", 1)[0], "a": c.split(":", 1)[1], "latestVersion": upstream.latest_version(c)}
+            for c in coordinates
+        ]
+        self._send_json(200, {"response": {"numFound": len(docs), "start": start, "docs": docs[start:start + rows]}})
+
+    def _send_metadata(self, path: str):
+        """group/path/artifact → maven-metadata.xml (If-None-Match 가 맞으면 304)"""
+        upstream = self.server_upstream
+        upstream._count("metadata_requests")
+        upstream._sleep(upstream.config.maven_latency)
+
+        group_path, _, artifact = path.rpartition("/")
+        coordinate = f"{group_path.replace('/', '.')}:{artifact}"
+        versions, published_at = upstream.versions(coordinate)
+        body = (
+            "<?xml version=\"1.0\" encoding=\"UTF-8\"?>\n<metadata>\n"
+            f"  <groupId>{group_path.replace('/', '.')}</groupId>\n  <artifactId>{artifact}</artifactId>\n"
+            f"  <versioning>\n    <latest>{versions[-1]}</latest>\n    <release>{upstream.latest_version(coordinate)}</release>\n"
+            "    <versions>\n" + "".join(f"      <version>{version}</version>\n" for version in versions)
+            + "    </versions>\n    <lastUpdated>20240101000000</lastUpdated>\n  </versioning>\n</metadata>\n"
+        ).encode("utf-8")
+        etag = '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+        last_modified = formatdate(published_at or 1704067200, usegmt=True)
+
+        if self.headers.get("If-None-Match") == etag:
+            upstream._count("metadata_not_modified")
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/xml")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", last_modified)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        upstream = self.server_upstream
+        if urlparse(self.path).path != CHAT_PATH:
+            self._send_json(404, {"error": "not found"})
+            return
+
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        messages: List[dict] = body.get("messages", [])
+        prompt_tokens = sum(estimate_tokens(m.get("content", "")) for m in messages)
+        upstream._count("chat_requests")
+
+        if upstream._roll(upstream.config.throttle_rate):
+            upstream._count("chat_throttled")
+            self._send_json(
+                429,
+                {"error": {"code": "rate_limit_exceeded", "message": "mock throttle"}},
+                {"retry-after-ms": str(int(upstream.config.retry_after * 1000))},
+            )
+            return
+
+        allowed, headers = upstream.admit(prompt_tokens + int(body.get("max_tokens", 0)))
+        if not allowed:
+            upstream._count("chat_throttled")
+            self._send_json(429, {"error": {"code": "rate_limit_exceeded", "message": "mock limit"}}, headers)
+            return
+
+        upstream._sleep(upstream.config.latency)
+
+        if upstream._roll(upstream.config.error_rate):
+            upstream._count("chat_errors")
+            self._send_json(500, {"error": {"message": "mock server error"}}, headers)
+            return
+
+        prompt = messages[-1].get("content", "") if messages else ""
+        content = _answer(prompt)
+        if upstream._roll(upstream.config.malformed_rate):
+            content = _malform(content)
+        completion_tokens = estimate_tokens(content)
+        upstream._count("prompt_tokens", prompt_tokens)
+        upstream._count("completion_tokens", completion_tokens)
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+
+        if not body.get("stream"):
+            self._send_json(200, {
+                "model": body.get("model", ""),
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": content}}],
+                "usage": usage,
+            }, headers)
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        for i in range(0, len(content), _STREAM_CHUNK_CHARS):
+            chunk = {"choices": [{"index": 0, "delta": {"content": content[i:i + _STREAM_CHUNK_CHARS]}}]}
+            self._write_chunk(b"data: " + json.dumps(chunk, ensure_ascii=False).encode("utf-8") + b"\n\n")
+        if (body.get("stream_options") or {}).get("include_usage"):
+            chunk = {"choices": [], "usage": usage}
+            self._write_chunk(b"data: " + json.dumps(chunk).encode("utf-8") + b"\n\n")
+        self._write_chunk(b"data: [DONE]\n\n")
+        self._write_chunk(b"")
@@ -0,0 +1,233 @@
+# LibGuard 처리량 벤치마크
+# 모의 서버(mock_server)를 띄우고 합성 카탈로그(10 ~ 5,000개)를 StableLibraryAnalyzer 로 분석하면서
+# 초당 라이브러리 수, 결과 지연 p50/p95, API 호출 수, 토큰 수를 잰다.
+# 동시성/캐시 변경의 효과를 확인하고 성능 회귀를 잡는 용도이며, 실제 API 는 호출하지 않는다.
+#
+# 예) python -m benchmarks.run_benchmark --sizes 10,100,1000 --workers 1,4,8 --batch-size 1,4
+#     python -m benchmarks.run_benchmark --output bench.json
+#     python -m benchmarks.run_benchmark --baseline bench.json   # 20% 이상 느려지면 종료 코드 1
+
+import argparse
+import itertools
+import json
+import os
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+from benchmarks.mock_server import MockConfig, MockUpstream, synthetic_latest_version
+from libguard.analyzer import StableLibraryAnalyzer
+from libguard.cache import ResultCache
+from libguard.engine import AnalysisEngine
+from libguard.http_pool import configure_http
+from libguard.knowledge import BUNDLED_KNOWLEDGE_BASE_PATH, KnowledgeBase
+from libguard.ratelimit import AdaptiveRateLimiter
+from libguard.vulnerabilities import VulnerabilityIndex
+
+# 합성 카탈로그의 업데이트 유형 분포 (최신 / 패치 / 마이너 / 메이저)
+VERSION_MIX = ("latest", "patch", "patch", "minor", "minor", "major", "patch", "latest")
+# 몇 개마다 하나씩 앞 항목과 같은 좌표를 다른 별칭으로 넣는다 (중복 병합 확인용)
+DUPLICATE_EVERY = 20
+CACHE_MODES = ("none", "cold", "warm")
+
+
+def _current_version(latest: str, kind: str) -> str:
+    major, minor, patch = (int(part) for part in latest.split("."))
+    if kind == "patch":
+        return f"{major}.{minor}.{patch - 1}"
+    if kind == "minor":
+        return f"{major}.{minor - 1}.{patch}"
+    if kind == "major":
+        return f"{major - 1}.{minor}.{patch}"
+    return latest
+
+
+def make_catalog(size: int) -> str:
+    """size 개 라이브러리를 가진 합성 libs.versions.toml"""
+    lines = ["[libraries]"]
+    for i in range(size):
+        source = i - 1 if i and i % DUPLICATE_EVERY == 0 else i
+        group, artifact = f"com.example.group{source % 50}", f"artifact-{source}"
+        version = _current_version(
+            synthetic_latest_version(f"{group}:{artifact}"), VERSION_MIX[source % len(VERSION_MIX)]
+        )
+        lines.append(f'lib-{i} = {{ group = "{group}", name = "{artifact}", version = "{version}" }}')
+    return "\n".join(lines) + "\n"
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def run_scenario(
+    upstream: MockUpstream,
+    catalog: str,
+    workers: int,
+    batch_size: int,
+    cache: Optional[ResultCache],
+    work_dir: str,
+    stream: bool = False,
+) -> dict:
+    """카탈로그 한 번 분석하고 측정값 반환
+
+    로컬 캐시 디렉터리의 지식 베이스 갱신본/취약점 색인에 따라 결과가 달라지지 않도록
+    패키지 기본 지식 베이스와 work_dir 안의 (빈) 색인을 쓴다.
+    """
+    analyzer = StableLibraryAnalyzer(
+        "sk-benchmark",
+        cache=cache,
+        rate_limiter=AdaptiveRateLimiter(),
+        knowledge_base=KnowledgeBase(BUNDLED_KNOWLEDGE_BASE_PATH),
+        vulnerability_index=VulnerabilityIndex(os.path.join(work_dir, "vulnerabilities.json")),
+    )
+    analyzer.base_url = upstream.chat_url
+    analyzer.maven_search_url = upstream.search_url
+
+    parsed = analyzer.parse_catalog(catalog)
+    libraries = parsed.library_versions()
+    engine = AnalysisEngine(analyzer, max_workers=workers, batch_size=batch_size)
+
+    upstream.reset_stats()
+    latencies: List[float] = []
+    failed = 0
+    unparsed = 0
+    started = time.perf_counter()
+    on_partial = (lambda event: None) if stream else None
+    for _, result in engine.iter_results(libraries, parsed.coordinates(), on_partial=on_partial):
+        latencies.append(time.perf_counter() - started)
+        failed += result.is_failed
+        unparsed += result.summary.startswith("AI 분석 결과:")
+    elapsed = time.perf_counter() - started
+
+    stats = upstream.snapshot()
+    return {
+        "libraries": len(libraries),
+        "seconds": round(elapsed, 3),
+        "libraries_per_second": round(len(libraries) / elapsed, 1) if elapsed else 0.0,
+        "p50_seconds": round(percentile(latencies, 0.50), 3),
+        "p95_seconds": round(percentile(latencies, 0.95), 3),
+        "failed": failed,
+        "unparsed": unparsed,
+        "requeued": engine.requeued,
+        "deduplicated": engine.deduplicated,
+        "api_calls": stats["chat_requests"],
+        "throttled": stats["chat_throttled"],
+        "server_errors": stats["chat_errors"],
+        "maven_calls": stats["search_requests"],
+        "tokens": stats["prompt_tokens"] + stats["completion_tokens"],
+    }
+
+
+def scenario_key(row: dict) -> str:
+    return f"size={row['size']} workers={row['workers']} batch={row['batch_size']} cache={row['cache']}"
+
+
+def _int_list(value: str) -> List[int]:
+    return [int(part) for part in value.split(",") if part.strip()]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="benchmarks.run_benchmark", description="LibGuard 처리량 벤치마크 (모의 서버)")
+    parser.add_argument("--sizes", type=_int_list, default=[10, 100, 1000], help="카탈로그 크기 목록 (최대 5000 권장)")
+    parser.add_argument("--workers", type=_int_list, default=[1, 4, 8], help="동시 분석 수 목록")
+    parser.add_argument("--batch-size", type=_int_list, default=[1, 4], help="요청당 라이브러리 수 목록")
+    parser.add_argument(
+        "--cache", default="cold,warm",
+        help="cold = 빈 캐시, warm = 같은 카탈로그를 한 번 분석한 캐시, none = 캐시 없음 (쉼표로 여러 개)"
+    )
+    parser.add_argument("--stream", action="store_true", help="스트리밍 응답으로 분석")
+    parser.add_argument("--latency", type=float, default=0.05, help="OpenAI 응답 지연 (초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="응답 지연에 더할 무작위 지연 최대값 (초)")
+    parser.add_argument("--maven-latency", type=float, default=0.01, help="Maven 검색 응답 지연 (초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="5xx 오류 비율 (0 ~ 1)")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="무작위 429 비율 (0 ~ 1)")
+    parser.add_argument("--malformed-rate", type=float, default=0.0, help="어긋난 JSON 응답 비율 (0 ~ 1)")
+    parser.add_argument("--rpm", type=int, default=0, help="모의 서버의 분당 요청 한도 (0 = 없음)")
+    parser.add_argument("--tpm", type=int, default=0, help="모의 서버의 분당 토큰 한도 (0 = 없음)")
+    parser.add_argument("--seed", type=int, default=1, help="오류/429 주입 난수 시드")
+    parser.add_argument("-o", "--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON (같은 시나리오의 처리량이 떨어지면 실패)")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="허용하는 처리량 감소 비율")
+    return parser
+
+
+def compare_with_baseline(rows: List[dict], baseline_path: str, tolerance: float) -> List[str]:
+    """기준 결과보다 처리량이 tolerance 이상 떨어진 시나리오 목록"""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline: Dict[str, dict] = {scenario_key(row): row for row in json.load(f)["results"]}
+
+    regressions = []
+    for row in rows:
+        previous = baseline.get(scenario_key(row))
+        if previous and row["libraries_per_second"] < previous["libraries_per_second"] * (1 - tolerance):
+            regressions.append(
+                f"{scenario_key(row)}: {previous['libraries_per_second']} → {row['libraries_per_second']} lib/s"
+            )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    cache_modes = [mode.strip() for mode in args.cache.split(",") if mode.strip()]
+    unknown = [mode for mode in cache_modes if mode not in CACHE_MODES]
+    if unknown:
+        print(f"❌ 알 수 없는 캐시 모드: {', '.join(unknown)} (가능: {', '.join(CACHE_MODES)})", file=sys.stderr)
+        return 2
+
+    config = MockConfig(
+        latency=args.latency,
+        latency_jitter=args.jitter,
+        maven_latency=args.maven_latency,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        malformed_rate=args.malformed_rate,
+        requests_per_minute=args.rpm or None,
+        tokens_per_minute=args.tpm or None,
+        seed=args.seed,
+    )
+    configure_http(pool_size=max(10, max(args.workers)), backoff_base=0.05, backoff_max=1.0)
+
+    header = f"{'size':>6} {'workers':>7} {'batch':>5} {'cache':>5} {'lib/s':>9} {'p50':>7} {'p95':>7} " \
+             f"{'calls':>6} {'429':>5} {'maven':>6} {'tokens':>9} {'failed':>6}"
+    print(header, file=sys.stderr)
+
+    rows = []
+    with MockUpstream(config) as upstream, tempfile.TemporaryDirectory(prefix="libguard-bench-") as work_dir:
+        for size, workers, batch_size, cache_mode in itertools.product(
+            args.sizes, args.workers, args.batch_size, cache_modes
+        ):
+            catalog = make_catalog(size)
+            cache = None if cache_mode == "none" else ResultCache(":memory:")
+            if cache_mode == "warm":
+                run_scenario(upstream, catalog, workers, batch_size, cache, work_dir, args.stream)
+
+            row = {"size": size, "workers": workers, "batch_size": batch_size, "cache": cache_mode}
+            row.update(run_scenario(upstream, catalog, workers, batch_size, cache, work_dir, args.stream))
+            rows.append(row)
+            print(
+                f"{size:>6} {workers:>7} {batch_size:>5} {cache_mode:>5} {row['libraries_per_second']:>9} "
+                f"{row['p50_seconds']:>7} {row['p95_seconds']:>7} {row['api_calls']:>6} {row['throttled']:>5} "
+                f"{row['maven_calls']:>6} {row['tokens']:>9} {row['failed']:>6}",
+                file=sys.stderr,
+            )
+
+    output = {"generated_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"), "config": vars(config), "results": rows}
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(output, f, ensure_ascii=False, indent=2)
+
+    if args.baseline:
+        regressions = compare_with_baseline(rows, args.baseline, args.tolerance)
+        for regression in regressions:
+            print(f"❌ 성능 저하: {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,22 @@
+"""LibGuard 분석 엔진 패키지 (streamlit 의존성 없음)"""
+
+from libguard.analyzer import LibraryInfo, StableLibraryAnalyzer
+from libguard.cache import ResultCache
+from libguard.catalog import CatalogEntry, VersionCatalog, parse_catalog
+from libguard.engine import AnalysisEngine
+from libguard.knowledge import KnowledgeBase
+from libguard.versions import ComparableVersion, classify_update, compare_versions
+
+__all__ = [
+    "AnalysisEngine",
+    "CatalogEntry",
+    "ComparableVersion",
+    "KnowledgeBase",
+    "LibraryInfo",
+    "ResultCache",
+    "StableLibraryAnalyzer",
+    "VersionCatalog",
+    "classify_update",
+    "compare_versions",
+    "parse_catalog",
+]
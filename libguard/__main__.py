@@ -0,0 +1,6 @@
+# python -m libguard 진입점
+import sys
+
+from libguard.cli import main
+
+sys.exit(main())
@@ -0,0 +1,850 @@
+# 라이브러리 분석기
+# Maven Central 조회 → 버전 비교 → 기본 정보 → OpenAI 분석 순서로 라이브러리 하나(또는 묶음)를 분석한다.
+# streamlit 에 의존하지 않으므로 웹 앱과 CLI 가 함께 사용한다.
+
+import os
+import time
+from contextlib import nullcontext
+from dataclasses import dataclass, asdict, field, replace
+from typing import Callable, Dict, List, Optional, Tuple
+
+from libguard.cache import ResultCache
+from libguard.catalog import VersionCatalog, parse_catalog
+from libguard.http_pool import MAVEN, OPENAI, request_with_retry
+from libguard.knowledge import KnowledgeBase, get_knowledge_base
+from libguard.metadata import MetadataFetcher, VersionIndex
+from libguard.metrics import STAGE_CACHE, STAGE_KNOWLEDGE, STAGE_LLM, STAGE_MAVEN, STAGE_SECURITY, RunMetrics
+from libguard.ratelimit import AdaptiveRateLimiter, RateLimitExceeded, parse_retry_after
+from libguard.singleflight import SingleFlight
+from libguard.streaming import (
+    BATCH_ITEM_DEPTH, SINGLE_ITEM_DEPTH, JsonItemScanner, PartialResult,
+    iter_content_deltas, partial_string_field,
+)
+from libguard.structured import (
+    ANALYSIS_SCHEMA, BATCH_SCHEMA, normalize_analysis, parse_analysis, parse_batch, response_format,
+)
+from libguard.versions import PATCH, UNKNOWN, UP_TO_DATE, classify_update
+from libguard.vulnerabilities import VulnerabilityIndex, get_vulnerability_index, security_fields
+
+OPENAI_MODEL = "gpt-3.5-turbo"
+OPENAI_CHAT_URL = "https://api.openai.com/v1/chat/completions"
+
+MAVEN_SEARCH_URL = "https://search.maven.org/solrsearch/select"
+# 한 번의 OR 쿼리에 묶을 좌표 수 (URL 길이 제한 고려)
+MAVEN_BATCH_SIZE = 40
+MAVEN_PAGE_SIZE = 100
+
+# 지시문은 시스템 프롬프트에 한 번만 두고, 사용자 프롬프트에는 라이브러리 정보만 짧게 넣는다
+ANALYSIS_SYSTEM_PROMPT = """안드로이드 라이브러리 업데이트 전문가로서 JSON 으로만 답하세요.
+- priority: 높음/중간/낮음 (보안 패치 > 버그 수정 > 새 기능 > 문서)
+- recommendation: 업데이트 권장/검토 필요/선택사항 (patch = 핫픽스는 권장, major 는 검토 필요)
+- summary: 주요 변경사항과 권장사항을 한국어 2~4문장으로
+- latest_version: 알려진 최신 버전 (모르면 빈 문자열)
+- 업데이트 유형은 버전 비교로 이미 계산된 값입니다"""
+
+ANALYSIS_PROMPT_TEMPLATE = """라이브러리: {lib_name}
+현재 버전: {current_version} ({update_type})
+{maven_info}
+{lib_info}
+형식: {{"latest_version": "", "priority": "", "summary": "", "recommendation": ""}}"""
+
+# 단독 분석 응답 토큰 한도 (요약 2~4문장 + JSON)
+SINGLE_MAX_TOKENS = 400
+
+# 묶음 분석: 지시문은 한 번만 보내고 라이브러리 목록을 이어 붙인다
+BATCH_MAX_LIBRARIES = 8
+BATCH_MAX_PROMPT_TOKENS = 3000
+BATCH_TOKENS_PER_LIBRARY = 300
+BATCH_MAX_COMPLETION_TOKENS = 3000
+
+BATCH_PROMPT_TEMPLATE = """라이브러리 {count}개를 빠짐없이 분석하세요 (name 은 ### 뒤 이름 그대로).
+
+{entries}
+형식: {{"results": [{{"name": "", "latest_version": "", "priority": "", "summary": "", "recommendation": ""}}]}}"""
+
+BATCH_ENTRY_TEMPLATE = """### {lib_name}
+현재 버전: {current_version} ({update_type})
+{maven_info}
+{lib_info}
+"""
+
+
+# 분석 실패 결과의 summary 접두어
+FAILURE_PREFIXES = ("API 호출 실패", "네트워크 오류", "분석 중 예외 발생", "AI 분석 결과:")
+# 예산 밖이라 AI 없이 로컬 판단만 한 결과의 summary 접두어
+ESTIMATED_PREFIX = "AI 분석 생략"
+
+# 프로세스 전체에서 같은 (모델, 좌표, 버전) 분석은 한 번만 실행 중이도록 병합
+ANALYSIS_FLIGHTS = SingleFlight()
+MAVEN_FLIGHTS = SingleFlight()
+
+
+def estimate_tokens(text: str) -> int:
+    """대략적인 토큰 수 추정 (영문 약 4자당 1토큰, 한글 등은 1자당 1토큰)"""
+    ascii_chars = sum(1 for c in text if ord(c) < 128)
+    return ascii_chars // 4 + (len(text) - ascii_chars) + 1
+
+
+@dataclass
+class LibraryInfo:
+    name: str
+    current_version: str
+    latest_version: str = ""
+    is_hotfix: bool = False
+    priority: str = "low"
+    summary: str = ""
+    recommendation: str = ""
+    update_type: str = ""
+    advisories: List[str] = field(default_factory=list)
+
+    @property
+    def is_high_priority(self) -> bool:
+        return "높음" in str(self.priority)
+
+    @property
+    def is_failed(self) -> bool:
+        """분석 실패 결과인지 (재사용하지 말고 다음 실행에서 다시 분석)"""
+        return self.summary.startswith(FAILURE_PREFIXES)
+
+    @property
+    def is_estimated(self) -> bool:
+        """AI 없이 로컬 판단만 한 결과인지 (예산이 허락하는 다음 실행에서 다시 분석)"""
+        return self.summary.startswith(ESTIMATED_PREFIX)
+
+
+class StableLibraryAnalyzer:
+    def __init__(
+        self,
+        openai_api_key: str,
+        cache: Optional[ResultCache] = None,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
+        stream_listener: Optional[Callable[[PartialResult], None]] = None,
+        knowledge_base: Optional[KnowledgeBase] = None,
+        vulnerability_index: Optional[VulnerabilityIndex] = None,
+        metrics: Optional[RunMetrics] = None,
+        version_history: Optional[MetadataFetcher] = None
+    ):
+        """안정적인 라이브러리 분석기 (직접 HTTP 요청 사용)
+
+        cache 를 주면 같은 (라이브러리, 버전, 모델, 프롬프트) 분석 결과를 재사용한다.
+        rate_limiter 를 주면 OpenAI 응답 헤더로 학습한 한도에 맞춰 호출 속도를 조절한다.
+        stream_listener 를 주면 응답을 스트리밍으로 받으며 PartialResult 를 분석 스레드에서 전달한다.
+        knowledge_base 를 주지 않으면 프로세스 공용 로컬 지식 베이스를 사용한다.
+        오프라인 취약점 색인(vulnerability_index, 기본: 공용 색인)이 있으면 우선순위와 핫픽스 여부는
+        색인으로 정하고 AI 응답은 요약에만 사용한다.
+        metrics 를 주면 단계별 소요 시간, HTTP 호출, 토큰 사용량, 캐시 적중을 기록한다.
+        version_history 를 주면 maven-metadata.xml 릴리스 이력(뒤처진 릴리스 수, 현재 라인의 최신 패치)을
+        프롬프트와 예산 밖 결과에 넣는다.
+        """
+        self.api_key = openai_api_key
+        # 벤치마크용 모의 서버나 프록시를 쓸 때 환경 변수로 주소를 바꿀 수 있다
+        self.base_url = os.getenv("LIBGUARD_OPENAI_URL", OPENAI_CHAT_URL)
+        self.maven_search_url = os.getenv("LIBGUARD_MAVEN_SEARCH_URL", MAVEN_SEARCH_URL)
+        self.model = OPENAI_MODEL
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.stream_listener = stream_listener
+        self.knowledge_base = knowledge_base or get_knowledge_base()
+        self.vulnerability_index = vulnerability_index or get_vulnerability_index()
+        self.metrics = metrics
+        self.version_history = version_history
+
+    def _stage(self, name: str):
+        """계측 중이면 단계 소요 시간을 재는 with 블록"""
+        return self.metrics.stage(name) if self.metrics is not None else nullcontext()
+
+    def _request(self, upstream: str, method: str, url: str, **kwargs):
+        """request_with_retry + 업스트림별 응답 시간/상태 기록 (스트리밍이면 헤더 도착까지)"""
+        if self.metrics is None:
+            return request_with_retry(upstream, method, url, **kwargs)
+
+        started = time.perf_counter()
+        status = "error"
+        try:
+            response = request_with_retry(upstream, method, url, **kwargs)
+            status = str(response.status_code)
+            return response
+        finally:
+            self.metrics.record_http(upstream, status, time.perf_counter() - started)
+
+    def call_openai_api(
+        self,
+        messages: List[dict],
+        max_tokens: int = 500,
+        on_delta: Optional[Callable[[str], None]] = None,
+        response_format: Optional[dict] = None
+    ) -> str:
+        """OpenAI API 직접 호출 (proxies 오류 방지)
+
+        호출 한도 초과(429)는 RateLimitExceeded 로 알려서 호출자가 다시 시도하게 한다.
+        on_delta 를 주면 SSE 스트리밍으로 받으면서 본문 조각마다 호출하고, 전체 본문을 반환한다.
+        (스트리밍 중 timeout 은 전체 응답이 아니라 조각 사이의 대기 시간에 적용된다)
+        response_format 을 주면 JSON 모드/스키마로 응답을 받는다.
+        """
+        headers = {
+            'Authorization': f'Bearer {self.api_key}',
+            'Content-Type': 'application/json',
+        }
+
+        data = {
+            'model': self.model,
+            'messages': messages,
+            'max_tokens': max_tokens,
+            'temperature': 0.1
+        }
+        if response_format is not None:
+            data['response_format'] = response_format
+        stream = on_delta is not None
+        if stream:
+            data['stream'] = True
+            # 마지막 조각으로 usage 를 받아 토큰 사용량을 기록한다
+            data['stream_options'] = {'include_usage': True}
+
+        try:
+            if self.rate_limiter is not None:
+                prompt_tokens = sum(estimate_tokens(m.get('content', '')) for m in messages)
+                self.rate_limiter.acquire(prompt_tokens + max_tokens)
+
+            response = self._request(
+                OPENAI,
+                'POST',
+                self.base_url,
+                headers=headers,
+                json=data,
+                timeout=(10, 30) if stream else 30,
+                stream=stream
+            )
+
+            if self.rate_limiter is not None:
+                self.rate_limiter.update_from_headers(response.headers)
+
+            if response.status_code == 429 and not self._is_quota_exhausted(response):
+                retry_after = parse_retry_after(response.headers)
+                if self.rate_limiter is not None:
+                    retry_after = self.rate_limiter.on_throttled(retry_after)
+                raise RateLimitExceeded(retry_after or 5.0)
+
+            if response.status_code == 200:
+                if stream:
+                    return self._read_stream(response, on_delta, self._record_usage)
+                result = response.json()
+                self._record_usage(result.get('usage'))
+                return result['choices'][0]['message']['content']
+            else:
+                return f"API 호출 실패: {response.status_code} - {response.text}"
+
+        except RateLimitExceeded:
+            raise
+        except Exception as e:
+            return f"네트워크 오류: {str(e)}"
+
+    def _record_usage(self, usage: Optional[dict]):
+        if self.metrics is not None:
+            self.metrics.record_usage(usage)
+
+    @staticmethod
+    def _read_stream(
+        response,
+        on_delta: Callable[[str], None],
+        on_usage: Optional[Callable[[Optional[dict]], None]] = None
+    ) -> str:
+        """스트리밍 응답을 끝까지 읽으며 조각마다 on_delta 호출 (usage 는 끝난 뒤 on_usage 로 한 번)"""
+        parts = []
+        usage: List[dict] = []
+        try:
+            # chunk_size=None: 버퍼가 찰 때까지 기다리지 않고 도착하는 대로 읽는다
+            for delta in iter_content_deltas(response.iter_lines(chunk_size=None), on_usage=usage.append):
+                parts.append(delta)
+                on_delta(delta)
+        finally:
+            response.close()
+            if on_usage is not None:
+                on_usage(usage[-1] if usage else None)
+        return "".join(parts)
+
+    @staticmethod
+    def _is_quota_exhausted(response) -> bool:
+        """429 중 재시도해도 소용없는 경우 (결제 한도 소진)"""
+        try:
+            return response.json().get('error', {}).get('code') == 'insufficient_quota'
+        except Exception:
+            return False
+
+    @staticmethod
+    def _coordinate_query(coordinate: str) -> str:
+        """group:name 좌표를 정확히 일치하는 Solr 쿼리로 변환"""
+        group, artifact = coordinate.split(':', 1)
+        return f'(g:"{group}" AND a:"{artifact}")'
+
+    def lookup_latest_versions(self, coordinates: List[str]) -> Dict[str, str]:
+        """여러 group:name 좌표의 최신 버전을 묶음 쿼리로 한 번에 조회
+
+        찾지 못한 좌표는 빈 문자열로 채워서 반환한다. 네트워크 오류는 호출자에게 전달된다.
+        """
+        unique = sorted({c for c in coordinates if c and ':' in c})
+        latest_versions = {coordinate: "" for coordinate in unique}
+
+        for i in range(0, len(unique), MAVEN_BATCH_SIZE):
+            chunk = unique[i:i + MAVEN_BATCH_SIZE]
+            query = " OR ".join(self._coordinate_query(c) for c in chunk)
+            start = 0
+
+            while True:
+                params = {
+                    'q': query,
+                    'rows': MAVEN_PAGE_SIZE,
+                    'start': start,
+                    'wt': 'json'
+                }
+                with self._stage(STAGE_MAVEN):
+                    response = self._request(MAVEN, 'GET', self.maven_search_url, params=params, timeout=10)
+                    response.raise_for_status()
+                    body = response.json().get('response', {})
+
+                docs = body.get('docs', [])
+                for doc in docs:
+                    coordinate = f"{doc.get('g', '')}:{doc.get('a', '')}"
+                    if coordinate in latest_versions:
+                        latest_versions[coordinate] = doc.get('latestVersion') or doc.get('v', '')
+
+                start += len(docs)
+                if not docs or start >= body.get('numFound', 0):
+                    break
+
+        return latest_versions
+
+    def search_maven_central(self, library_name: str) -> str:
+        """Maven Central에서 라이브러리 정보 검색 (group:name 이면 정확히 일치하는 항목만)"""
+        try:
+            query = self._coordinate_query(library_name) if ':' in library_name else library_name
+            params = {
+                'q': query,
+                'rows': 3,
+                'wt': 'json'
+            }
+
+            with self._stage(STAGE_MAVEN):
+                response = self._request(MAVEN, 'GET', self.maven_search_url, params=params, timeout=10)
+                response.raise_for_status()
+                data = response.json()
+
+            docs = data.get('response', {}).get('docs', [])
+
+            if not docs:
+                return f"'{library_name}'에 대한 검색 결과가 없습니다."
+
+            results = []
+            for doc in docs[:2]:
+                artifact = f"{doc.get('g', 'unknown')}:{doc.get('a', 'unknown')}"
+                latest_version = doc.get('latestVersion', 'unknown')
+                results.append(f"- {artifact}: {latest_version}")
+
+            return "Maven Central 검색 결과:\n" + "\n".join(results)
+
+        except Exception as e:
+            return f"Maven Central 검색 중 오류: {str(e)}"
+
+    def get_library_info(self, library_name: str, current_version: str, coordinate: str = "") -> str:
+        """라이브러리 기본 정보 제공 (로컬 지식 베이스에서 좌표/별칭이 정확히 일치하는 항목)"""
+        entry = self.knowledge_base.lookup(coordinate, library_name)
+        if entry is not None:
+            return entry.describe()
+
+        return f"{library_name}에 대한 기본 정보를 분석 중..."
+
+    def _prepare_analysis(
+        self,
+        lib_name: str,
+        current_version: str,
+        coordinate: str = "",
+        latest_version: Optional[str] = None
+    ) -> Tuple[Optional[LibraryInfo], Optional[dict]]:
+        """AI 호출 전 단계 (Maven 정보 → 버전 비교 → 캐시 → 기본 정보)
+
+        AI 호출 없이 끝난 경우 (결과, None), 그렇지 않으면 (None, 분석 컨텍스트)를 반환한다.
+        """
+        with self._stage(STAGE_SECURITY):
+            advisories = self.vulnerability_index.affected(coordinate, current_version) if coordinate else []
+
+        # 1. Maven Central에서 정보 수집
+        if latest_version is None and coordinate:
+            try:
+                latest_version = MAVEN_FLIGHTS.do(
+                    coordinate, self.lookup_latest_versions, [coordinate]
+                ).get(coordinate, "")
+            except Exception:
+                latest_version = None
+
+        # 검색으로 최신 버전을 모르면 릴리스 이력에서 찾는다
+        history = None
+        if not latest_version:
+            history = self._version_history(coordinate)
+            if history is not None and history.latest():
+                latest_version = history.latest()
+
+        if latest_version:
+            maven_info = f"Maven Central 최신 버전: {latest_version}"
+        elif latest_version is not None:
+            maven_info = f"'{coordinate or lib_name}'에 대한 검색 결과가 없습니다."
+        else:
+            maven_info = self.search_maven_central(coordinate or lib_name)
+
+        # 2. 버전 비교 (최신 버전 사용 중이면 AI 호출 없이 종료)
+        update_type = classify_update(current_version, latest_version or "")
+        if update_type == UP_TO_DATE:
+            return self.apply_security(LibraryInfo(
+                name=lib_name,
+                current_version=current_version,
+                latest_version=latest_version,
+                priority="낮음",
+                summary="현재 최신 버전을 사용 중입니다.",
+                recommendation="선택사항",
+                update_type=update_type
+            ), coordinate), None
+
+        # 3. 캐시 (업스트림 최신 버전이 바뀌면 다른 키가 되어 다시 분석한다)
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self._cache_key(lib_name, current_version, coordinate, advisories, latest_version or "")
+            with self._stage(STAGE_CACHE):
+                cached = self.cache.get(cache_key)
+            if self.metrics is not None:
+                self.metrics.record_cache(cached is not None)
+            if cached is not None:
+                return self.apply_security(LibraryInfo(**cached), coordinate), None
+
+        if history is None:
+            history = self._version_history(coordinate)
+        if history is not None:
+            maven_info += "\n" + history.describe(current_version)
+
+        # 4. 기본 라이브러리 정보 수집 (+ 오프라인 색인의 보안 권고)
+        with self._stage(STAGE_KNOWLEDGE):
+            lib_info = self.get_library_info(lib_name, current_version, coordinate)
+        if advisories:
+            lib_info += "\n보안 권고 (현재 버전 영향):\n" + "\n".join(
+                f"- {advisory.describe()}: {advisory.summary}" for advisory in advisories
+            )
+
+        return None, {
+            "lib_name": lib_name,
+            "coordinate": coordinate,
+            "current_version": current_version,
+            "latest_version": latest_version,
+            "update_type": update_type,
+            "maven_info": maven_info,
+            "lib_info": lib_info,
+            "cache_key": cache_key,
+        }
+
+    def _cache_key(
+        self, lib_name: str, current_version: str, coordinate: str, advisories: list, latest_version: str = ""
+    ) -> str:
+        # 영향 권고나 업스트림 최신 버전이 바뀌면 요약도 다시 작성하도록 키에 포함
+        return ResultCache.make_key(
+            coordinate or lib_name, current_version, self.model,
+            ANALYSIS_SYSTEM_PROMPT + ANALYSIS_PROMPT_TEMPLATE + "".join(a.id for a in advisories),
+            latest_version,
+        )
+
+    def is_cached(
+        self, lib_name: str, current_version: str, coordinate: str = "", latest_version: Optional[str] = None
+    ) -> bool:
+        """AI 호출 없이 캐시로 끝날 분석인지 (스케줄러가 비용 0 으로 계산하는 용도)"""
+        if self.cache is None:
+            return False
+        advisories = self.vulnerability_index.affected(coordinate, current_version) if coordinate else []
+        return self.cache.contains(
+            self._cache_key(lib_name, current_version, coordinate, advisories, latest_version or "")
+        )
+
+    def estimated_result(
+        self,
+        lib_name: str,
+        current_version: str,
+        coordinate: str = "",
+        latest_version: Optional[str] = None
+    ) -> LibraryInfo:
+        """AI 호출 없이 버전 비교, 취약점 색인, 지식 베이스만으로 만든 결과 (예산 밖 항목용)"""
+        update_type = classify_update(current_version, latest_version or "")
+        result = LibraryInfo(
+            name=lib_name,
+            current_version=current_version,
+            latest_version=latest_version or "",
+            is_hotfix=update_type == PATCH,
+            update_type=update_type
+        )
+        fields = security_fields(
+            self.vulnerability_index.assess(coordinate, current_version, latest_version or ""), update_type
+        ) if coordinate else None
+        if fields:
+            result = replace(result, **fields)
+
+        entry = self.knowledge_base.lookup(coordinate, lib_name)
+        result.summary = f"{ESTIMATED_PREFIX}: 분석 예산 밖이라 버전 비교와 로컬 정보로만 판단했습니다."
+        history = self._version_history(coordinate) if update_type != UP_TO_DATE else None
+        if history is not None:
+            result.summary += f"\n\n{history.describe(current_version)}"
+        if entry is not None:
+            result.summary += f"\n\n{entry.describe()}"
+        return result
+
+    def _version_history(self, coordinate: str) -> Optional[VersionIndex]:
+        """maven-metadata.xml 릴리스 이력 (조회기가 없거나 저장소에 없는 좌표면 None)"""
+        if self.version_history is None or not coordinate:
+            return None
+        with self._stage(STAGE_MAVEN):
+            return self.version_history.get(coordinate)
+
+    def apply_security(self, result: LibraryInfo, coordinate: str) -> LibraryInfo:
+        """취약점 색인이 있으면 우선순위/권장사항/핫픽스 여부를 색인 판단으로 교체"""
+        if not coordinate or not self.vulnerability_index.available:
+            return result
+        assessment = self.vulnerability_index.assess(coordinate, result.current_version, result.latest_version)
+        fields = security_fields(assessment, result.update_type)
+        return replace(result, **fields) if fields else result
+
+    def _failed_result(self, context: dict, summary: str) -> LibraryInfo:
+        """AI 분석 실패 시에도 버전 비교 결과(와 취약점 색인 판단)는 유지"""
+        return self.apply_security(LibraryInfo(
+            name=context["lib_name"],
+            current_version=context["current_version"],
+            latest_version=context["latest_version"] or "",
+            is_hotfix=context["update_type"] == PATCH,
+            summary=summary,
+            update_type=context["update_type"]
+        ), context["coordinate"])
+
+    def _finish_analysis(self, context: dict, analysis_data: dict) -> LibraryInfo:
+        """검증/정리된 모델 응답(normalize_analysis)을 LibraryInfo 로 변환하고 캐시에 저장"""
+        latest_version = context["latest_version"]
+        update_type = context["update_type"]
+
+        # Maven 에서 확인한 최신 버전을 우선하고, 없을 때만 모델 답변을 비교에 사용
+        if not latest_version:
+            latest_version = str(analysis_data.get('latest_version', '') or '')
+            if update_type == UNKNOWN:
+                update_type = classify_update(context["current_version"], latest_version)
+
+        result = LibraryInfo(
+            name=context["lib_name"],
+            current_version=context["current_version"],
+            latest_version=latest_version,
+            is_hotfix=update_type == PATCH,
+            priority=analysis_data.get('priority', '중간'),
+            summary=analysis_data.get('summary', ''),
+            recommendation=analysis_data.get('recommendation', ''),
+            update_type=update_type
+        )
+        result = self.apply_security(result, context["coordinate"])
+
+        # 정상 파싱된 결과만 캐시 (오류/미파싱 결과는 다음 실행에서 다시 분석)
+        if context["cache_key"] is not None:
+            self.cache.set(context["cache_key"], asdict(result))
+
+        return result
+
+    def _analyze_prepared(self, context: dict) -> LibraryInfo:
+        """라이브러리 한 개를 단독 프롬프트로 AI 분석"""
+        messages = [
+            {
+                "role": "system",
+                "content": ANALYSIS_SYSTEM_PROMPT
+            },
+            {
+                "role": "user",
+                "content": ANALYSIS_PROMPT_TEMPLATE.format(
+                    lib_name=context["lib_name"],
+                    current_version=context["current_version"],
+                    update_type=context["update_type"],
+                    maven_info=context["maven_info"],
+                    lib_info=context["lib_info"]
+                )
+            }
+        ]
+
+        # AI API 호출
+        listener = self.stream_listener
+        on_delta = self._summary_streamer(context["lib_name"], listener) if listener else None
+        with self._stage(STAGE_LLM):
+            ai_response = self.call_openai_api(
+                messages,
+                max_tokens=SINGLE_MAX_TOKENS,
+                on_delta=on_delta,
+                response_format=response_format(self.model, ANALYSIS_SCHEMA, "library_analysis")
+            )
+
+        # 오류 체크
+        if ai_response.startswith(("API 호출 실패", "네트워크 오류")):
+            result = self._failed_result(context, ai_response)
+        else:
+            # 어긋난 JSON(설명 문장, 잘린 응답 등)은 다시 호출하지 않고 로컬에서 고친다
+            analysis_data = parse_analysis(ai_response)
+            if analysis_data is not None:
+                result = self._finish_analysis(context, analysis_data)
+            else:
+                # 고칠 수 없으면 원본 텍스트 사용
+                result = self._failed_result(context, f"AI 분석 결과:\n{ai_response}")
+
+        if listener:
+            listener(PartialResult(context["lib_name"], result.summary, done=True, result=result))
+        return result
+
+    @staticmethod
+    def _summary_streamer(lib_name: str, listener: Callable[[PartialResult], None]) -> Callable[[str], None]:
+        """단독 분석 응답 조각에서 summary 부분 문자열을 뽑아 전달하는 on_delta"""
+        scanner = JsonItemScanner(SINGLE_ITEM_DEPTH)
+
+        def on_delta(chunk: str):
+            scanner.feed(chunk)
+            summary, _ = partial_string_field(scanner.current_item, "summary")
+            if summary:
+                listener(PartialResult(lib_name, summary))
+
+        return on_delta
+
+    def failed_result(self, lib_name: str, current_version: str, reason: str) -> LibraryInfo:
+        """엔진이 재시도를 포기한 항목의 결과"""
+        return LibraryInfo(name=lib_name, current_version=current_version, summary=reason)
+
+    def _analysis_key(self, lib_name: str, current_version: str, coordinate: str = "") -> tuple:
+        """같은 작업으로 볼 기준 (별칭이 달라도 좌표와 버전이 같으면 같은 작업)"""
+        return self.model, coordinate or lib_name, current_version
+
+    def analyze_library(
+        self,
+        lib_name: str,
+        current_version: str,
+        coordinate: str = "",
+        latest_version: Optional[str] = None
+    ) -> LibraryInfo:
+        """개별 라이브러리 분석
+
+        lookup_latest_versions 로 미리 조회한 latest_version 이 있으면 Maven 검색을 생략한다.
+        (빈 문자열은 "조회했지만 없음", None 은 "아직 조회하지 않음")
+        같은 좌표/버전의 분석이 이미 진행 중이면 그 결과를 함께 받는다.
+        """
+        result = ANALYSIS_FLIGHTS.do(
+            self._analysis_key(lib_name, current_version, coordinate),
+            self._analyze_single, lib_name, current_version, coordinate, latest_version
+        )
+        return replace(result, name=lib_name)
+
+    def _analyze_single(
+        self,
+        lib_name: str,
+        current_version: str,
+        coordinate: str = "",
+        latest_version: Optional[str] = None
+    ) -> LibraryInfo:
+        try:
+            result, context = self._prepare_analysis(lib_name, current_version, coordinate, latest_version)
+            if result is not None:
+                return result
+            return self._analyze_prepared(context)
+
+        except RateLimitExceeded:
+            raise
+        except Exception as e:
+            return LibraryInfo(
+                name=lib_name,
+                current_version=current_version,
+                summary=f"분석 중 예외 발생: {str(e)}"
+            )
+
+    @staticmethod
+    def _batch_entry(context: dict) -> str:
+        return BATCH_ENTRY_TEMPLATE.format(
+            lib_name=context["lib_name"],
+            current_version=context["current_version"],
+            update_type=context["update_type"],
+            maven_info=context["maven_info"],
+            lib_info=context["lib_info"]
+        )
+
+    def _split_batches(self, contexts: List[dict]) -> List[List[dict]]:
+        """프롬프트/응답 토큰 한도에 맞게 컨텍스트를 여러 묶음으로 분할"""
+        base_tokens = estimate_tokens(ANALYSIS_SYSTEM_PROMPT + BATCH_PROMPT_TEMPLATE)
+        batches: List[List[dict]] = []
+        current: List[dict] = []
+        current_tokens = base_tokens
+
+        for context in contexts:
+            entry_tokens = estimate_tokens(self._batch_entry(context))
+            if current and (
+                len(current) >= BATCH_MAX_LIBRARIES
+                or current_tokens + entry_tokens > BATCH_MAX_PROMPT_TOKENS
+            ):
+                batches.append(current)
+                current, current_tokens = [], base_tokens
+            current.append(context)
+            current_tokens += entry_tokens
+
+        if current:
+            batches.append(current)
+        return batches
+
+    def _call_batch(self, contexts: List[dict]) -> Dict[str, LibraryInfo]:
+        """여러 라이브러리를 한 번의 요청으로 분석하고 이름 → 확정 결과 매핑을 반환
+
+        스트리밍 중이면 응답 JSON 에서 항목 하나가 닫히는 즉시 결과를 확정해서 알린다.
+        검증에 실패했거나 응답에 없는 라이브러리는 매핑에서 빠진다.
+        """
+        by_name = {context["lib_name"]: context for context in contexts}
+        finished: Dict[str, LibraryInfo] = {}
+        listener = self.stream_listener
+
+        def finish(answer):
+            answer = normalize_analysis(answer)
+            if answer is None:
+                return
+            name = answer.get('name', '')
+            if name not in by_name or name in finished:
+                return
+            finished[name] = self._finish_analysis(by_name[name], answer)
+            if listener:
+                listener(PartialResult(name, finished[name].summary, done=True, result=finished[name]))
+
+        on_delta = None
+        if listener:
+            scanner = JsonItemScanner(BATCH_ITEM_DEPTH)
+
+            def stream_delta(chunk: str):
+                for answer in scanner.feed(chunk):
+                    finish(answer)
+                name, name_closed = partial_string_field(scanner.current_item, "name")
+                summary, _ = partial_string_field(scanner.current_item, "summary")
+                if name_closed and summary and name in by_name and name not in finished:
+                    listener(PartialResult(name, summary))
+
+            on_delta = stream_delta
+
+        entries = "\n".join(self._batch_entry(context) for context in contexts)
+        messages = [
+            {
+                "role": "system",
+                "content": ANALYSIS_SYSTEM_PROMPT
+            },
+            {
+                "role": "user",
+                "content": BATCH_PROMPT_TEMPLATE.format(count=len(contexts), entries=entries)
+            }
+        ]
+
+        with self._stage(STAGE_LLM):
+            ai_response = self.call_openai_api(
+                messages,
+                max_tokens=min(BATCH_TOKENS_PER_LIBRARY * len(contexts), BATCH_MAX_COMPLETION_TOKENS),
+                on_delta=on_delta,
+                response_format=response_format(self.model, BATCH_SCHEMA, "library_batch_analysis")
+            )
+
+        # 스트리밍 중 놓친 항목(다른 모양의 응답, 잘린 응답 등)은 전체 응답을 복구해서 다시 확인
+        for item in parse_batch(ai_response):
+            finish(item)
+
+        return finished
+
+    def analyze_batch(self, items: List[Tuple[str, str, str, Optional[str]]]) -> List[LibraryInfo]:
+        """여러 라이브러리를 묶음 프롬프트로 분석 (입력 순서대로 결과 반환)
+
+        items 는 (lib_name, current_version, coordinate, latest_version) 목록이다.
+        응답 검증에 실패한 항목만 단독 프롬프트로 다시 분석한다.
+        다른 곳에서 이미 분석 중인 항목은 요청에 넣지 않고 그 결과를 기다린다.
+        """
+        results: List[Optional[LibraryInfo]] = [None] * len(items)
+        claims: Dict[tuple, tuple] = {}
+        leaders: List[int] = []
+        followers = []
+
+        for index, (lib_name, current_version, coordinate, _) in enumerate(items):
+            key = self._analysis_key(lib_name, current_version, coordinate)
+            if key in claims:
+                followers.append((index, claims[key][0]))
+                continue
+            future, is_leader = ANALYSIS_FLIGHTS.claim(key)
+            if is_leader:
+                claims[key] = (future, index)
+                leaders.append(index)
+            else:
+                followers.append((index, future))
+
+        try:
+            leader_results = self._analyze_batch_uncoalesced([items[i] for i in leaders])
+        except BaseException as e:
+            for key, (future, _) in claims.items():
+                ANALYSIS_FLIGHTS.finish(key, future, error=e)
+            raise
+
+        by_index = dict(zip(leaders, leader_results))
+        for key, (future, index) in claims.items():
+            results[index] = by_index[index]
+            ANALYSIS_FLIGHTS.finish(key, future, by_index[index])
+
+        # 내 작업을 모두 끝낸 뒤에 기다려야 서로 기다리는 교착이 생기지 않는다
+        for index, future in followers:
+            results[index] = replace(future.result(), name=items[index][0])
+
+        return results
+
+    def _analyze_batch_uncoalesced(self, items: List[Tuple[str, str, str, Optional[str]]]) -> List[LibraryInfo]:
+        results: List[Optional[LibraryInfo]] = [None] * len(items)
+        pending: List[Tuple[int, dict]] = []
+
+        for index, (lib_name, current_version, coordinate, latest_version) in enumerate(items):
+            try:
+                result, context = self._prepare_analysis(lib_name, current_version, coordinate, latest_version)
+            except Exception as e:
+                result = LibraryInfo(
+                    name=lib_name,
+                    current_version=current_version,
+                    summary=f"분석 중 예외 발생: {str(e)}"
+                )
+            if result is not None:
+                results[index] = result
+            else:
+                pending.append((index, context))
+
+        index_by_id = {id(context): index for index, context in pending}
+        retry: List[Tuple[int, dict]] = []
+
+        for batch in self._split_batches([context for _, context in pending]):
+            if len(batch) == 1:
+                retry.append((index_by_id[id(batch[0])], batch[0]))
+                continue
+
+            try:
+                finished = self._call_batch(batch)
+            except RateLimitExceeded:
+                raise
+            except Exception:
+                finished = {}
+
+            for context in batch:
+                index = index_by_id[id(context)]
+                result = finished.get(context["lib_name"])
+                if result is not None:
+                    results[index] = result
+                else:
+                    retry.append((index, context))
+
+        for index, context in retry:
+            try:
+                results[index] = self._analyze_prepared(context)
+            except RateLimitExceeded:
+                raise
+            except Exception as e:
+                results[index] = self._failed_result(context, f"분석 중 예외 발생: {str(e)}")
+
+        return results
+
+    def parse_catalog(self, toml_content: str) -> VersionCatalog:
+        """버전 카탈로그 전체 파싱 (라이브러리/플러그인/번들, version.ref 해석 포함)"""
+        try:
+            return parse_catalog(toml_content)
+        except Exception as e:
+            raise Exception(str(e))
+
+    def parse_toml_content(self, toml_content: str) -> Dict[str, str]:
+        """TOML 내용 파싱 (항목 키 → 해석된 버전)"""
+        return self.parse_catalog(toml_content).library_versions()
@@ -0,0 +1,131 @@
+# OpenAI 분석 결과 디스크 캐시
+# (라이브러리, 현재 버전, 모델, 프롬프트 템플릿 해시) 를 키로 SQLite 에 저장한다.
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "libguard")
+DEFAULT_TTL_SECONDS = 7 * 24 * 60 * 60
+DEFAULT_MAX_ENTRIES = 5000
+
+
+def default_cache_dir() -> str:
+    """로컬 데이터 디렉터리 (LIBGUARD_CACHE_DIR 환경 변수로 변경 가능)"""
+    return os.getenv("LIBGUARD_CACHE_DIR", DEFAULT_CACHE_DIR)
+
+
+def default_cache_path() -> str:
+    """캐시 DB 경로"""
+    return os.path.join(default_cache_dir(), "results.sqlite3")
+
+
+class ResultCache:
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        """TTL 및 크기 기반으로 항목을 제거하는 분석 결과 캐시
+
+        하나의 인스턴스를 여러 스레드(분석기)가 공유할 수 있다.
+        """
+        self.path = path or default_cache_path()
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS results (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+                """
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_results_accessed ON results (accessed_at)"
+            )
+
+    @staticmethod
+    def make_key(
+        library_name: str, current_version: str, model: str, prompt_template: str, latest_version: str = ""
+    ) -> str:
+        """캐시 키 생성 (프롬프트나 비교 대상 최신 버전이 바뀌면 자동으로 다른 키가 된다)"""
+        prompt_hash = hashlib.sha256(prompt_template.encode("utf-8")).hexdigest()
+        raw = "\x1f".join([library_name, current_version, model, prompt_hash, latest_version])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[dict]:
+        """캐시 조회 (만료된 항목은 없는 것으로 취급)"""
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM results WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None or now - row[1] > self.ttl_seconds:
+                if row is not None:
+                    self._conn.execute("DELETE FROM results WHERE key = ?", (key,))
+                self.misses += 1
+                return None
+
+            self._conn.execute("UPDATE results SET accessed_at = ? WHERE key = ?", (now, key))
+            self.hits += 1
+
+        return json.loads(row[0])
+
+    def contains(self, key: str) -> bool:
+        """만료되지 않은 항목이 있는지 (적중 통계와 LRU 순서는 바꾸지 않는다)"""
+        with self._lock:
+            row = self._conn.execute("SELECT created_at FROM results WHERE key = ?", (key,)).fetchone()
+        return row is not None and time.time() - row[0] <= self.ttl_seconds
+
+    def set(self, key: str, value: dict):
+        """결과 저장 후 만료/초과 항목 정리"""
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results (key, value, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value, ensure_ascii=False), now, now),
+            )
+            self._conn.execute(
+                "DELETE FROM results WHERE created_at < ?", (now - self.ttl_seconds,)
+            )
+
+            overflow = self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0] - self.max_entries
+            if overflow > 0:
+                # 가장 오래전에 사용된 항목부터 제거 (LRU)
+                self._conn.execute(
+                    "DELETE FROM results WHERE key IN "
+                    "(SELECT key FROM results ORDER BY accessed_at ASC LIMIT ?)",
+                    (overflow,),
+                )
+
+    def purge(self):
+        """캐시 전체 삭제 및 카운터 초기화"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM results")
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        """적중/실패 횟수와 저장된 항목 수"""
+        with self._lock:
+            size = self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        return {"hits": self.hits, "misses": self.misses, "size": size}
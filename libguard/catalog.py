@@ -0,0 +1,195 @@
+# Gradle 버전 카탈로그 (libs.versions.toml) 파서
+# [versions] / [libraries] / [plugins] / [bundles] 를 한 번에 읽어
+# 모든 라이브러리와 플러그인을 (group, artifact, version, alias) 로 해석한다.
+
+import os
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import tomllib as _toml_reader  # Python 3.11+ (C 가속 없이도 toml 패키지보다 훨씬 빠름)
+except ImportError:  # pragma: no cover - 구버전 파이썬
+    _toml_reader = None
+
+import toml
+
+CATALOG_SUFFIX = ".versions.toml"
+SKIPPED_DIRS = {".git", ".gradle", ".idea", "build", "node_modules"}
+
+# 리치 버전 선언에서 실제 사용 버전으로 볼 키의 우선순위
+RICH_VERSION_KEYS = ("strictly", "require", "prefer")
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    alias: str
+    group: str
+    artifact: str
+    version: str = ""
+    kind: str = "library"  # library | plugin
+    version_ref: str = ""
+
+    @property
+    def coordinate(self) -> str:
+        """group:artifact 좌표"""
+        return f"{self.group}:{self.artifact}"
+
+    @property
+    def key(self) -> str:
+        """카탈로그 안에서 유일한 이름 (Gradle 접근자와 같은 형태: okhttp, plugins.kotlin-android)"""
+        return self.alias if self.kind == "library" else f"plugins.{self.alias}"
+
+
+@dataclass
+class VersionCatalog:
+    versions: Dict[str, str] = field(default_factory=dict)
+    libraries: Dict[str, CatalogEntry] = field(default_factory=dict)
+    plugins: Dict[str, CatalogEntry] = field(default_factory=dict)
+    bundles: Dict[str, List[str]] = field(default_factory=dict)
+
+    def entries(self) -> List[CatalogEntry]:
+        """라이브러리와 플러그인 전체 (선언 순서)"""
+        return list(self.libraries.values()) + list(self.plugins.values())
+
+    def versioned_entries(self) -> List[CatalogEntry]:
+        """버전이 확정된 항목만 (BOM 관리 등 버전 없는 항목 제외)"""
+        return [entry for entry in self.entries() if entry.version]
+
+    def library_versions(self) -> Dict[str, str]:
+        """항목 키 → 버전 (분석 엔진 입력 형식)"""
+        return {entry.key: entry.version for entry in self.versioned_entries()}
+
+    def coordinates(self) -> Dict[str, str]:
+        """항목 키 → group:artifact 좌표"""
+        return {entry.key: entry.coordinate for entry in self.versioned_entries()}
+
+    def bundle_entries(self, bundle_name: str) -> List[CatalogEntry]:
+        """번들에 포함된 라이브러리 항목"""
+        return [
+            self.libraries[alias]
+            for alias in self.bundles.get(bundle_name, [])
+            if alias in self.libraries
+        ]
+
+
+def _load_toml(toml_content: str) -> dict:
+    if _toml_reader is not None:
+        return _toml_reader.loads(toml_content)
+    return toml.loads(toml_content)
+
+
+def _rich_version(value: dict) -> str:
+    """{ strictly/require/prefer = "..." } 형태의 리치 버전에서 사용할 버전 선택"""
+    for key in RICH_VERSION_KEYS:
+        if isinstance(value.get(key), str):
+            return value[key]
+    return value.get("version", "") if isinstance(value.get("version"), str) else ""
+
+
+def _resolve_version(value, versions: Dict[str, str]) -> Tuple[str, str]:
+    """항목의 version 값을 (버전, 참조 키) 로 해석"""
+    if value is None:
+        return "", ""
+    if isinstance(value, str):
+        return value, ""
+    if isinstance(value, dict):
+        ref = value.get("ref")
+        if isinstance(ref, str):
+            return versions.get(ref, ""), ref
+        return _rich_version(value), ""
+    return "", ""
+
+
+def _parse_library(alias: str, value, versions: Dict[str, str]) -> Optional[CatalogEntry]:
+    if isinstance(value, str):
+        # "group:artifact:version" 또는 "group:artifact"
+        parts = value.split(":")
+        if len(parts) < 2:
+            return None
+        return CatalogEntry(alias, parts[0], parts[1], parts[2] if len(parts) > 2 else "")
+
+    if not isinstance(value, dict):
+        return None
+
+    if "module" in value:
+        group, _, artifact = str(value["module"]).partition(":")
+    elif "group" in value and "name" in value:
+        group, artifact = str(value["group"]), str(value["name"])
+    else:
+        return None
+
+    if not group or not artifact:
+        return None
+
+    version, version_ref = _resolve_version(value.get("version"), versions)
+    return CatalogEntry(alias, group, artifact, version, "library", version_ref)
+
+
+def _parse_plugin(alias: str, value, versions: Dict[str, str]) -> Optional[CatalogEntry]:
+    if isinstance(value, str):
+        plugin_id, _, version = value.partition(":")
+        version_ref = ""
+    elif isinstance(value, dict) and "id" in value:
+        plugin_id = str(value["id"])
+        version, version_ref = _resolve_version(value.get("version"), versions)
+    else:
+        return None
+
+    if not plugin_id:
+        return None
+
+    # 플러그인은 마커 아티팩트 좌표 (id:id.gradle.plugin) 로 표현
+    return CatalogEntry(alias, plugin_id, f"{plugin_id}.gradle.plugin", version, "plugin", version_ref)
+
+
+def parse_catalog(toml_content: str) -> VersionCatalog:
+    """libs.versions.toml 내용을 VersionCatalog 로 파싱"""
+    try:
+        data = _load_toml(toml_content)
+    except Exception as e:
+        raise ValueError(f"TOML 파일 파싱 중 오류 발생: {str(e)}")
+
+    versions = {}
+    for key, value in data.get("versions", {}).items():
+        if isinstance(value, str):
+            versions[key] = value
+        elif isinstance(value, dict):
+            version = _rich_version(value)
+            if version:
+                versions[key] = version
+
+    catalog = VersionCatalog(versions=versions)
+
+    for alias, value in data.get("libraries", {}).items():
+        entry = _parse_library(alias, value, versions)
+        if entry is not None:
+            catalog.libraries[alias] = entry
+
+    for alias, value in data.get("plugins", {}).items():
+        entry = _parse_plugin(alias, value, versions)
+        if entry is not None:
+            catalog.plugins[alias] = entry
+
+    for name, aliases in data.get("bundles", {}).items():
+        if isinstance(aliases, list):
+            catalog.bundles[name] = [str(alias) for alias in aliases]
+
+    return catalog
+
+
+def find_catalogs(paths: List[str]) -> List[str]:
+    """파일 경로는 그대로, 디렉터리는 하위의 *.versions.toml 을 모두 찾는다"""
+    found = []
+    for path in paths:
+        if os.path.isfile(path):
+            found.append(os.path.abspath(path))
+            continue
+
+        for root, dirs, files in os.walk(path):
+            dirs[:] = sorted(d for d in dirs if d not in SKIPPED_DIRS)
+            for name in sorted(files):
+                if name.endswith(CATALOG_SUFFIX):
+                    found.append(os.path.abspath(os.path.join(root, name)))
+
+    # 같은 파일이 여러 인자로 들어와도 한 번만 분석
+    return list(dict.fromkeys(found))
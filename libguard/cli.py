@@ -0,0 +1,474 @@
+# LibGuard 명령줄 실행기
+# 여러 저장소의 libs.versions.toml 을 병렬로 분석하고 결과를 JSON 으로 저장한다.
+# 모든 카탈로그가 하나의 결과 캐시와 속도 제한기를 공유한다.
+# streamlit 을 import 하지 않으므로 CI 컨테이너에서도 빠르게 시작한다.
+#
+# 예) python -m libguard scan ~/repos --output libguard.json
+#     python -m libguard scan . --report libguard.sarif   # GitHub code scanning 업로드용
+#     python -m libguard scan ~/repos --metrics-prom /var/lib/node_exporter/libguard.prom
+#     python -m libguard kb-refresh maven-dump.jsonl
+#     python -m libguard osv-import all.zip
+#     python -m libguard versions com.squareup.okhttp3:okhttp:4.11.0
+#     python -m libguard deps ~/repos/app --output deps.json
+#     python -m libguard scan ~/repos/app --build-scripts
+#     python -m libguard watch ~/repos --interval 3600 --alerts alerts.jsonl
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict
+from typing import List, Optional
+
+from libguard.analyzer import OPENAI_MODEL, StableLibraryAnalyzer
+from libguard.cache import ResultCache
+from libguard.catalog import find_catalogs
+from libguard.engine import AnalysisEngine
+from libguard.gradle import scan_project
+from libguard.http_pool import configure_http
+from libguard.knowledge import refresh_knowledge_base
+from libguard.metadata import MetadataFetcher, MetadataStore
+from libguard.metrics import RunMetrics
+from libguard.ratelimit import AdaptiveRateLimiter
+from libguard.reports import REPORT_WRITERS, ReportWriter, catalog_locations, create_report_writer, report_format_for_path
+from libguard.scheduler import AnalysisBudget
+from libguard.snapshot import SnapshotStore, analyze_incremental
+from libguard.vulnerabilities import build_vulnerability_index
+from libguard.watch import (
+    DEFAULT_INTERVAL_SECONDS, DEFAULT_JITTER, CatalogTracker, ReleaseAlert, WatchCycle, WatchRegistry, Watcher
+)
+
+try:
+    from dotenv import load_dotenv
+except ImportError:  # python-dotenv 없이도 환경 변수만으로 동작
+    load_dotenv = None
+
+EXIT_OK = 0
+EXIT_HIGH_PRIORITY = 1
+EXIT_ERROR = 2
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="libguard",
+        description="LibGuard - 안드로이드 라이브러리 업데이트 분석기 (명령줄)",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    scan = subparsers.add_parser("scan", help="버전 카탈로그 일괄 분석")
+    scan.add_argument("paths", nargs="+", help="libs.versions.toml 파일 또는 검색할 디렉터리")
+    scan.add_argument("-o", "--output", help="결과 JSON 저장 경로 ('-' 이면 표준 출력)")
+    scan.add_argument("--catalog-workers", type=int, default=4, help="동시에 분석할 카탈로그 수")
+    scan.add_argument("--workers", type=int, default=4, help="카탈로그당 동시 분석 수")
+    scan.add_argument("--batch-size", type=int, default=4, help="요청당 라이브러리 수 (1 = 묶지 않음)")
+    scan.add_argument(
+        "--max-libraries", type=int, default=0,
+        help="카탈로그당 AI 분석 최대 수, 위험도 높은 순서 (0 = 제한 없음, 나머지는 로컬 판단)"
+    )
+    scan.add_argument("--budget-tokens", type=int, default=0, help="카탈로그당 AI 분석 토큰 예산 (0 = 제한 없음)")
+    scan.add_argument("--budget-usd", type=float, default=0, help="카탈로그당 AI 분석 예상 비용 예산 (0 = 제한 없음)")
+    scan.add_argument("--requests-per-minute", type=float, default=0, help="분당 최대 요청 수 (0 = 자동)")
+    scan.add_argument("--cache-path", help="결과 캐시 DB 경로")
+    scan.add_argument(
+        "--no-cache", action="store_true",
+        help="디스크 캐시를 사용하지 않음 (이번 실행 안의 중복 분석 방지용 메모리 캐시만 사용)"
+    )
+    scan.add_argument(
+        "--full", action="store_true",
+        help="지난 실행 결과를 재사용하지 않고 전체를 다시 분석"
+    )
+    scan.add_argument("--snapshot-path", help="증분 분석 스냅샷 DB 경로")
+    scan.add_argument(
+        "--report", help="완료되는 대로 결과를 쓸 리포트 파일 (.md / .jsonl / .sarif / .html)"
+    )
+    scan.add_argument(
+        "--report-format", choices=sorted(REPORT_WRITERS),
+        help="리포트 형식 (기본: --report 확장자로 판단, 모르면 markdown)"
+    )
+    scan.add_argument(
+        "--version-history", action="store_true",
+        help="maven-metadata.xml 릴리스 이력(뒤처진 릴리스 수, 현재 라인의 최신 패치)을 분석에 사용"
+    )
+    scan.add_argument("--metadata-path", help="릴리스 이력 색인 DB 경로")
+    scan.add_argument(
+        "--build-scripts", action="store_true",
+        help="디렉터리를 Gradle 프로젝트로 보고 카탈로그와 build.gradle(.kts) 의 의존성을 모두 분석"
+    )
+    scan.add_argument("--metrics-json", help="실행 계측(단계별 시간, 토큰, 예상 비용) JSON 저장 경로")
+    scan.add_argument("--metrics-prom", help="실행 계측 Prometheus 텍스트 저장 경로 (textfile 수집기용)")
+    scan.set_defaults(handler=run_scan)
+
+    kb_refresh = subparsers.add_parser("kb-refresh", help="덤프 파일(JSON Lines)로 로컬 지식 베이스 갱신")
+    kb_refresh.add_argument(
+        "dump",
+        help="한 줄에 하나씩 {coordinate, latest_version, info, aliases} 또는 Maven 검색 문서 {g, a, latestVersion}"
+    )
+    kb_refresh.add_argument("-o", "--output", help="저장 경로 (기본: 캐시 디렉터리의 knowledge_base.json)")
+    kb_refresh.add_argument(
+        "--replace", action="store_true",
+        help="현재 지식 베이스에 병합하지 않고 덤프 내용만으로 새로 만듦"
+    )
+    kb_refresh.set_defaults(handler=run_kb_refresh)
+
+    osv_import = subparsers.add_parser("osv-import", help="OSV 권고 덤프로 오프라인 취약점 색인 생성")
+    osv_import.add_argument("dump", help="OSV Maven 덤프 (all.zip, 권고 JSON 디렉터리, .json 또는 .jsonl)")
+    osv_import.add_argument("-o", "--output", help="색인 저장 경로 (기본: 캐시 디렉터리의 vulnerabilities.json)")
+    osv_import.set_defaults(handler=run_osv_import)
+
+    versions = subparsers.add_parser("versions", help="maven-metadata.xml 릴리스 이력 조회 (조건부 요청으로 갱신)")
+    versions.add_argument("coordinates", nargs="+", help="group:artifact 또는 group:artifact:현재버전")
+    versions.add_argument("--prereleases", action="store_true", help="alpha / beta / rc 등 사전 릴리스도 포함")
+    versions.add_argument("--refresh", action="store_true", help="저장된 색인이 최신이어도 저장소에 다시 확인")
+    versions.add_argument("--metadata-path", help="릴리스 이력 색인 DB 경로")
+    versions.set_defaults(handler=run_versions)
+
+    deps = subparsers.add_parser("deps", help="Gradle 프로젝트의 의존성 목록 추출 (카탈로그 + 빌드 스크립트, 모듈별)")
+    deps.add_argument("root", help="프로젝트 루트 디렉터리")
+    deps.add_argument("-o", "--output", help="결과 JSON 저장 경로 (기본: 표준 출력)")
+    deps.add_argument("--workers", type=int, default=8, help="동시에 읽을 빌드 스크립트 수")
+    deps.set_defaults(handler=run_deps)
+
+    watch = subparsers.add_parser("watch", help="업스트림 새 릴리스 감시 (새 버전이 나온 라이브러리만 분석해 알림)")
+    watch.add_argument("paths", nargs="+", help="libs.versions.toml 파일 또는 검색할 디렉터리")
+    watch.add_argument(
+        "--interval", type=float, default=DEFAULT_INTERVAL_SECONDS, help="좌표별 확인 주기 (초, 기본 1시간)"
+    )
+    watch.add_argument("--jitter", type=float, default=DEFAULT_JITTER, help="확인 시각을 퍼뜨릴 비율 (0~1)")
+    watch.add_argument("--workers", type=int, default=8, help="동시 확인/분석 수")
+    watch.add_argument("--prereleases", action="store_true", help="alpha / beta / rc 등 사전 릴리스도 알림")
+    watch.add_argument("--once", action="store_true", help="확인할 때가 된 좌표만 한 번 확인하고 종료 (cron 용)")
+    watch.add_argument("--alerts", help="알림 JSON Lines 추가 기록 경로 (기본: 표준 출력)")
+    watch.add_argument("--requests-per-minute", type=float, default=0, help="분당 최대 요청 수 (0 = 자동)")
+    watch.add_argument("--registry-path", help="감시 레지스트리 DB 경로")
+    watch.add_argument("--metadata-path", help="릴리스 이력 색인 DB 경로")
+    watch.add_argument("--cache-path", help="결과 캐시 DB 경로")
+    watch.set_defaults(handler=run_watch)
+
+    return parser
+
+
+def scan_catalog(
+    path: str,
+    analyzer: StableLibraryAnalyzer,
+    args,
+    snapshots: Optional[SnapshotStore] = None,
+    report: Optional[ReportWriter] = None,
+) -> dict:
+    """카탈로그 하나 분석 (실패해도 예외 대신 error 항목으로 기록)
+
+    snapshots 를 주면 지난 실행 이후 바뀐 항목만 다시 분석한다.
+    report 를 주면 결과가 완료되는 대로 (카탈로그 안의 선언 위치와 함께) 쓴다.
+    """
+    started = time.time()
+    try:
+        if os.path.isdir(path):
+            # --build-scripts: 프로젝트 트리 전체 (카탈로그 + 빌드 스크립트) 를 하나의 의존성 목록으로
+            catalog = scan_project(path)
+            locations = catalog.locations()
+        else:
+            with open(path, encoding="utf-8") as f:
+                toml_content = f.read()
+            catalog = analyzer.parse_catalog(toml_content)
+            locations = catalog_locations(os.path.relpath(path), toml_content)
+
+        def on_result(done: int, total: int, result):
+            if report is not None:
+                report.write(result, locations.get(result.name))
+
+        libraries = catalog.library_versions()
+        budget = AnalysisBudget(
+            tokens=args.budget_tokens or None,
+            usd=args.budget_usd or None,
+            max_libraries=args.max_libraries or None,
+            model=analyzer.model,
+        )
+        engine = AnalysisEngine(analyzer, max_workers=args.workers, batch_size=args.batch_size, budget=budget)
+        reused = 0
+        if snapshots is not None:
+            results, reused = analyze_incremental(
+                engine, snapshots, path, libraries, catalog.coordinates(), on_result=on_result
+            )
+        else:
+            results = engine.analyze_all(libraries, coordinates=catalog.coordinates(), on_result=on_result)
+    except Exception as e:
+        return {"path": path, "error": str(e), "libraries": []}
+
+    return {
+        "path": path,
+        "duration_seconds": round(time.time() - started, 3),
+        "reused": reused,
+        "skipped": engine.skipped,
+        "libraries": [asdict(result) for result in results],
+        "hotfix": sum(1 for result in results if result.is_hotfix),
+        "high_priority": sum(1 for result in results if result.is_high_priority),
+        "vulnerable": sum(1 for result in results if result.advisories),
+    }
+
+
+def run_scan(args) -> int:
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        print("❌ OPENAI_API_KEY 환경 변수가 설정되지 않았습니다.", file=sys.stderr)
+        return EXIT_ERROR
+
+    if args.build_scripts:
+        catalogs = [os.path.abspath(path) for path in args.paths if os.path.isdir(path)]
+        catalogs += find_catalogs([path for path in args.paths if not os.path.isdir(path)])
+    else:
+        catalogs = find_catalogs(args.paths)
+    if not catalogs:
+        print("❌ 분석할 버전 카탈로그(*.versions.toml)를 찾지 못했습니다.", file=sys.stderr)
+        return EXIT_ERROR
+
+    catalog_workers = max(1, args.catalog_workers)
+    configure_http(pool_size=max(10, catalog_workers * max(1, args.workers)))
+
+    # 여러 저장소가 같은 좌표/버전을 쓰는 경우가 많으므로 캐시는 항상 둔다
+    cache = ResultCache(":memory:") if args.no_cache else ResultCache(args.cache_path)
+    rate_limiter = AdaptiveRateLimiter(args.requests_per_minute or None)
+    metrics = RunMetrics(model=OPENAI_MODEL)
+    version_history = (
+        MetadataFetcher(MetadataStore(args.metadata_path), metrics=metrics) if args.version_history else None
+    )
+    analyzer = StableLibraryAnalyzer(
+        api_key, cache=cache, rate_limiter=rate_limiter, metrics=metrics, version_history=version_history
+    )
+    snapshots = None if args.full else SnapshotStore(args.snapshot_path)
+
+    started = time.time()
+    reports = []
+    print(f"🔍 {len(catalogs)}개 카탈로그 분석 시작", file=sys.stderr)
+
+    report_file = open(args.report, "w", encoding="utf-8") if args.report else None
+    report_writer = None
+    if report_file is not None:
+        report_format = args.report_format or report_format_for_path(args.report)
+        report_writer = create_report_writer(report_format, report_file, analyzed_at=started)
+        report_writer.begin()
+
+    with ThreadPoolExecutor(max_workers=catalog_workers, thread_name_prefix="libguard-catalog") as pool:
+        futures = [pool.submit(scan_catalog, path, analyzer, args, snapshots, report_writer) for path in catalogs]
+        for done, future in enumerate(as_completed(futures), 1):
+            report = future.result()
+            reports.append(report)
+            if report.get("error"):
+                status = f"❌ {report['error']}"
+            else:
+                status = (
+                    f"{len(report['libraries'])}개 분석 (재사용 {report['reused']}, 예산 밖 {report['skipped']}), "
+                    f"핫픽스 {report['hotfix']}, 높은 우선순위 {report['high_priority']}"
+                )
+            print(f"[{done}/{len(catalogs)}] {report['path']}: {status}", file=sys.stderr)
+
+    if report_writer is not None:
+        report_writer.close()
+        report_file.close()
+
+    reports.sort(key=lambda report: report["path"])
+    metrics.finish(sum(len(report["libraries"]) for report in reports))
+    summary = {
+        "catalogs": len(reports),
+        "failed_catalogs": sum(1 for report in reports if report.get("error")),
+        "libraries": sum(len(report["libraries"]) for report in reports),
+        "reused": sum(report.get("reused", 0) for report in reports),
+        "skipped": sum(report.get("skipped", 0) for report in reports),
+        "hotfix": sum(report.get("hotfix", 0) for report in reports),
+        "high_priority": sum(report.get("high_priority", 0) for report in reports),
+        "vulnerable": sum(report.get("vulnerable", 0) for report in reports),
+        "duration_seconds": round(time.time() - started, 3),
+        "cache": cache.stats(),
+        "metrics": metrics.snapshot(),
+    }
+
+    output = {
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "summary": summary,
+        "catalogs": reports,
+    }
+
+    if args.output == "-":
+        json.dump(output, sys.stdout, ensure_ascii=False, indent=2)
+        sys.stdout.write("\n")
+    elif args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(output, f, ensure_ascii=False, indent=2)
+
+    write_metrics(metrics, args.metrics_json, args.metrics_prom)
+    cost = summary["metrics"]["estimated_cost_usd"]
+    print(
+        f"✅ 완료: 라이브러리 {summary['libraries']}개, 핫픽스 {summary['hotfix']}개, "
+        f"높은 우선순위 {summary['high_priority']}개 ({summary['duration_seconds']}초, "
+        f"토큰 {metrics.prompt_tokens + metrics.completion_tokens}"
+        + (f", 예상 비용 ${cost:.4f})" if cost is not None else ")"),
+        file=sys.stderr,
+    )
+
+    if summary["failed_catalogs"]:
+        return EXIT_ERROR
+    return EXIT_HIGH_PRIORITY if summary["high_priority"] else EXIT_OK
+
+
+def write_metrics(metrics: RunMetrics, json_path: Optional[str], prom_path: Optional[str]):
+    """계측 파일 저장 (Prometheus 파일은 수집기가 반쯤 쓴 파일을 읽지 않도록 교체 방식으로 쓴다)"""
+    if json_path:
+        with open(json_path, "w", encoding="utf-8") as f:
+            f.write(metrics.to_json() + "\n")
+    if prom_path:
+        temp_path = f"{prom_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(metrics.to_prometheus())
+        os.replace(temp_path, prom_path)
+
+
+def run_kb_refresh(args) -> int:
+    try:
+        path, merged, total = refresh_knowledge_base(args.dump, args.output, replace=args.replace)
+    except (OSError, ValueError) as e:
+        print(f"❌ 지식 베이스 갱신 실패: {e}", file=sys.stderr)
+        return EXIT_ERROR
+
+    print(f"✅ {merged}개 항목 반영, 전체 {total}개 → {path}", file=sys.stderr)
+    return EXIT_OK
+
+
+def run_osv_import(args) -> int:
+    try:
+        path, advisories, coordinates = build_vulnerability_index(args.dump, args.output)
+    except (OSError, ValueError) as e:
+        print(f"❌ 취약점 색인 생성 실패: {e}", file=sys.stderr)
+        return EXIT_ERROR
+
+    print(f"✅ 권고 {advisories}개, 좌표 {coordinates}개 → {path}", file=sys.stderr)
+    return EXIT_OK
+
+
+def run_versions(args) -> int:
+    fetcher = MetadataFetcher(MetadataStore(args.metadata_path))
+    output = []
+    failed = False
+    for argument in args.coordinates:
+        group, _, rest = argument.partition(":")
+        artifact, _, current = rest.partition(":")
+        coordinate = f"{group}:{artifact}"
+        if not group or not artifact:
+            print(f"❌ 좌표 형식 오류 (group:artifact[:version]): {argument}", file=sys.stderr)
+            failed = True
+            continue
+        try:
+            fetched = fetcher.refresh(coordinate, force=args.refresh)
+        except Exception as e:
+            print(f"❌ {coordinate}: {e}", file=sys.stderr)
+            failed = True
+            continue
+
+        index = fetched.index
+        item = {"coordinate": coordinate, "status": fetched.status}
+        if index is not None:
+            item.update({
+                "latest": index.latest(args.prereleases),
+                "release": index.release,
+                "versions": len(index),
+            })
+            if current:
+                item.update({
+                    "current": current,
+                    "releases_behind": index.releases_behind(current),
+                    "latest_patch": index.latest_patch(current),
+                    "newer": index.between(current, include_prereleases=args.prereleases),
+                })
+        output.append(item)
+
+    json.dump(output, sys.stdout, ensure_ascii=False, indent=2)
+    sys.stdout.write("\n")
+    return EXIT_ERROR if failed else EXIT_OK
+
+
+def run_deps(args) -> int:
+    if not os.path.isdir(args.root):
+        print(f"❌ 디렉터리가 아닙니다: {args.root}", file=sys.stderr)
+        return EXIT_ERROR
+
+    project = scan_project(args.root, max_workers=args.workers)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(project.to_dict(), f, ensure_ascii=False, indent=2)
+    else:
+        json.dump(project.to_dict(), sys.stdout, ensure_ascii=False, indent=2)
+        sys.stdout.write("\n")
+
+    for path, error in project.errors.items():
+        print(f"⚠️ {path}: {error}", file=sys.stderr)
+    print(
+        f"✅ 모듈 {len(project.modules)}개, 파일 {project.files}개에서 의존성 {len(project.dependencies)}개 "
+        f"(버전 미확정 참조 {len(project.unresolved)}개, {project.duration_seconds}초)",
+        file=sys.stderr,
+    )
+    return EXIT_ERROR if project.errors else EXIT_OK
+
+
+def run_watch(args) -> int:
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        print("❌ OPENAI_API_KEY 환경 변수가 설정되지 않았습니다.", file=sys.stderr)
+        return EXIT_ERROR
+
+    tracker = CatalogTracker(args.paths)
+    if not tracker.entries():
+        print("❌ 감시할 버전 카탈로그(*.versions.toml)를 찾지 못했습니다.", file=sys.stderr)
+        return EXIT_ERROR
+
+    configure_http(pool_size=max(10, args.workers))
+    fetcher = MetadataFetcher(MetadataStore(args.metadata_path))
+    analyzer = StableLibraryAnalyzer(
+        api_key,
+        cache=ResultCache(args.cache_path),
+        rate_limiter=AdaptiveRateLimiter(args.requests_per_minute or None),
+        version_history=fetcher,
+    )
+    alerts_file = open(args.alerts, "a", encoding="utf-8") if args.alerts else sys.stdout
+
+    def on_alert(alert: ReleaseAlert):
+        alerts_file.write(json.dumps(alert.to_dict(), ensure_ascii=False) + "\n")
+        alerts_file.flush()
+
+    def on_cycle(cycle: WatchCycle):
+        if not cycle.checked and not cycle.added and not cycle.removed:
+            return
+        print(
+            f"[{time.strftime('%H:%M:%S')}] 감시 {cycle.tracked}개 (추가 {cycle.added}, 제거 {cycle.removed}), "
+            f"확인 {cycle.checked}개: 변경 없음 {cycle.unchanged}, 새 릴리스 {len(cycle.alerts)}, "
+            f"실패 {cycle.failed}, 분석 {cycle.analyzed}",
+            file=sys.stderr,
+        )
+        for path, error in tracker.errors.items():
+            print(f"⚠️ {path}: {error}", file=sys.stderr)
+        for coordinate, error in cycle.errors.items():
+            print(f"⚠️ {coordinate}: {error} (다음 확인 때 다시 시도)", file=sys.stderr)
+
+    watcher = Watcher(
+        analyzer, fetcher, WatchRegistry(args.registry_path), tracker,
+        interval=args.interval, jitter=args.jitter, max_workers=args.workers,
+        include_prereleases=args.prereleases, on_alert=on_alert,
+    )
+    try:
+        if args.once:
+            on_cycle(watcher.poll_once())
+        else:
+            print(f"👀 {len(watcher.registry)}개 좌표 감시 중 (Ctrl+C 로 종료)", file=sys.stderr)
+            watcher.run(on_cycle=on_cycle)
+    except KeyboardInterrupt:
+        print("감시를 종료합니다.", file=sys.stderr)
+    finally:
+        if alerts_file is not sys.stdout:
+            alerts_file.close()
+    return EXIT_OK
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    if load_dotenv is not None:
+        load_dotenv()
+
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
@@ -0,0 +1,273 @@
+# 병렬 분석 엔진
+# 라이브러리별 분석(Maven 조회 → 기본 정보 → AI 분석)을 스레드 풀에서 동시에 실행한다.
+# Maven Central 최신 버전은 분석 전에 한 번의 묶음 조회로 미리 가져온다.
+# 호출 한도(429)에 걸린 작업은 Retry-After 만큼 기다린 뒤 자동으로 다시 큐에 넣는다.
+# 같은 좌표/버전을 가리키는 항목(별칭만 다른 경우 등)은 한 번만 분석하고 결과를 나눠준다.
+# 스트리밍 중간 결과는 큐에 모았다가 결과를 소비하는 스레드에서 꺼내 전달한다.
+# 예산(AnalysisBudget)을 주면 위험도 높은 항목부터 분석하고 예산 밖 항목은 로컬 판단 결과로 채운다.
+
+import dataclasses
+import queue
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from libguard.ratelimit import RateLimitExceeded
+from libguard.scheduler import AnalysisBudget, SchedulePlan, plan_schedule
+
+DEFAULT_MAX_REQUEUES = 5
+# 스트리밍 중간 결과를 꺼내는 주기
+PARTIAL_POLL_SECONDS = 0.1
+
+
+class AnalysisEngine:
+    def __init__(
+        self,
+        analyzer: Any,
+        max_workers: int = 4,
+        batch_size: int = 1,
+        max_requeues: int = DEFAULT_MAX_REQUEUES,
+        budget: Optional[AnalysisBudget] = None,
+    ):
+        """제한된 동시성으로 여러 라이브러리를 분석하는 엔진
+
+        analyzer 는 analyze_library(lib_name, current_version) 메서드를 가진 객체
+        (예: StableLibraryAnalyzer)이며, 스레드 간에 공유된다.
+        batch_size 가 2 이상이고 analyzer 에 analyze_batch 가 있으면
+        여러 라이브러리를 한 번의 요청으로 묶어 분석한다.
+        RateLimitExceeded 로 실패한 작업은 최대 max_requeues 번 다시 실행한다.
+        budget 을 주고 analyzer 에 estimated_result 가 있으면 위험도 순서로 예산 안의 항목만
+        AI 로 분석하고, 나머지는 estimated_result 로 대신한다 (계획은 last_plan 에 남는다).
+        """
+        self.analyzer = analyzer
+        self.max_workers = max(1, int(max_workers))
+        self.batch_size = max(1, int(batch_size))
+        self.max_requeues = max(0, int(max_requeues))
+        self.budget = budget
+        self.requeued = 0
+        self.deduplicated = 0
+        self.skipped = 0
+        self.last_plan: Optional[SchedulePlan] = None
+
+    def prefetch_latest_versions(self, coordinates: Dict[str, str]) -> Optional[Dict[str, str]]:
+        """라이브러리 좌표들의 최신 버전을 묶음 조회 (실패하면 None → 개별 검색으로 대체)"""
+        if not coordinates or not hasattr(self.analyzer, "lookup_latest_versions"):
+            return None
+
+        try:
+            return self.analyzer.lookup_latest_versions(list(coordinates.values()))
+        except Exception:
+            return None
+
+    def _work_items(
+        self,
+        libraries: Dict[str, str],
+        coordinates: Optional[Dict[str, str]],
+        latest_versions: Optional[Dict[str, str]] = None,
+    ) -> List[Tuple[str, str, str, Optional[str]]]:
+        """(lib_name, current_version, coordinate, latest_version) 작업 목록 생성
+
+        latest_versions(좌표 → 최신 버전)를 주지 않으면 여기서 묶음 조회한다.
+        """
+        coordinates = {
+            lib_name: coordinates[lib_name]
+            for lib_name in libraries
+            if coordinates and coordinates.get(lib_name)
+        }
+        if latest_versions is None:
+            latest_versions = self.prefetch_latest_versions(coordinates)
+
+        items = []
+        for lib_name, version in libraries.items():
+            coordinate = coordinates.get(lib_name, "")
+            latest_version = None
+            if coordinate and latest_versions is not None:
+                latest_version = latest_versions.get(coordinate, "")
+            items.append((lib_name, version, coordinate, latest_version))
+        return items
+
+    def _analyze_one(self, item: Tuple[str, str, str, Optional[str]]) -> Any:
+        lib_name, version, coordinate, latest_version = item
+        if not coordinate:
+            return self.analyzer.analyze_library(lib_name, version)
+        if latest_version is None:
+            return self.analyzer.analyze_library(lib_name, version, coordinate=coordinate)
+        return self.analyzer.analyze_library(
+            lib_name, version, coordinate=coordinate, latest_version=latest_version
+        )
+
+    @staticmethod
+    def _dedupe(items: List[Tuple[str, str, str, Optional[str]]]) -> Tuple[List[int], Dict[int, List[int]]]:
+        """같은 (좌표, 버전) 작업을 합치고 (대표 인덱스 목록, 대표 → 같은 작업 인덱스들)을 반환"""
+        first_by_key: Dict[Tuple[str, str], int] = {}
+        members: Dict[int, List[int]] = {}
+        for index, (lib_name, version, coordinate, _) in enumerate(items):
+            key = (coordinate or lib_name, version)
+            primary = first_by_key.setdefault(key, index)
+            members.setdefault(primary, []).append(index)
+        return list(members), members
+
+    @staticmethod
+    def _for_member(result: Any, lib_name: str) -> Any:
+        """대표 결과를 다른 별칭 항목용으로 복사"""
+        if dataclasses.is_dataclass(result) and getattr(result, "name", lib_name) != lib_name:
+            return dataclasses.replace(result, name=lib_name)
+        return result
+
+    def _run_group(
+        self,
+        items: List[Tuple[str, str, str, Optional[str]]],
+        use_batches: bool,
+        delay: float = 0.0,
+    ) -> List[Any]:
+        if delay > 0:
+            time.sleep(delay)
+        if use_batches:
+            return self.analyzer.analyze_batch(items)
+        return [self._analyze_one(items[0])]
+
+    def _give_up(self, items: List[Tuple[str, str, str, Optional[str]]], error: Exception) -> List[Any]:
+        """재시도 한도를 넘긴 작업의 결과 (analyzer 가 failed_result 를 제공해야 함)"""
+        if not hasattr(self.analyzer, "failed_result"):
+            raise error
+        return [
+            self.analyzer.failed_result(lib_name, version, f"API 호출 실패: {error}")
+            for lib_name, version, _, _ in items
+        ]
+
+    @staticmethod
+    def _drain_partials(events: "queue.Queue", on_partial: Callable[[Any], None]):
+        """쌓인 중간 결과를 라이브러리별 최신 것만 남겨 전달 (완료 이벤트는 덮어쓰지 않는다)"""
+        latest: Dict[str, Any] = {}
+        while True:
+            try:
+                event = events.get_nowait()
+            except queue.Empty:
+                break
+            previous = latest.get(event.name)
+            if previous is None or not previous.done:
+                latest[event.name] = event
+        for event in latest.values():
+            on_partial(event)
+
+    def iter_results(
+        self,
+        libraries: Dict[str, str],
+        coordinates: Optional[Dict[str, str]] = None,
+        latest_versions: Optional[Dict[str, str]] = None,
+        on_partial: Optional[Callable[[Any], None]] = None,
+    ) -> Iterator[Tuple[int, Any]]:
+        """완료되는 순서대로 (원래 인덱스, 분석 결과)를 돌려준다
+
+        coordinates 는 라이브러리 이름 → group:name 매핑이다.
+        제너레이터는 호출한 스레드에서 소비되므로 Streamlit 위젯 갱신을
+        그대로 수행해도 안전하다.
+        on_partial 을 주고 analyzer 가 stream_listener 를 지원하면 응답을 스트리밍으로 받으며,
+        중간 결과(PartialResult)도 같은 스레드에서 on_partial 로 전달한다.
+        """
+        if not libraries:
+            return
+
+        if on_partial is None or not hasattr(self.analyzer, "stream_listener"):
+            yield from self._iter_results(libraries, coordinates, latest_versions)
+            return
+
+        events: "queue.Queue" = queue.Queue()
+        previous_listener = self.analyzer.stream_listener
+        self.analyzer.stream_listener = events.put
+        try:
+            for index, result in self._iter_results(
+                libraries, coordinates, latest_versions,
+                poll=lambda: self._drain_partials(events, on_partial),
+            ):
+                yield index, result
+            self._drain_partials(events, on_partial)
+        finally:
+            self.analyzer.stream_listener = previous_listener
+
+    def _iter_results(
+        self,
+        libraries: Dict[str, str],
+        coordinates: Optional[Dict[str, str]] = None,
+        latest_versions: Optional[Dict[str, str]] = None,
+        poll: Optional[Callable[[], None]] = None,
+    ) -> Iterator[Tuple[int, Any]]:
+        """iter_results 본체 (poll 을 주면 작업을 기다리는 동안 주기적으로 호출)"""
+
+        items = self._work_items(libraries, coordinates, latest_versions)
+        primaries, members = self._dedupe(items)
+        self.deduplicated += len(items) - len(primaries)
+
+        use_batches = self.batch_size > 1 and hasattr(self.analyzer, "analyze_batch")
+        size = self.batch_size if use_batches else 1
+
+        if self.budget is not None and self.budget.limited and hasattr(self.analyzer, "estimated_result"):
+            plan = plan_schedule(self.analyzer, [items[i] for i in primaries], self.budget, size)
+            self.last_plan = plan
+            self.skipped += sum(len(members[primaries[i]]) for i in plan.estimate)
+            for i in plan.estimate:
+                result = self.analyzer.estimated_result(*items[primaries[i]])
+                for index in members[primaries[i]]:
+                    yield index, self._for_member(result, items[index][0])
+            primaries = [primaries[i] for i in plan.analyze]
+            if not primaries:
+                return
+
+        groups = [primaries[i:i + size] for i in range(0, len(primaries), size)]
+
+        workers = min(self.max_workers, len(groups))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="libguard") as pool:
+            pending = {}
+            for group in groups:
+                group_items = [items[i] for i in group]
+                pending[pool.submit(self._run_group, group_items, use_batches)] = (group, 0)
+
+            while pending:
+                done, _ = wait(
+                    pending,
+                    timeout=PARTIAL_POLL_SECONDS if poll else None,
+                    return_when=FIRST_COMPLETED,
+                )
+                if poll:
+                    # 완료된 작업의 결과보다 그 작업의 중간 결과를 먼저 전달
+                    poll()
+                for future in done:
+                    group, attempts = pending.pop(future)
+                    group_items = [items[i] for i in group]
+                    try:
+                        outcome = future.result()
+                    except RateLimitExceeded as e:
+                        if attempts < self.max_requeues:
+                            # 다른 작업은 계속 진행하고, 이 작업만 대기 후 다시 실행
+                            self.requeued += 1
+                            retry = pool.submit(self._run_group, group_items, use_batches, e.retry_after)
+                            pending[retry] = (group, attempts + 1)
+                            continue
+                        outcome = self._give_up(group_items, e)
+
+                    for primary, result in zip(group, outcome):
+                        for index in members[primary]:
+                            yield index, self._for_member(result, items[index][0])
+
+    def analyze_all(
+        self,
+        libraries: Dict[str, str],
+        coordinates: Optional[Dict[str, str]] = None,
+        on_result: Optional[Callable[[int, int, Any], None]] = None,
+        latest_versions: Optional[Dict[str, str]] = None,
+        on_partial: Optional[Callable[[Any], None]] = None,
+    ) -> List[Any]:
+        """모든 라이브러리를 분석하고 입력 순서대로 정렬된 결과를 반환
+
+        on_result(완료 개수, 전체 개수, 결과) 콜백으로 진행 상황을 알린다.
+        """
+        total = len(libraries)
+        results: List[Any] = [None] * total
+
+        iterator = self.iter_results(libraries, coordinates, latest_versions, on_partial)
+        for done, (index, result) in enumerate(iterator, 1):
+            results[index] = result
+            if on_result:
+                on_result(done, total, result)
+
+        return results
@@ -0,0 +1,742 @@
+# 멀티 모듈 Gradle 프로젝트 의존성 추출기
+# 프로젝트 트리를 한 번 훑어 버전 카탈로그, build.gradle / build.gradle.kts, gradle.properties 를 모으고
+# 스크립트는 병렬로 토큰화해 (줄 단위 정규식이 아니라 토큰 흐름으로) 다음 선언을 읽는다.
+#   - implementation("g:a:v") / implementation 'g:a:$ver' / group: 'g', name: 'a', version: 'v'
+#   - platform(...) / enforcedPlatform(...) BOM, kotlin("stdlib"), libs.xxx 카탈로그 접근자와 번들
+#   - plugins { id("x") version "v" / kotlin("android") version "v" / alias(libs.plugins.x) }
+#   - ext.x = / ext { x = } / def x = / val x by extra(...) / extra["x"] = / Groovy 맵 ([a: "1"]) 변수
+# 변수 참조는 같은 스크립트 → 상위 디렉터리 프로젝트의 ext → gradle.properties 순서로 푼다.
+# 결과는 (좌표, 버전) 으로 중복을 없앤 의존성 목록이며 항목마다 선언한 모듈과 위치를 함께 둔다.
+
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from libguard.catalog import CATALOG_SUFFIX, SKIPPED_DIRS, CatalogEntry, VersionCatalog, parse_catalog
+from libguard.reports import ReportLocation, catalog_locations
+
+BUILD_SCRIPTS = ("build.gradle", "build.gradle.kts")
+SETTINGS_SCRIPTS = ("settings.gradle", "settings.gradle.kts")
+PROPERTIES_FILE = "gradle.properties"
+
+# 의존성 설정 이름 (testImplementation, debugApi, kspAndroidTest 처럼 접두어/접미어가 붙은 형태 포함)
+_CONFIGURATION = re.compile(
+    r"^(?:[a-z][A-Za-z0-9]*)?(?:implementation|Implementation|api|Api|compileOnly|CompileOnly|runtimeOnly|RuntimeOnly"
+    r"|kapt|Kapt|ksp|Ksp|annotationProcessor|AnnotationProcessor|compile|Compile|classpath"
+    r"|lintChecks|coreLibraryDesugaring|detektPlugins)(?:[A-Z][A-Za-z0-9]*)?$"
+)
+# 의존성이 아닌 인자 (다른 모듈, 로컬 파일 등)
+_NON_COORDINATE_CALLS = {"project", "projects", "files", "fileTree", "gradleApi", "localGroovy", "testFixtures"}
+_PLATFORM_CALLS = {"platform", "enforcedPlatform"}
+# 변수 이름 앞에 붙는 소유자 (rootProject.ext.x, project.extra["x"] → x)
+_REFERENCE_PREFIXES = ("rootProject.", "project.", "ext.", "extra.", "extensions.extraProperties.")
+
+_TOKEN = re.compile(
+    r"""
+    (?P<newline>\n)
+    |(?P<space>[ \t\r\f]+|\\\n)
+    |(?P<comment>//[^\n]*|/\*.*?\*/)
+    |(?P<string>\"\"\".*?\"\"\"|'''.*?'''|"(?:\\.|\$\{[^}\n]*\}|[^"\\\n])*"|'(?:\\.|[^'\\\n])*')
+    |(?P<number>\d[\w.]*)
+    |(?P<name>[A-Za-z_][\w]*)
+    |(?P<op>\S)
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+_INTERPOLATION = re.compile(r"\$\{\s*([^}]*?)\s*\}|\$([A-Za-z_]\w*(?:\.[A-Za-z_]\w*)*)")
+_INDEX_ACCESS = re.compile(r"""\[\s*["']([^"']+)["']\s*\]""")
+_PROPERTY_CALL = re.compile(r"""^(?:\w+\.)*(?:property|findProperty)\(\s*["']([^"']+)["']\s*\)""")
+
+# 토큰 종류
+NAME = "name"
+STRING = "string"    # 치환 없는 문자열 ('...', Groovy 작은따옴표)
+GSTRING = "gstring"  # $변수 치환이 있는 문자열 ("...")
+OP = "op"
+
+# 값 = (참조 여부, 텍스트) 조각들, "g:a:$ver" → ((False, "g:a:"), (True, "ver"))
+Parts = Tuple[Tuple[bool, str], ...]
+Token = Tuple[str, str, int]
+
+
+@dataclass(frozen=True)
+class Declaration:
+    module: str
+    path: str
+    line: int
+    configuration: str
+    group: str
+    artifact: str
+    version: str = ""
+    kind: str = "library"  # library | platform | plugin
+    unresolved: str = ""   # 풀지 못한 버전 참조 (${okhttpVersion} 등)
+
+    @property
+    def coordinate(self) -> str:
+        return f"{self.group}:{self.artifact}"
+
+
+@dataclass
+class Dependency:
+    group: str
+    artifact: str
+    version: str
+    kind: str = "library"
+    modules: List[str] = field(default_factory=list)
+    declarations: List[Declaration] = field(default_factory=list)
+
+    @property
+    def coordinate(self) -> str:
+        return f"{self.group}:{self.artifact}"
+
+    def to_dict(self) -> dict:
+        return {
+            "coordinate": self.coordinate,
+            "version": self.version,
+            "kind": self.kind,
+            "modules": self.modules,
+            "declarations": [
+                {"module": d.module, "path": d.path, "line": d.line, "configuration": d.configuration}
+                for d in self.declarations
+            ],
+        }
+
+
+@dataclass
+class ProjectScan:
+    root: str
+    modules: List[str] = field(default_factory=list)
+    dependencies: List[Dependency] = field(default_factory=list)
+    unresolved: List[Declaration] = field(default_factory=list)
+    errors: Dict[str, str] = field(default_factory=dict)
+    files: int = 0
+    duration_seconds: float = 0.0
+
+    def versioned(self) -> List[Dependency]:
+        """버전이 확정된 의존성만 (BOM 관리 등 버전 없는 항목 제외)"""
+        return [dependency for dependency in self.dependencies if dependency.version]
+
+    def _keys(self) -> Dict[int, str]:
+        # 모듈마다 버전이 다르면 같은 좌표가 여러 번 나오므로 그때만 버전을 붙여 구분한다
+        counts: Dict[str, int] = {}
+        for dependency in self.versioned():
+            counts[dependency.coordinate] = counts.get(dependency.coordinate, 0) + 1
+        return {
+            id(dependency): (
+                dependency.coordinate if counts[dependency.coordinate] == 1
+                else f"{dependency.coordinate}@{dependency.version}"
+            )
+            for dependency in self.versioned()
+        }
+
+    def library_versions(self) -> Dict[str, str]:
+        """항목 키 → 버전 (분석 엔진 입력 형식)"""
+        keys = self._keys()
+        return {keys[id(dependency)]: dependency.version for dependency in self.versioned()}
+
+    def coordinates(self) -> Dict[str, str]:
+        """항목 키 → group:artifact 좌표"""
+        keys = self._keys()
+        return {keys[id(dependency)]: dependency.coordinate for dependency in self.versioned()}
+
+    def locations(self) -> Dict[str, ReportLocation]:
+        """항목 키 → 첫 선언 위치 (리포트 표시용)"""
+        keys = self._keys()
+        return {
+            keys[id(dependency)]: ReportLocation(
+                os.path.relpath(dependency.declarations[0].path),
+                dependency.declarations[0].line,
+                dependency.coordinate,
+            )
+            for dependency in self.versioned()
+        }
+
+    def to_dict(self) -> dict:
+        return {
+            "root": self.root,
+            "modules": self.modules,
+            "files": self.files,
+            "duration_seconds": self.duration_seconds,
+            "dependencies": [dependency.to_dict() for dependency in self.dependencies],
+            "unresolved": [
+                {"module": d.module, "path": d.path, "line": d.line, "coordinate": d.coordinate, "version": d.unresolved}
+                for d in self.unresolved
+            ],
+            "errors": self.errors,
+        }
+
+
+def tokenize(source: str) -> List[Token]:
+    """Groovy / Kotlin 빌드 스크립트 → (종류, 텍스트, 줄 번호) 토큰 (공백, 주석, 줄바꿈 제외)"""
+    tokens: List[Token] = []
+    line = 1
+    for match in _TOKEN.finditer(source):
+        kind = match.lastgroup
+        text = match.group()
+        if kind == "string":
+            quote = 3 if text[:3] in ('"""', "'''") else 1
+            tokens.append((GSTRING if text[0] == '"' else STRING, text[quote:-quote], line))
+        elif kind in (NAME, OP, "number"):
+            tokens.append((OP if kind == "number" else kind, text, line))
+        line += text.count("\n")
+    return tokens
+
+
+def _normalize_reference(expression: str) -> str:
+    """rootProject.ext["kotlin_version"] / project.extra.get("x") 같은 참조 → 비교용 점 표기 이름"""
+    name = _INDEX_ACCESS.sub(lambda m: "." + m.group(1), expression.replace(" ", ""))
+    call = _PROPERTY_CALL.match(name)
+    if call:
+        return call.group(1)
+    if name.endswith(".get()"):
+        name = name[:-len(".get()")]
+    changed = True
+    while changed:
+        changed = False
+        for prefix in _REFERENCE_PREFIXES:
+            if name.startswith(prefix) and len(name) > len(prefix):
+                name = name[len(prefix):]
+                changed = True
+    return name
+
+
+def _template(text: str, interpolate: bool) -> Parts:
+    if not interpolate or "$" not in text:
+        return ((False, text),)
+    parts = []
+    position = 0
+    for match in _INTERPOLATION.finditer(text):
+        if match.start() > position:
+            parts.append((False, text[position:match.start()]))
+        parts.append((True, _normalize_reference(match.group(1) or match.group(2))))
+        position = match.end()
+    if position < len(text):
+        parts.append((False, text[position:]))
+    return tuple(parts)
+
+
+@dataclass
+class _RawDeclaration:
+    line: int
+    configuration: str
+    kind: str
+    value: Parts = ()                        # "g:a:v" 문자열 식 (또는 카탈로그 접근자 참조)
+    named: Dict[str, Parts] = field(default_factory=dict)  # group / name / version 맵 형태
+    version: Parts = ()                      # 플러그인 버전
+
+
+@dataclass
+class _Script:
+    path: str
+    declarations: List[_RawDeclaration] = field(default_factory=list)
+    local: Dict[str, Parts] = field(default_factory=dict)      # def / val (이 스크립트 안에서만)
+    inherited: Dict[str, Parts] = field(default_factory=dict)  # ext / extra (하위 프로젝트에서도 보임)
+    error: str = ""
+
+
+class _ScriptParser:
+    def __init__(self, tokens: List[Token], script: _Script):
+        self.tokens = tokens
+        self.script = script
+
+    def _text(self, i: int) -> str:
+        return self.tokens[i][1] if 0 <= i < len(self.tokens) else ""
+
+    def _kind(self, i: int) -> str:
+        return self.tokens[i][0] if 0 <= i < len(self.tokens) else ""
+
+    def parse(self):
+        stack: List[str] = []
+        i = 0
+        while i < len(self.tokens):
+            kind, text, _ = self.tokens[i]
+            if kind == OP and text == "{":
+                stack.append(self._block_name(i))
+                i += 1
+            elif kind == OP and text == "}":
+                if stack:
+                    stack.pop()
+                i += 1
+            elif kind == NAME and self._text(i - 1) != ".":
+                i = max(i + 1, self._statement(i, stack))
+            else:
+                i += 1
+
+    def _block_name(self, i: int) -> str:
+        """{ 앞의 이름 (dependencies {, configure(...) {, implementation("...") { 모두 처리)"""
+        j = i - 1
+        if self._text(j) == ")":
+            depth = 0
+            while j >= 0:
+                if self._text(j) == ")":
+                    depth += 1
+                elif self._text(j) == "(":
+                    depth -= 1
+                    if depth == 0:
+                        break
+                j -= 1
+            j -= 1
+        return self._text(j) if self._kind(j) == NAME else ""
+
+    def _dotted(self, i: int) -> Tuple[str, int]:
+        """a.b["c"].d 형태 이름 → ("a.b.c.d", 다음 위치)"""
+        if self._kind(i) != NAME:
+            return "", i
+        names = [self._text(i)]
+        i += 1
+        while True:
+            if self._text(i) == "." and self._kind(i + 1) == NAME:
+                names.append(self._text(i + 1))
+                i += 2
+            elif self._text(i) == "[" and self._kind(i + 1) in (STRING, GSTRING) and self._text(i + 2) == "]":
+                names.append(self._text(i + 1))
+                i += 3
+            else:
+                break
+        # provider 접근 (libs.versions.kotlin.get())
+        if names[-1] == "get" and self._text(i) == "(" and self._text(i + 1) == ")":
+            names.pop()
+            i += 2
+        return ".".join(names), i
+
+    def _primary(self, i: int) -> Tuple[Optional[Parts], int]:
+        kind, text = self._kind(i), self._text(i)
+        if kind in (STRING, GSTRING):
+            return _template(text, kind == GSTRING), i + 1
+        if kind == NAME and text not in ("true", "false", "null"):
+            name, j = self._dotted(i)
+            if self._text(j) == "(":
+                # property("x") / findProperty("x") / rootProject.property("x")
+                if name.split(".")[-1] in ("property", "findProperty") and self._kind(j + 1) in (STRING, GSTRING) \
+                        and self._text(j + 2) == ")":
+                    return ((True, self._text(j + 1)),), j + 3
+                return None, i
+            return ((True, _normalize_reference(name)),), j
+        if text == "(":
+            value, j = self._expression(i + 1)
+            if value is not None and self._text(j) == ")":
+                return value, j + 1
+        return None, i
+
+    def _expression(self, i: int) -> Tuple[Optional[Parts], int]:
+        """문자열 / 참조와 + 연결만 읽는다 (그 밖의 식은 None)"""
+        value, i = self._primary(i)
+        if value is None:
+            return None, i
+        parts = list(value)
+        while self._text(i) == "+":
+            value, j = self._primary(i + 1)
+            if value is None:
+                break
+            parts.extend(value)
+            i = j
+        return tuple(parts), i
+
+    def _statement(self, i: int, stack: List[str]) -> int:
+        top = stack[-1] if stack else ""
+        if top == "plugins":
+            return self._plugin(i)
+        if "dependencies" in stack and _CONFIGURATION.match(self._text(i)):
+            return self._dependency(i)
+        return self._assignment(i, top)
+
+    def _dependency(self, i: int) -> int:
+        configuration, line = self._text(i), self.tokens[i][2]
+        j = i + 1
+        if self._text(j) == "(":
+            j += 1
+        while True:
+            raw = _RawDeclaration(line, configuration, "library")
+            if self._text(j) in _PLATFORM_CALLS and self._text(j + 1) == "(":
+                raw.kind = "platform"
+                j += 2
+            if self._text(j) in _NON_COORDINATE_CALLS:
+                return j + 1
+            if self._text(j) == "kotlin" and self._text(j + 1) == "(":
+                j = self._kotlin_module(j + 2, raw)
+            elif self._kind(j) == NAME and self._text(j + 1) in (":", "=") and self._text(j) in ("group", "name"):
+                j = self._named(j, raw)
+            else:
+                raw.value, j = self._expression(j)
+                if raw.value is None:
+                    return j
+            self.script.declarations.append(raw)
+            while self._text(j) == ")":
+                j += 1
+            # implementation "a:b:1", "c:d:2"
+            if self._text(j) != "," or self._kind(j + 1) not in (STRING, GSTRING, NAME):
+                return j
+            j += 1
+
+    def _kotlin_module(self, j: int, raw: _RawDeclaration) -> int:
+        """kotlin("stdlib") / kotlin("stdlib", "1.9.0") → org.jetbrains.kotlin:kotlin-stdlib"""
+        module, j = self._expression(j)
+        if module is None:
+            return j
+        raw.named = {"group": ((False, "org.jetbrains.kotlin"),), "name": ((False, "kotlin-"),) + module}
+        if self._text(j) == ",":
+            version, j = self._expression(j + 1)
+            if version is not None:
+                raw.named["version"] = version
+        return j
+
+    def _named(self, j: int, raw: _RawDeclaration) -> int:
+        """group: 'g', name: 'a', version: 'v' (Groovy) / group = "g", name = "a" (Kotlin)"""
+        while self._kind(j) == NAME and self._text(j + 1) in (":", "="):
+            key = self._text(j)
+            value, j = self._expression(j + 2)
+            if value is None:
+                break
+            raw.named[key] = value
+            if self._text(j) != ",":
+                break
+            j += 1
+        return j
+
+    def _plugin(self, i: int) -> int:
+        name, line = self._text(i), self.tokens[i][2]
+        raw = _RawDeclaration(line, "plugins", "plugin")
+        j = i + 1
+        paren = self._text(j) == "("
+        if name not in ("id", "kotlin", "alias") or not (paren or self._kind(j) in (STRING, GSTRING)):
+            return j
+        value, j = self._expression(j + 1 if paren else j)
+        if value is None:
+            return j
+        if paren and self._text(j) == ")":
+            j += 1
+        if name == "kotlin":
+            value = ((False, "org.jetbrains.kotlin."),) + value
+        raw.value = value
+        if self._text(j) == "version":
+            raw.version, j = self._expression(j + 1)
+            raw.version = raw.version or ()
+        self.script.declarations.append(raw)
+        return j
+
+    def _assignment(self, i: int, top: str) -> int:
+        j = i
+        local = self._text(j) in ("def", "val", "var")
+        if local:
+            j += 1
+        target, j = self._dotted(j)
+        if not target:
+            return j
+        if local and self._text(j) == ":":
+            _, j = self._dotted(j + 1)
+
+        # val kotlinVersion by extra("1.9.0")
+        if local and self._text(j) == "by" and self._text(j + 1) == "extra" and self._text(j + 2) == "(":
+            value, j = self._expression(j + 3)
+            if value is not None:
+                self.script.inherited[target] = value
+            return j
+        # ext.set("x", "1") / extra.set("x", "1") / ext { set("x", "1") }
+        if target.split(".")[-1] == "set" and self._text(j) == "(" and self._kind(j + 1) in (STRING, GSTRING):
+            if self._text(j + 2) == ",":
+                value, end = self._expression(j + 3)
+                if value is not None:
+                    self.script.inherited[self._text(j + 1)] = value
+                    return end
+            return j
+
+        if self._text(j) != "=" or self._text(j + 1) == "=":
+            return j
+        owned = target != _normalize_reference(target) or top == "ext"
+        if not local and not owned:
+            # android { namespace = "..." } 같은 일반 속성 대입은 변수로 보지 않는다
+            return j + 1
+        scope = self.script.local if local else self.script.inherited
+        name = _normalize_reference(target)
+        if self._text(j + 1) == "[":
+            return self._map_literal(j + 2, name, scope)
+        value, j = self._expression(j + 1)
+        if value is not None:
+            scope[name] = value
+        return j
+
+    def _map_literal(self, j: int, prefix: str, scope: Dict[str, Parts]) -> int:
+        """Groovy 맵 [kotlin: "1.9", okhttp: "4.12"] → prefix.kotlin, prefix.okhttp"""
+        while self._kind(j) in (NAME, STRING, GSTRING) and self._text(j + 1) == ":":
+            key = f"{prefix}.{self._text(j)}"
+            if self._text(j + 2) == "[":
+                j = self._map_literal(j + 3, key, scope)
+            else:
+                value, j = self._expression(j + 2)
+                if value is None:
+                    break
+                scope[key] = value
+            if self._text(j) != ",":
+                break
+            j += 1
+        return j + 1 if self._text(j) == "]" else j
+
+
+def parse_build_script(path: str) -> _Script:
+    script = _Script(path)
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            source = f.read()
+        _ScriptParser(tokenize(source), script).parse()
+    except OSError as e:
+        script.error = str(e)
+    return script
+
+
+def parse_properties(path: str) -> Dict[str, Parts]:
+    """gradle.properties (key=value / key: value, 줄 끝 \\ 이어쓰기는 지원하지 않음)"""
+    values = {}
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            for line in f:
+                line = line.strip()
+                if not line or line[0] in "#!":
+                    continue
+                separator = min((line.find(c) for c in "=:" if c in line), default=-1)
+                if separator <= 0:
+                    continue
+                key, value = line[:separator], line[separator + 1:]
+                if key.strip():
+                    values[key.strip()] = ((False, value.strip()),)
+    except OSError:
+        pass
+    return values
+
+
+class _Resolver:
+    def __init__(self, scopes: List[Dict[str, Parts]]):
+        """가까운 범위부터 찾는 변수 조회기"""
+        self.scopes = scopes
+
+    def lookup(self, name: str) -> Optional[Parts]:
+        for scope in self.scopes:
+            if name in scope:
+                return scope[name]
+        return None
+
+    def resolve(self, parts: Parts, depth: int = 0) -> Tuple[str, List[str]]:
+        """조각 → (문자열, 풀지 못한 참조), 풀지 못한 참조는 ${이름} 으로 남긴다"""
+        text = []
+        missing = []
+        for is_reference, value in parts:
+            if not is_reference:
+                text.append(value)
+                continue
+            found = self.lookup(value) if depth < 8 else None
+            if found is None:
+                text.append("${" + value + "}")
+                missing.append(value)
+                continue
+            resolved, nested = self.resolve(found, depth + 1)
+            text.append(resolved)
+            missing.extend(nested)
+        return "".join(text), missing
+
+
+def _accessor_key(alias: str) -> str:
+    # Gradle 은 별칭의 - _ . 를 모두 접근자 구분자로 바꾼다 (androidx-core-ktx → libs.androidx.core.ktx)
+    return re.sub(r"[-_.]", ".", alias)
+
+
+class _CatalogAccessors:
+    def __init__(self, name: str, catalog: VersionCatalog):
+        self.name = name
+        self.catalog = catalog
+        self.libraries = {_accessor_key(alias): entry for alias, entry in catalog.libraries.items()}
+        self.plugins = {_accessor_key(alias): entry for alias, entry in catalog.plugins.items()}
+        self.bundles = {_accessor_key(bundle): bundle for bundle in catalog.bundles}
+
+    def entries(self, accessor: str) -> List[CatalogEntry]:
+        """libs.okhttp / libs.plugins.x / libs.bundles.x → 카탈로그 항목"""
+        rest = accessor[len(self.name) + 1:]
+        if rest.startswith("plugins."):
+            entry = self.plugins.get(rest[len("plugins."):])
+            return [entry] if entry else []
+        if rest.startswith("bundles."):
+            bundle = self.bundles.get(rest[len("bundles."):])
+            return self.catalog.bundle_entries(bundle) if bundle else []
+        entry = self.libraries.get(rest)
+        return [entry] if entry else []
+
+
+@dataclass
+class _Build:
+    root: str
+    name: str
+    catalogs: Dict[str, _CatalogAccessors] = field(default_factory=dict)
+
+
+def _walk(root: str) -> Tuple[List[str], List[str], List[str], List[str]]:
+    """(빌드 스크립트, 카탈로그, gradle.properties, 빌드 루트 디렉터리)"""
+    scripts, catalogs, properties, builds = [], [], [], []
+    for directory, dirs, files in os.walk(root):
+        dirs[:] = sorted(d for d in dirs if d not in SKIPPED_DIRS)
+        names = set(files)
+        scripts.extend(os.path.join(directory, name) for name in BUILD_SCRIPTS if name in names)
+        catalogs.extend(os.path.join(directory, name) for name in sorted(files) if name.endswith(CATALOG_SUFFIX))
+        if PROPERTIES_FILE in names:
+            properties.append(os.path.join(directory, PROPERTIES_FILE))
+        if any(name in names for name in SETTINGS_SCRIPTS):
+            builds.append(directory)
+    return scripts, catalogs, properties, builds
+
+
+def _module_name(build: _Build, directory: str) -> str:
+    relative = os.path.relpath(directory, build.root)
+    path = ":" if relative == "." else ":" + relative.replace(os.sep, ":")
+    return f"{build.name}{path}" if build.name else path
+
+
+def _split_coordinate(text: str) -> Optional[Tuple[str, str, str]]:
+    """g:a[:v[:classifier]][@ext] → (g, a, v)"""
+    text = text.split("@", 1)[0] if "@" in text.split(":")[-1] else text
+    parts = text.split(":")
+    if len(parts) < 2 or not parts[0] or not parts[1] or "$" in parts[0] or "$" in parts[1]:
+        return None
+    if any(c.isspace() for c in parts[0] + parts[1]):
+        return None
+    return parts[0], parts[1], parts[2] if len(parts) > 2 else ""
+
+
+def scan_project(root: str, max_workers: int = 8) -> ProjectScan:
+    """프로젝트 트리 전체의 의존성 (카탈로그 + 빌드 스크립트, 모듈별 선언 위치 포함)"""
+    started = time.time()
+    root = os.path.abspath(root)
+    scan = ProjectScan(root)
+    script_paths, catalog_paths, property_paths, build_roots = _walk(root)
+    scan.files = len(script_paths) + len(catalog_paths) + len(property_paths)
+
+    # settings.gradle 이 있는 디렉터리마다 별도 빌드 (하나도 없으면 검색 경로 자체)
+    build_roots = sorted(set(build_roots) or {root}, key=len, reverse=True)
+    builds = {
+        directory: _Build(directory, "" if len(build_roots) == 1 else os.path.relpath(directory, root))
+        for directory in build_roots
+    }
+
+    def build_for(directory: str) -> _Build:
+        for candidate in build_roots:
+            if directory == candidate or directory.startswith(candidate + os.sep):
+                return builds[candidate]
+        return builds[build_roots[-1]]
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="libguard-gradle") as pool:
+        scripts = list(pool.map(parse_build_script, script_paths))
+        properties = dict(zip(property_paths, pool.map(parse_properties, property_paths)))
+
+    declarations: List[Declaration] = []
+    for path in catalog_paths:
+        try:
+            with open(path, encoding="utf-8") as f:
+                content = f.read()
+            catalog = parse_catalog(content)
+        except (OSError, ValueError) as e:
+            scan.errors[path] = str(e)
+            continue
+        directory = os.path.dirname(path)
+        build = build_for(directory)
+        name = os.path.basename(path)[:-len(CATALOG_SUFFIX)]
+        build.catalogs.setdefault(name, _CatalogAccessors(name, catalog))
+        locations = catalog_locations(path, content)
+        for entry in catalog.entries():
+            location = locations.get(entry.key)
+            declarations.append(Declaration(
+                "", path, location.line if location else 0, "catalog",
+                entry.group, entry.artifact, entry.version, entry.kind,
+            ))
+
+    by_directory = {os.path.dirname(script.path): script for script in scripts}
+    modules = set()
+    for script in scripts:
+        if script.error:
+            scan.errors[script.path] = script.error
+            continue
+        directory = os.path.dirname(script.path)
+        build = build_for(directory)
+        module = _module_name(build, directory)
+        modules.add(module)
+
+        # 이 스크립트 → 상위 프로젝트 ext → gradle.properties (모듈, 빌드 루트) 순서
+        scopes = [script.local, script.inherited]
+        parent = directory
+        while parent != build.root and parent.startswith(build.root):
+            parent = os.path.dirname(parent)
+            if parent in by_directory:
+                scopes.append(by_directory[parent].inherited)
+        for properties_dir in (directory, build.root):
+            scopes.append(properties.get(os.path.join(properties_dir, PROPERTIES_FILE), {}))
+        resolver = _Resolver(scopes)
+
+        for raw in script.declarations:
+            declarations.extend(_resolve_declaration(raw, resolver, build, module, script.path, scan))
+
+    scan.modules = sorted(modules)
+    scan.dependencies = _merge(declarations)
+    scan.duration_seconds = round(time.time() - started, 3)
+    return scan
+
+
+def _resolve_declaration(
+    raw: _RawDeclaration, resolver: _Resolver, build: _Build, module: str, path: str, scan: ProjectScan
+) -> List[Declaration]:
+    # libs.okhttp 처럼 참조 하나뿐이고 변수로 풀리지 않으면 카탈로그 접근자로 본다
+    if len(raw.value) == 1 and raw.value[0][0] and resolver.lookup(raw.value[0][1]) is None:
+        accessor = raw.value[0][1]
+        catalog = build.catalogs.get(accessor.split(".", 1)[0])
+        if catalog is None:
+            return []
+        return [
+            Declaration(module, path, raw.line, raw.configuration, entry.group, entry.artifact, entry.version,
+                        "platform" if raw.kind == "platform" else entry.kind)
+            for entry in catalog.entries(accessor)
+        ]
+
+    if raw.kind == "plugin":
+        plugin_id, missing = resolver.resolve(raw.value)
+        if missing or not plugin_id:
+            return []
+        coordinate = (plugin_id, f"{plugin_id}.gradle.plugin", "")
+        version_parts = raw.version
+    elif raw.named:
+        group, missing_group = resolver.resolve(raw.named.get("group", ()))
+        artifact, missing_artifact = resolver.resolve(raw.named.get("name", ()))
+        if missing_group or missing_artifact or not group or not artifact:
+            return []
+        coordinate = (group, artifact, "")
+        version_parts = raw.named.get("version", ())
+    else:
+        text, _ = resolver.resolve(raw.value)
+        coordinate = _split_coordinate(text)
+        if coordinate is None:
+            return []
+        version_parts = ()
+
+    version, missing = resolver.resolve(version_parts) if version_parts else (coordinate[2], [])
+    declaration = Declaration(module, path, raw.line, raw.configuration, coordinate[0], coordinate[1], version, raw.kind)
+    if missing or "$" in version:
+        declaration = Declaration(
+            module, path, raw.line, raw.configuration, coordinate[0], coordinate[1], "", raw.kind, unresolved=version
+        )
+        scan.unresolved.append(declaration)
+    return [declaration]
+
+
+def _merge(declarations: List[Declaration]) -> List[Dependency]:
+    """(좌표, 버전) 별로 묶기 (선언 순서 유지, BOM 으로 선언된 적이 있으면 platform)"""
+    merged: Dict[Tuple[str, str, str], Dependency] = {}
+    for declaration in declarations:
+        key = (declaration.group, declaration.artifact, declaration.version)
+        dependency = merged.get(key)
+        if dependency is None:
+            dependency = merged[key] = Dependency(
+                declaration.group, declaration.artifact, declaration.version, declaration.kind
+            )
+        elif declaration.kind == "platform":
+            dependency.kind = "platform"
+        dependency.declarations.append(declaration)
+        if declaration.module and declaration.module not in dependency.modules:
+            dependency.modules.append(declaration.module)
+    for dependency in merged.values():
+        dependency.modules.sort()
+    return list(merged.values())
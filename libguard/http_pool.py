@@ -0,0 +1,121 @@
+# 업스트림별 공유 HTTP 세션
+# OpenAI / Maven Central 마다 keep-alive 연결 풀을 하나씩 두고 프로세스 안의 모든 분석기가 재사용한다.
+# 5xx 응답과 타임아웃/연결 오류는 지수 백오프 + 지터로 재시도한다.
+
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass, replace
+from typing import Dict
+
+import requests
+from requests.adapters import HTTPAdapter
+
+OPENAI = "openai"
+MAVEN = "maven"
+
+RETRY_STATUS_CODES = frozenset({500, 502, 503, 504})
+
+
+def _env_int(name: str, default: int, minimum: int) -> int:
+    """정수 환경 변수 (비었거나 정수가 아니거나 minimum 보다 작으면 default)"""
+    try:
+        value = int(os.getenv(name, "").strip())
+    except ValueError:
+        return default
+    return value if value >= minimum else default
+
+
+@dataclass(frozen=True)
+class HttpSettings:
+    pool_size: int = 10  # 호스트당 최대 연결 수
+    max_retries: int = 3
+    backoff_base: float = 0.5  # 첫 재시도 대기 상한 (초)
+    backoff_max: float = 20.0
+
+    @classmethod
+    def from_env(cls) -> "HttpSettings":
+        """LIBGUARD_HTTP_POOL_SIZE / LIBGUARD_HTTP_MAX_RETRIES 를 반영한 설정 (잘못된 값은 기본값으로)"""
+        defaults = cls()
+        return cls(
+            pool_size=_env_int("LIBGUARD_HTTP_POOL_SIZE", defaults.pool_size, minimum=1),
+            max_retries=_env_int("LIBGUARD_HTTP_MAX_RETRIES", defaults.max_retries, minimum=0),
+        )
+
+
+_settings = HttpSettings.from_env()
+_sessions: Dict[str, requests.Session] = {}
+_lock = threading.Lock()
+
+
+def _new_session(settings: HttpSettings) -> requests.Session:
+    session = requests.Session()
+    # pool_block=True: 호스트당 연결 수를 pool_size 로 제한 (초과 요청은 빈 연결을 기다림)
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=settings.pool_size,
+        pool_block=True,
+        max_retries=0,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def configure_http(**changes) -> HttpSettings:
+    """연결 풀/재시도 설정 변경 (값이 실제로 바뀐 경우에만 세션을 새로 만든다)"""
+    global _settings
+    with _lock:
+        new_settings = replace(_settings, **changes)
+        if new_settings != _settings:
+            for session in _sessions.values():
+                session.close()
+            _sessions.clear()
+            _settings = new_settings
+        return _settings
+
+
+def http_settings() -> HttpSettings:
+    return _settings
+
+
+def get_session(upstream: str) -> requests.Session:
+    """업스트림 이름별 공유 세션"""
+    with _lock:
+        session = _sessions.get(upstream)
+        if session is None:
+            session = _sessions[upstream] = _new_session(_settings)
+        return session
+
+
+def backoff_delay(attempt: int, settings: HttpSettings = None) -> float:
+    """지수 백오프 + 전체 지터 (0 ~ min(상한, base * 2^attempt))"""
+    settings = settings or _settings
+    return random.uniform(0, min(settings.backoff_max, settings.backoff_base * (2 ** attempt)))
+
+
+def request_with_retry(upstream: str, method: str, url: str, **kwargs) -> requests.Response:
+    """공유 세션으로 요청하고 일시적 실패(5xx/타임아웃/연결 오류)는 재시도
+
+    재시도를 모두 소진하면 마지막 응답을 반환하거나 마지막 예외를 다시 발생시킨다.
+    """
+    settings = _settings
+    session = get_session(upstream)
+
+    for attempt in range(settings.max_retries + 1):
+        is_last = attempt >= settings.max_retries
+        try:
+            response = session.request(method, url, **kwargs)
+        except (requests.Timeout, requests.ConnectionError):
+            if is_last:
+                raise
+            time.sleep(backoff_delay(attempt, settings))
+            continue
+
+        if response.status_code in RETRY_STATUS_CODES and not is_last:
+            response.close()
+            time.sleep(backoff_delay(attempt, settings))
+            continue
+
+        return response
@@ -0,0 +1,541 @@
+# 프로세스 밖 분석 작업 큐와 워커 풀
+# 웹 앱은 분석을 직접 실행하지 않고 SQLite 작업 큐(jobs.sqlite3)에 제출한 뒤 진행 상황과 결과를 조회한다.
+#   - 워커 프로세스 여러 개가 큐에서 작업을 하나씩 가져가 실행하므로 여러 카탈로그를 코어 수만큼 동시에 분석한다
+#   - 웹 서버 프로세스마다 풀 하나만 두고, 매니저 프로세스와 워커는 처음 작업을 제출할 때 띄운다
+#   - API 키는 작업과 함께 매니저 프로세스 메모리에 등록하고, 키별 AdaptiveRateLimiter 를 모든 워커가 공유한다
+#   - 결과는 큐에 저장되므로 브라우저 탭을 닫거나 스크립트가 다시 실행되어도 분석이 계속되고 결과가 남는다
+#   - API 키는 디스크에 쓰지 않는다. 작업에는 키의 해시(owner)만 저장하고 워커는 키가 등록된 소유자의 작업만 가져간다
+#   - 워커가 죽어 하트비트가 끊긴 작업은 다른 워커가 다시 가져간다
+#   - 스트리밍으로 받는 라이브러리별 중간 요약은 job_partials 에 (라이브러리당 한 행, 일정 간격으로) 써 두고
+#     웹 앱이 진행 상황을 조회할 때 함께 읽어 보여준다
+
+import hashlib
+import json
+import multiprocessing
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import asdict, dataclass
+from multiprocessing.managers import BaseManager
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from libguard.analyzer import OPENAI_MODEL, LibraryInfo, StableLibraryAnalyzer
+from libguard.cache import ResultCache, default_cache_dir
+from libguard.engine import AnalysisEngine
+from libguard.http_pool import configure_http
+from libguard.metadata import MetadataFetcher
+from libguard.metrics import RunMetrics
+from libguard.ratelimit import AdaptiveRateLimiter
+from libguard.reports import catalog_locations
+from libguard.scheduler import AnalysisBudget
+from libguard.snapshot import SnapshotStore, analyze_incremental, upload_catalog_id
+from libguard.streaming import PartialResult
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+ACTIVE_STATUSES = (QUEUED, RUNNING)
+
+DEFAULT_PROCESSES = int(os.getenv("LIBGUARD_WORKER_PROCESSES", str(max(1, min(4, os.cpu_count() or 1)))))
+POLL_SECONDS = 1.0
+HEARTBEAT_SECONDS = 5.0
+# 하트비트가 이 시간 이상 끊긴 실행 중 작업은 워커가 죽은 것으로 보고 다시 큐에 넣는다
+STALE_SECONDS = 60.0
+# 같은 라이브러리의 중간 요약을 큐에 다시 쓰기까지의 최소 간격 (완료 이벤트는 바로 쓴다)
+PARTIAL_FLUSH_SECONDS = 0.5
+# 끝난 작업(결과)을 보관하는 기간
+JOB_RETENTION_SECONDS = 7 * 24 * 60 * 60
+
+
+def default_job_path() -> str:
+    return os.path.join(default_cache_dir(), "jobs.sqlite3")
+
+
+def owner_id(api_key: str) -> str:
+    """API 키 대신 저장하는 작업 소유자 ID"""
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class Job:
+    id: str
+    key: str
+    owner: str
+    status: str
+    file_name: str
+    toml_content: str
+    options: dict
+    created_at: float
+    updated_at: float
+    done: int = 0
+    total: int = 0
+    message: str = ""
+    error: str = ""
+    result: Optional[dict] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status not in ACTIVE_STATUSES
+
+    def to_run(self) -> dict:
+        """완료된 작업 → 결과 탭을 그리는 실행 결과 (streamlit_app.render_results 입력)"""
+        run = dict(self.result or {})
+        run["results"] = [LibraryInfo(**result) for result in run.get("results", [])]
+        run["file_name"] = self.file_name
+        run["key"] = self.key
+        run["job_id"] = self.id
+        run["locations"] = catalog_locations(self.file_name, self.toml_content)
+        return run
+
+
+_JOB_COLUMNS = (
+    "id, key, owner, status, file_name, toml_content, options, created_at, updated_at, "
+    "done, total, message, error, result"
+)
+
+
+def _job_from_row(row) -> Job:
+    return Job(
+        id=row[0], key=row[1], owner=row[2], status=row[3], file_name=row[4], toml_content=row[5],
+        options=json.loads(row[6]), created_at=row[7], updated_at=row[8], done=row[9], total=row[10],
+        message=row[11], error=row[12], result=json.loads(row[13]) if row[13] else None,
+    )
+
+
+class JobStore:
+    def __init__(self, path: Optional[str] = None):
+        """분석 작업 큐 (여러 프로세스가 같은 파일을 함께 쓴다)"""
+        self.path = path or default_job_path()
+        self._lock = threading.Lock()
+
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+
+        # 다른 프로세스가 쓰는 중이면 기다린다
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    key TEXT NOT NULL,
+                    owner TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    file_name TEXT NOT NULL,
+                    toml_content TEXT NOT NULL,
+                    options TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL,
+                    done INTEGER NOT NULL DEFAULT 0,
+                    total INTEGER NOT NULL DEFAULT 0,
+                    message TEXT NOT NULL DEFAULT '',
+                    error TEXT NOT NULL DEFAULT '',
+                    result TEXT,
+                    worker TEXT NOT NULL DEFAULT ''
+                )
+                """
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, created_at)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_key ON jobs (key, updated_at)")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS job_partials (
+                    job_id TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    summary TEXT NOT NULL,
+                    done INTEGER NOT NULL,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (job_id, name)
+                )
+                """
+            )
+
+    def submit(self, key: str, owner: str, file_name: str, toml_content: str, options: dict) -> Job:
+        """작업 제출 (같은 소유자의 같은 키 작업이 대기/실행 중이면 새로 만들지 않고 그 작업을 반환)"""
+        active = self.find(key, owner=owner, statuses=ACTIVE_STATUSES)
+        if active is not None:
+            return active
+
+        now = time.time()
+        job_id = uuid.uuid4().hex
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO jobs (id, key, owner, status, file_name, toml_content, options, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (job_id, key, owner, QUEUED, file_name, toml_content, json.dumps(options), now, now),
+            )
+            self._conn.execute(
+                "DELETE FROM jobs WHERE status NOT IN (?, ?) AND updated_at < ?",
+                (*ACTIVE_STATUSES, now - JOB_RETENTION_SECONDS),
+            )
+        return self.get(job_id)
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            row = self._conn.execute(f"SELECT {_JOB_COLUMNS} FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return _job_from_row(row) if row else None
+
+    def find(
+        self,
+        key: str,
+        owner: Optional[str] = None,
+        statuses: tuple = (QUEUED, RUNNING, DONE),
+        max_age: Optional[float] = None,
+    ) -> Optional[Job]:
+        """같은 실행 키의 가장 최근 작업 (owner 를 주지 않으면 모든 사용자의 작업에서 찾는다)"""
+        query = f"SELECT {_JOB_COLUMNS} FROM jobs WHERE key = ? AND status IN ({', '.join('?' * len(statuses))})"
+        params: List[Any] = [key, *statuses]
+        if owner is not None:
+            query += " AND owner = ?"
+            params.append(owner)
+        if max_age is not None:
+            query += " AND updated_at >= ?"
+            params.append(time.time() - max_age)
+        with self._lock:
+            row = self._conn.execute(query + " ORDER BY created_at DESC LIMIT 1", params).fetchone()
+        return _job_from_row(row) if row else None
+
+    def claim(self, owners: Union[str, Sequence[str]], worker: str) -> Optional[Job]:
+        """owners 중 한 소유자의 가장 오래된 대기 작업(또는 하트비트가 끊긴 실행 중 작업)을 가져간다
+
+        여러 워커가 동시에 같은 작업을 고르면 상태 조건을 건 UPDATE 로 하나만 성공한다.
+        """
+        owners = [owners] if isinstance(owners, str) else list(owners)
+        if not owners:
+            return None
+        while True:
+            now = time.time()
+            with self._lock:
+                row = self._conn.execute(
+                    f"SELECT id, status, updated_at FROM jobs WHERE owner IN ({', '.join('?' * len(owners))}) "
+                    "AND (status = ? OR (status = ? AND updated_at < ?)) ORDER BY created_at LIMIT 1",
+                    (*owners, QUEUED, RUNNING, now - STALE_SECONDS),
+                ).fetchone()
+                if row is None:
+                    return None
+                with self._conn:
+                    claimed = self._conn.execute(
+                        "UPDATE jobs SET status = ?, worker = ?, updated_at = ?, error = '' "
+                        "WHERE id = ? AND status = ? AND updated_at = ?",
+                        (RUNNING, worker, now, row[0], row[1], row[2]),
+                    ).rowcount
+            if claimed:
+                return self.get(row[0])
+
+    def heartbeat(self, job_id: str, done: Optional[int] = None, total: Optional[int] = None, message: str = ""):
+        """실행 중 작업의 진행 상황 갱신 (값을 주지 않으면 하트비트만)"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE jobs SET updated_at = ?, done = COALESCE(?, done), total = COALESCE(?, total), "
+                "message = CASE WHEN ? = '' THEN message ELSE ? END WHERE id = ? AND status = ?",
+                (time.time(), done, total, message, message, job_id, RUNNING),
+            )
+
+    def save_partials(self, job_id: str, partials: List[PartialResult]):
+        """라이브러리별 최신 중간 요약 기록 (라이브러리당 한 행을 덮어쓴다)"""
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO job_partials (job_id, name, summary, done, updated_at) VALUES (?, ?, ?, ?, ?)",
+                [(job_id, partial.name, partial.summary, int(partial.done), now) for partial in partials],
+            )
+
+    def partials(self, job_id: str) -> List[PartialResult]:
+        """중간 요약 (최근에 갱신된 순서)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT name, summary, done FROM job_partials WHERE job_id = ? ORDER BY updated_at DESC, name",
+                (job_id,),
+            ).fetchall()
+        return [PartialResult(name=row[0], summary=row[1], done=bool(row[2])) for row in rows]
+
+    def complete(self, job_id: str, result: dict):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, updated_at = ?, done = total WHERE id = ?",
+                (DONE, json.dumps(result, ensure_ascii=False), time.time(), job_id),
+            )
+            # 완료되면 결과에 확정 요약이 있으므로 중간 요약은 버린다
+            self._conn.execute("DELETE FROM job_partials WHERE job_id = ?", (job_id,))
+
+    def fail(self, job_id: str, error: str):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, updated_at = ? WHERE id = ?",
+                (FAILED, error, time.time(), job_id),
+            )
+            self._conn.execute("DELETE FROM job_partials WHERE job_id = ?", (job_id,))
+
+    def clear_finished(self):
+        """끝난 작업과 결과 삭제 (대기/실행 중인 작업은 남긴다)"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM jobs WHERE status NOT IN (?, ?)", ACTIVE_STATUSES)
+            self._conn.execute("DELETE FROM job_partials WHERE job_id NOT IN (SELECT id FROM jobs)")
+
+    def pending(self, owner: Optional[str] = None) -> int:
+        """대기 중인 작업 수"""
+        query, params = "SELECT COUNT(*) FROM jobs WHERE status = ?", [QUEUED]
+        if owner is not None:
+            query += " AND owner = ?"
+            params.append(owner)
+        with self._lock:
+            return self._conn.execute(query, params).fetchone()[0]
+
+
+class _PartialWriter:
+    def __init__(self, store: JobStore, job_id: str, interval: float = PARTIAL_FLUSH_SECONDS):
+        """엔진의 on_partial 을 받아 작업 큐에 모아 쓰기 (토큰 조각마다 쓰지 않도록 간격을 둔다)"""
+        self.store = store
+        self.job_id = job_id
+        self.interval = interval
+        self._pending: dict = {}
+        self._flushed_at = 0.0
+
+    def __call__(self, event: PartialResult):
+        summary = event.result.summary if event.done and event.result is not None else event.summary
+        self._pending[event.name] = PartialResult(name=event.name, summary=summary, done=event.done)
+        if event.done or time.monotonic() - self._flushed_at >= self.interval:
+            self.flush()
+
+    def flush(self):
+        if self._pending:
+            self.store.save_partials(self.job_id, list(self._pending.values()))
+            self._pending.clear()
+        self._flushed_at = time.monotonic()
+
+
+def execute_job(
+    job: Job,
+    api_key: str,
+    rate_limiter: Any,
+    store: JobStore,
+    result_cache: Optional[ResultCache] = None,
+    snapshot_store: Optional[SnapshotStore] = None,
+) -> dict:
+    """작업 하나 실행 → 저장할 결과 (JSON 으로 직렬화 가능한 dict)"""
+    options = job.options
+    metrics = RunMetrics(model=OPENAI_MODEL)
+    analyzer = StableLibraryAnalyzer(
+        api_key,
+        cache=result_cache if options.get("use_cache", True) else None,
+        rate_limiter=rate_limiter,
+        metrics=metrics,
+        version_history=MetadataFetcher(metrics=metrics) if options.get("version_history") else None
+    )
+    catalog = analyzer.parse_catalog(job.toml_content)
+    libraries = catalog.library_versions()
+    coordinates = catalog.coordinates()
+    store.heartbeat(job.id, done=0, total=len(libraries), message=f"{len(libraries)}개 라이브러리 분석 시작")
+
+    def on_result(done: int, total: int, result: LibraryInfo):
+        store.heartbeat(job.id, done=done, total=total, message=f"{result.name} (v{result.current_version})")
+
+    # 응답을 스트리밍으로 받아 중간 요약을 웹 앱에 보여준다
+    on_partial = _PartialWriter(store, job.id)
+
+    max_workers = options.get("max_workers", 4)
+    # 동시 요청 수보다 연결 풀이 작으면 요청이 연결을 기다리게 된다
+    configure_http(pool_size=max(10, max_workers))
+    engine = AnalysisEngine(
+        analyzer,
+        max_workers=max_workers,
+        batch_size=options.get("batch_size", 1),
+        budget=AnalysisBudget(
+            tokens=options.get("budget_tokens"),
+            usd=options.get("budget_usd"),
+            max_libraries=options.get("max_libraries"),
+            model=OPENAI_MODEL,
+        ),
+    )
+    reused_count = 0
+    if options.get("incremental") and snapshot_store is not None:
+        catalog_id = upload_catalog_id(job.owner, job.file_name, options.get("project", ""))
+        results, reused_count = analyze_incremental(
+            engine, snapshot_store, catalog_id, libraries, coordinates, on_result=on_result, on_partial=on_partial
+        )
+    else:
+        results = engine.analyze_all(libraries, coordinates=coordinates, on_result=on_result, on_partial=on_partial)
+    on_partial.flush()
+    metrics.finish(len(results))
+
+    return {
+        "analyzed_at": time.time(),
+        "results": [asdict(result) for result in results],
+        "reused": reused_count,
+        "deduplicated": engine.deduplicated,
+        "skipped": engine.skipped,
+        "metrics": metrics.snapshot(),
+        "metrics_prometheus": metrics.to_prometheus(),
+    }
+
+
+def worker_main(path: str, credentials: Any, stop: Any):
+    """워커 프로세스 본체: stop 이 설정될 때까지 키가 등록된 소유자의 작업을 가져와 실행"""
+    store = JobStore(path)
+    result_cache = ResultCache()
+    snapshot_store = SnapshotStore()
+    worker = f"{socket.gethostname()}:{os.getpid()}"
+
+    while not stop.is_set():
+        job = store.claim(credentials.owners(), worker)
+        if job is None:
+            stop.wait(POLL_SECONDS)
+            continue
+        api_key = credentials.api_key(job.owner)
+        rate_limiter = _SharedLimiter(credentials, job.owner)
+
+        # 라이브러리 하나가 오래 걸려도(속도 제한 대기 등) 죽은 워커로 보이지 않도록 하트비트를 따로 보낸다
+        finished = threading.Event()
+
+        def beat():
+            while not finished.wait(HEARTBEAT_SECONDS):
+                store.heartbeat(job.id)
+
+        heartbeat = threading.Thread(target=beat, daemon=True)
+        heartbeat.start()
+        try:
+            store.complete(job.id, execute_job(job, api_key, rate_limiter, store, result_cache, snapshot_store))
+        except Exception as e:
+            store.fail(job.id, str(e))
+        finally:
+            finished.set()
+            heartbeat.join()
+
+
+class _Credentials:
+    """매니저 프로세스에만 두는 소유자별 API 키와 공유 속도 제한기 (키는 디스크에 쓰지 않는다)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._keys: Dict[str, str] = {}
+        self._limiters: Dict[str, AdaptiveRateLimiter] = {}
+
+    def add(self, api_key: str, requests_per_minute: Optional[float] = None) -> str:
+        """키 등록 → 소유자 ID (requests_per_minute 를 주면 분당 요청 상한도 바꾼다, 0 = 자동)"""
+        owner = owner_id(api_key)
+        with self._lock:
+            self._keys[owner] = api_key
+            limiter = self._limiters.setdefault(owner, AdaptiveRateLimiter())
+        if requests_per_minute is not None:
+            limiter.set_request_cap(requests_per_minute or None)
+        return owner
+
+    def owners(self) -> List[str]:
+        with self._lock:
+            return list(self._keys)
+
+    def api_key(self, owner: str) -> Optional[str]:
+        with self._lock:
+            return self._keys.get(owner)
+
+    def call_limiter(self, owner: str, method: str, *args, **kwargs) -> Any:
+        with self._lock:
+            limiter = self._limiters[owner]
+        return getattr(limiter, method)(*args, **kwargs)
+
+
+class _SharedLimiter:
+    """매니저 프로세스에 있는 소유자의 속도 제한기를 AdaptiveRateLimiter 처럼 호출하는 어댑터
+
+    워커가 받은 프록시는 매니저 연결 정보가 없어 새 프록시를 돌려받을 수 없으므로 Credentials 를 거쳐 호출한다.
+    """
+
+    def __init__(self, credentials: Any, owner: str):
+        self._credentials = credentials
+        self._owner = owner
+
+    def __getattr__(self, method: str):
+        return lambda *args, **kwargs: self._credentials.call_limiter(self._owner, method, *args, **kwargs)
+
+
+class _PoolManager(BaseManager):
+    """워커 프로세스들이 함께 쓰는 API 키와 속도 제한기를 들고 있는 매니저 프로세스"""
+
+
+_PoolManager.register("Credentials", _Credentials)
+
+
+class WorkerPool:
+    def __init__(self, processes: int = DEFAULT_PROCESSES, path: Optional[str] = None):
+        """프로세스 전체가 함께 쓰는 워커 프로세스 풀 (프로세스마다 한 번에 작업 하나)
+
+        API 키는 작업을 제출할 때 받으며, 매니저 프로세스와 워커는 처음 제출하거나 작업을 이어 볼 때 띄운다.
+        """
+        self.path = path or default_job_path()
+        self.store = JobStore(self.path)
+        # 웹 서버 스레드가 있는 프로세스를 fork 하지 않도록 spawn 으로 띄운다
+        self._context = multiprocessing.get_context("spawn")
+        self._lock = threading.Lock()
+        self._manager: Optional[_PoolManager] = None
+        self._credentials: Any = None
+        self._stop: Any = None
+        self._processes: List[Any] = [None] * max(1, processes)
+
+    @property
+    def started(self) -> bool:
+        return self._manager is not None
+
+    def ensure_running(self, api_key: str, requests_per_minute: Optional[float] = None) -> str:
+        """API 키를 등록하고 (처음이면 매니저를 띄우고) 죽은 워커 프로세스를 다시 띄운다 → 소유자 ID"""
+        with self._lock:
+            if self._manager is None:
+                manager = _PoolManager(ctx=self._context)
+                manager.start()
+                self._credentials = manager.Credentials()
+                self._stop = self._context.Event()
+                self._manager = manager
+            owner = self._credentials.add(api_key, requests_per_minute)
+
+            for slot, process in enumerate(self._processes):
+                if process is None or not process.is_alive():
+                    process = self._context.Process(
+                        target=worker_main,
+                        args=(self.path, self._credentials, self._stop),
+                        name=f"libguard-worker-{slot}",
+                        daemon=True,
+                    )
+                    process.start()
+                    self._processes[slot] = process
+        return owner
+
+    def rate_limiter(self, api_key: str) -> Optional[_SharedLimiter]:
+        """키의 공유 속도 제한기 (이 키로 아직 작업을 제출하지 않았으면 None)"""
+        owner = owner_id(api_key)
+        if self._credentials is None or owner not in self._credentials.owners():
+            return None
+        return _SharedLimiter(self._credentials, owner)
+
+    @property
+    def alive(self) -> int:
+        return sum(1 for process in self._processes if process is not None and process.is_alive())
+
+    def submit(
+        self,
+        api_key: str,
+        key: str,
+        file_name: str,
+        toml_content: str,
+        options: dict,
+        requests_per_minute: Optional[float] = None,
+    ) -> Job:
+        """작업 제출 (워커가 없거나 죽어 있으면 띄운다)"""
+        owner = self.ensure_running(api_key, requests_per_minute)
+        return self.store.submit(key, owner, file_name, toml_content, options)
+
+    def shutdown(self, timeout: float = 10.0):
+        """실행 중인 작업이 끝나면 워커를 멈춘다 (끝나지 않은 작업은 다음 풀이 이어받는다)"""
+        with self._lock:
+            if self._manager is None:
+                return
+            self._stop.set()
+            for process in self._processes:
+                if process is not None:
+                    process.join(timeout)
+            self._processes = [None] * len(self._processes)
+            self._manager.shutdown()
+            self._manager = self._credentials = self._stop = None
@@ -0,0 +1,225 @@
+# 로컬 라이브러리 지식 베이스
+# Maven 좌표(group:artifact)를 키로 라이브러리 설명과 기준 최신 버전을 담은 JSON 파일이다.
+# 처음 조회할 때 한 번만 읽어서 좌표 / 카탈로그 별칭 / 정규화 이름 색인(dict)을 만들고,
+# 이후 조회는 부분 문자열 비교 없이 정확히 일치하는 항목만 상수 시간에 찾는다.
+# 네트워크 없이 덤프 파일(JSON Lines)로 갱신할 수 있다:
+#   python -m libguard kb-refresh maven-dump.jsonl
+
+import json
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Tuple
+
+from libguard.cache import default_cache_dir
+
+KNOWLEDGE_BASE_FORMAT = 1
+BUNDLED_KNOWLEDGE_BASE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "knowledge_base.json")
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]")
+
+
+def refreshed_knowledge_base_path() -> str:
+    """kb-refresh 가 기본으로 저장하는 위치"""
+    return os.path.join(default_cache_dir(), "knowledge_base.json")
+
+
+def default_knowledge_base_path() -> str:
+    """사용할 지식 베이스 (LIBGUARD_KNOWLEDGE_BASE → 갱신본 → 패키지 기본본 순서)"""
+    path = os.getenv("LIBGUARD_KNOWLEDGE_BASE")
+    if path:
+        return path
+    refreshed = refreshed_knowledge_base_path()
+    return refreshed if os.path.exists(refreshed) else BUNDLED_KNOWLEDGE_BASE_PATH
+
+
+def normalize_name(name: str) -> str:
+    """대소문자와 구분 기호를 무시한 이름 ('androidx-core' == 'androidx_core' == 'AndroidxCore')"""
+    return _NON_ALNUM.sub("", name.lower())
+
+
+@dataclass(frozen=True)
+class KnowledgeEntry:
+    coordinate: str
+    latest_version: str = ""
+    info: str = ""
+    aliases: Tuple[str, ...] = ()
+
+    def describe(self) -> str:
+        """프롬프트에 넣을 기본 정보 문장"""
+        return f"최신 버전: {self.latest_version}, 정보: {self.info}"
+
+
+class KnowledgeBase:
+    def __init__(self, path: Optional[str] = None):
+        """지식 베이스 파일 (생성 시에는 읽지 않고 첫 조회 때 한 번만 읽는다)
+
+        파일이 없으면 빈 지식 베이스로 동작한다.
+        """
+        self.path = path or default_knowledge_base_path()
+        self.version = ""
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._artifacts: Dict[str, dict] = {}
+        self._by_alias: Dict[str, str] = {}
+        self._by_name: Dict[str, Optional[str]] = {}
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            if os.path.exists(self.path):
+                data = read_knowledge_base(self.path)
+                self.version = data.get("version", "")
+                self._artifacts = data["artifacts"]
+                self._build_indexes()
+            self._loaded = True
+
+    def _build_indexes(self):
+        """별칭/정규화 이름 → 좌표 색인 (여러 좌표에 걸치는 이름은 모호하므로 None 으로 표시)"""
+        def add(index: Dict[str, Optional[str]], key: str, coordinate: str):
+            if key and index.setdefault(key, coordinate) != coordinate:
+                index[key] = None
+
+        for coordinate, record in self._artifacts.items():
+            artifact = coordinate.split(":", 1)[-1]
+            add(self._by_name, normalize_name(artifact), coordinate)
+            for alias in record.get("aliases", ()):
+                add(self._by_alias, alias.lower(), coordinate)
+                add(self._by_name, normalize_name(alias), coordinate)
+
+        self._by_alias = {key: value for key, value in self._by_alias.items() if value is not None}
+
+    def __len__(self) -> int:
+        self._ensure_loaded()
+        return len(self._artifacts)
+
+    def get(self, coordinate: str) -> Optional[KnowledgeEntry]:
+        """group:artifact 좌표로 정확히 조회"""
+        self._ensure_loaded()
+        record = self._artifacts.get(coordinate)
+        if record is None:
+            return None
+        return KnowledgeEntry(
+            coordinate=coordinate,
+            latest_version=record.get("latest_version", ""),
+            info=record.get("info", ""),
+            aliases=tuple(record.get("aliases", ())),
+        )
+
+    def lookup(self, coordinate: str = "", name: str = "") -> Optional[KnowledgeEntry]:
+        """좌표 → 카탈로그 별칭 → 정규화 이름 순서로 정확히 일치하는 항목 조회
+
+        좌표를 알면 좌표로만 찾는다 (같은 별칭의 다른 라이브러리와 섞이지 않도록).
+        """
+        self._ensure_loaded()
+        if coordinate:
+            return self.get(coordinate)
+        if not name:
+            return None
+
+        target = self._by_alias.get(name.lower()) or self._by_name.get(normalize_name(name))
+        return self.get(target) if target else None
+
+
+def read_knowledge_base(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    if not isinstance(data, dict) or data.get("format") != KNOWLEDGE_BASE_FORMAT:
+        raise ValueError(f"지원하지 않는 지식 베이스 형식입니다: {path}")
+    data.setdefault("artifacts", {})
+    return data
+
+
+def write_knowledge_base(path: str, artifacts: Dict[str, dict], version: Optional[str] = None):
+    """좌표 순으로 정렬해 저장 (임시 파일에 쓴 뒤 교체하므로 읽는 쪽이 반쯤 쓴 파일을 보지 않는다)"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    data = {
+        "format": KNOWLEDGE_BASE_FORMAT,
+        "version": version or time.strftime("%Y-%m-%d"),
+        "artifacts": {coordinate: artifacts[coordinate] for coordinate in sorted(artifacts)},
+    }
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=1)
+        f.write("\n")
+    os.replace(temp_path, path)
+
+
+def _dump_record(line: dict) -> Optional[Tuple[str, dict]]:
+    """덤프 한 줄 해석: 지식 베이스 항목 또는 Maven Central 검색 문서(g/a/latestVersion)"""
+    coordinate = line.get("coordinate") or (
+        f"{line['g']}:{line['a']}" if line.get("g") and line.get("a") else ""
+    )
+    if ":" not in coordinate:
+        return None
+
+    record = {}
+    latest_version = line.get("latest_version") or line.get("latestVersion") or line.get("v")
+    if latest_version:
+        record["latest_version"] = str(latest_version)
+    if line.get("info"):
+        record["info"] = str(line["info"])
+    if line.get("aliases"):
+        record["aliases"] = [str(alias) for alias in line["aliases"]]
+    return coordinate, record
+
+
+def merge_dump(artifacts: Dict[str, dict], lines: Iterable[str]) -> int:
+    """덤프 줄들을 artifacts 에 병합하고 반영한 줄 수를 반환
+
+    덤프에 없는 필드(설명, 별칭)는 기존 값을 유지한다.
+    """
+    merged = 0
+    for raw in lines:
+        raw = raw.strip()
+        if not raw:
+            continue
+        parsed = _dump_record(json.loads(raw))
+        if parsed is None:
+            continue
+        coordinate, record = parsed
+        artifacts.setdefault(coordinate, {}).update(record)
+        merged += 1
+    return merged
+
+
+def refresh_knowledge_base(
+    dump_path: str,
+    output_path: Optional[str] = None,
+    base_path: Optional[str] = None,
+    replace: bool = False,
+) -> Tuple[str, int, int]:
+    """덤프 파일로 지식 베이스를 갱신하고 (저장 경로, 반영한 줄 수, 전체 항목 수)를 반환
+
+    replace 가 아니면 base_path(기본: 현재 사용 중인 지식 베이스) 내용에 덮어쓴다.
+    """
+    output_path = output_path or refreshed_knowledge_base_path()
+    base_path = base_path or default_knowledge_base_path()
+
+    artifacts: Dict[str, dict] = {}
+    if not replace and os.path.exists(base_path):
+        artifacts = read_knowledge_base(base_path)["artifacts"]
+
+    with open(dump_path, encoding="utf-8") as f:
+        merged = merge_dump(artifacts, f)
+
+    write_knowledge_base(output_path, artifacts)
+    return output_path, merged, len(artifacts)
+
+
+_default_knowledge_base: Optional[KnowledgeBase] = None
+_default_lock = threading.Lock()
+
+
+def get_knowledge_base() -> KnowledgeBase:
+    """프로세스 전체가 공유하는 기본 지식 베이스"""
+    global _default_knowledge_base
+    with _default_lock:
+        if _default_knowledge_base is None:
+            _default_knowledge_base = KnowledgeBase()
+        return _default_knowledge_base
@@ -0,0 +1,328 @@
+# Maven 저장소 maven-metadata.xml 기반 버전 이력 색인
+# 검색 API 는 latestVersion 하나만 주므로 "몇 개 릴리스 뒤처졌는지", "현재 라인에 패치가 나왔는지" 를 알 수 없다.
+# 좌표마다 maven-metadata.xml 을 받아 iterparse 로 스트리밍 파싱하고(전체 트리를 만들지 않음)
+# Maven 순서로 정렬한 버전 목록을 SQLite 에 저장한다.
+#   - 갱신은 ETag / Last-Modified 조건부 GET 이라 바뀌지 않았으면 304 응답 하나로 끝난다
+#   - 저장소에 없는 좌표(404)도 기록해 max_age 동안 다시 묻지 않는다
+#   - 색인(VersionIndex)은 정렬된 키와 라인별 최신 버전을 미리 만들어 두고 이진 탐색으로 답한다
+
+import bisect
+import os
+import sqlite3
+import threading
+import time
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from typing import BinaryIO, Dict, List, Optional, Tuple
+
+from libguard.cache import default_cache_dir
+from libguard.http_pool import MAVEN, request_with_retry
+from libguard.metrics import RunMetrics
+from libguard.singleflight import SingleFlight
+from libguard.versions import ComparableVersion, is_prerelease, numeric_parts
+
+MAVEN_REPOSITORY_URL = "https://repo1.maven.org/maven2"
+METADATA_FILE = "maven-metadata.xml"
+# 이 시간 안에 확인한 색인은 요청 없이 그대로 쓴다
+DEFAULT_MAX_AGE_SECONDS = 6 * 60 * 60
+
+# refresh 결과
+CACHED = "cached"              # max_age 안이라 요청하지 않음
+NOT_MODIFIED = "not-modified"  # 304
+UPDATED = "updated"            # 200 (새 내용)
+MISSING = "missing"            # 404 (저장소에 없는 좌표)
+
+METADATA_FLIGHTS = SingleFlight()
+
+
+def default_metadata_path() -> str:
+    return os.path.join(default_cache_dir(), "metadata.sqlite3")
+
+
+def metadata_url(coordinate: str, repository_url: str = MAVEN_REPOSITORY_URL) -> str:
+    """group:artifact → 저장소의 maven-metadata.xml 주소"""
+    group, artifact = coordinate.split(":", 1)
+    return f"{repository_url.rstrip('/')}/{group.replace('.', '/')}/{artifact}/{METADATA_FILE}"
+
+
+def parse_metadata(source: BinaryIO) -> Tuple[List[str], str, str]:
+    """maven-metadata.xml 스트림 → (버전 목록, release, lastUpdated)
+
+    <versioning><versions><version> 만 버전으로 읽는다 (최상위 <version> 은 무시).
+    """
+    versions: List[str] = []
+    release = last_updated = ""
+    path: List[str] = []
+
+    for event, element in ET.iterparse(source, events=("start", "end")):
+        tag = element.tag.rsplit("}", 1)[-1]
+        if event == "start":
+            path.append(tag)
+            continue
+
+        path.pop()
+        parent = path[-1] if path else ""
+        text = (element.text or "").strip()
+        if tag == "version" and parent == "versions" and text:
+            versions.append(text)
+        elif tag == "release" and parent == "versioning":
+            release = text
+        elif tag == "lastUpdated" and parent == "versioning":
+            last_updated = text
+        # 읽은 요소는 버려서 메모리를 일정하게 유지
+        element.clear()
+
+    return versions, release, last_updated
+
+
+class VersionIndex:
+    def __init__(
+        self,
+        coordinate: str,
+        versions: List[str],
+        release: str = "",
+        last_updated: str = "",
+        presorted: bool = False,
+    ):
+        """좌표 하나의 정렬된 버전 이력
+
+        versions 는 순서와 관계없이 받아 Maven 순서로 정렬한다 (저장소에서 읽은 목록처럼 이미 정렬돼 있으면 presorted).
+        """
+        self.coordinate = coordinate
+        self.release = release
+        self.last_updated = last_updated
+
+        if presorted:
+            keyed = [ComparableVersion(version) for version in versions]
+        else:
+            keyed = sorted({ComparableVersion(version) for version in versions})
+        self.versions = [key.value for key in keyed]
+        self._keys = keyed
+        self._stable_keys = [key for key in keyed if not is_prerelease(key.value)]
+        # (major, minor) 라인별 최신 정식 버전
+        self._line_latest: Dict[Tuple[int, int], ComparableVersion] = {}
+        for key in self._stable_keys:
+            self._line_latest[self._line(key.value)] = key
+
+    @staticmethod
+    def _line(version: str) -> Tuple[int, int]:
+        parts = numeric_parts(version) + (0, 0)
+        return parts[0], parts[1]
+
+    def __len__(self) -> int:
+        return len(self.versions)
+
+    def __contains__(self, version: str) -> bool:
+        key = ComparableVersion(version)
+        position = bisect.bisect_left(self._keys, key)
+        return position < len(self._keys) and self._keys[position] == key
+
+    def latest(self, include_prereleases: bool = False) -> str:
+        """최신 버전 (기본: 정식 릴리스 중에서)"""
+        keys = self._keys if include_prereleases else self._stable_keys
+        return keys[-1].value if keys else ""
+
+    def newer(self, current: str, include_prereleases: bool = False) -> List[str]:
+        """current 보다 새 버전 (오름차순)"""
+        keys = self._keys if include_prereleases else self._stable_keys
+        return [key.value for key in keys[bisect.bisect_right(keys, ComparableVersion(current)):]]
+
+    def releases_behind(self, current: str) -> int:
+        """current 이후 나온 정식 릴리스 수"""
+        return len(self._stable_keys) - bisect.bisect_right(self._stable_keys, ComparableVersion(current))
+
+    def latest_patch(self, current: str) -> str:
+        """current 와 같은 major.minor 라인의 더 새 정식 버전 중 최신 (없으면 빈 문자열)"""
+        key = self._line_latest.get(self._line(current))
+        return key.value if key is not None and key > ComparableVersion(current) else ""
+
+    def between(self, current: str, latest: str = "", include_prereleases: bool = False) -> List[str]:
+        """current 초과 latest 이하 버전 (latest 를 주지 않으면 최신까지)"""
+        keys = self._keys if include_prereleases else self._stable_keys
+        start = bisect.bisect_right(keys, ComparableVersion(current))
+        end = bisect.bisect_right(keys, ComparableVersion(latest)) if latest else len(keys)
+        return [key.value for key in keys[start:end]]
+
+    def describe(self, current: str) -> str:
+        """프롬프트/리포트용 한 줄 요약"""
+        behind = self.releases_behind(current)
+        if not behind:
+            return f"릴리스 이력: 정식 릴리스 {len(self._stable_keys)}개 중 최신 사용 중"
+        text = f"릴리스 이력: 현재 버전 이후 정식 릴리스 {behind}개"
+        patch = self.latest_patch(current)
+        if patch:
+            major, minor = self._line(current)
+            text += f", 현재 라인({major}.{minor}) 최신 패치 {patch}"
+        return text
+
+
+@dataclass
+class FetchResult:
+    coordinate: str
+    status: str
+    index: Optional[VersionIndex] = None
+
+
+class MetadataStore:
+    def __init__(self, path: Optional[str] = None):
+        """좌표별 maven-metadata.xml 색인과 조건부 요청 헤더 저장소"""
+        self.path = path or default_metadata_path()
+        self._lock = threading.Lock()
+
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS artifact_versions (
+                    coordinate TEXT PRIMARY KEY,
+                    versions TEXT NOT NULL,
+                    release TEXT NOT NULL,
+                    last_updated TEXT NOT NULL,
+                    etag TEXT NOT NULL,
+                    last_modified TEXT NOT NULL,
+                    missing INTEGER NOT NULL,
+                    checked_at REAL NOT NULL
+                )
+                """
+            )
+
+    def load(self, coordinate: str) -> Optional[dict]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT versions, release, last_updated, etag, last_modified, missing, checked_at "
+                "FROM artifact_versions WHERE coordinate = ?",
+                (coordinate,),
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            # 정렬된 순서로 저장하므로 줄 단위로 나누기만 하면 된다
+            "versions": row[0].split("\n") if row[0] else [],
+            "release": row[1],
+            "last_updated": row[2],
+            "etag": row[3],
+            "last_modified": row[4],
+            "missing": bool(row[5]),
+            "checked_at": row[6],
+        }
+
+    def save(
+        self,
+        coordinate: str,
+        versions: List[str],
+        release: str = "",
+        last_updated: str = "",
+        etag: str = "",
+        last_modified: str = "",
+        missing: bool = False,
+    ):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO artifact_versions "
+                "(coordinate, versions, release, last_updated, etag, last_modified, missing, checked_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (coordinate, "\n".join(versions), release, last_updated, etag, last_modified, int(missing), time.time()),
+            )
+
+    def touch(self, coordinate: str):
+        """304 응답: 내용은 그대로 두고 확인 시각만 갱신"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE artifact_versions SET checked_at = ? WHERE coordinate = ?", (time.time(), coordinate)
+            )
+
+    def coordinates(self) -> List[str]:
+        with self._lock:
+            return [row[0] for row in self._conn.execute("SELECT coordinate FROM artifact_versions")]
+
+
+class MetadataFetcher:
+    def __init__(
+        self,
+        store: Optional[MetadataStore] = None,
+        repository_url: Optional[str] = None,
+        max_age: float = DEFAULT_MAX_AGE_SECONDS,
+        metrics: Optional[RunMetrics] = None,
+    ):
+        """maven-metadata.xml 조회기 (여러 스레드가 공유, 같은 좌표의 동시 요청은 하나로 합친다)"""
+        self.store = store or MetadataStore()
+        self.repository_url = repository_url or os.getenv("LIBGUARD_MAVEN_REPOSITORY_URL", MAVEN_REPOSITORY_URL)
+        self.max_age = max_age
+        self.metrics = metrics
+        self._lock = threading.Lock()
+        # 저장소에서 읽은 색인 (내용이 같으면 다시 정렬하지 않는다)
+        self._indexes: Dict[str, Tuple[tuple, VersionIndex]] = {}
+
+    def get(self, coordinate: str) -> Optional[VersionIndex]:
+        """버전 색인 (max_age 안이면 요청 없이, 아니면 조건부 GET 후), 저장소에 없거나 조회 실패면 None"""
+        try:
+            return self.refresh(coordinate).index
+        except Exception:
+            return None
+
+    def refresh(self, coordinate: str, force: bool = False) -> FetchResult:
+        """색인 갱신 (force 면 max_age 와 관계없이 조건부 GET), 네트워크 오류는 호출자에게 전달"""
+        stored = self.store.load(coordinate)
+        if not force and stored is not None and time.time() - stored["checked_at"] < self.max_age:
+            return FetchResult(coordinate, MISSING if stored["missing"] else CACHED, self._index(coordinate, stored))
+        return METADATA_FLIGHTS.do((self.repository_url, coordinate), self._fetch, coordinate, stored)
+
+    def _fetch(self, coordinate: str, stored: Optional[dict]) -> FetchResult:
+        headers = {}
+        if stored is not None and stored["etag"]:
+            headers["If-None-Match"] = stored["etag"]
+        if stored is not None and stored["last_modified"]:
+            headers["If-Modified-Since"] = stored["last_modified"]
+
+        started = time.perf_counter()
+        status = "error"
+        try:
+            response = request_with_retry(
+                MAVEN, "GET", metadata_url(coordinate, self.repository_url), headers=headers, timeout=10, stream=True
+            )
+            status = str(response.status_code)
+            try:
+                if response.status_code == 304 and stored is not None:
+                    self.store.touch(coordinate)
+                    stored = self.store.load(coordinate)
+                    return FetchResult(coordinate, NOT_MODIFIED, self._index(coordinate, stored))
+                if response.status_code == 404:
+                    self.store.save(coordinate, [], missing=True)
+                    return FetchResult(coordinate, MISSING)
+                response.raise_for_status()
+
+                response.raw.decode_content = True
+                versions, release, last_updated = parse_metadata(response.raw)
+            finally:
+                response.close()
+        finally:
+            if self.metrics is not None:
+                self.metrics.record_http(MAVEN, status, time.perf_counter() - started)
+
+        index = VersionIndex(coordinate, versions, release, last_updated)
+        self.store.save(
+            coordinate, index.versions, release, last_updated,
+            etag=response.headers.get("ETag", ""), last_modified=response.headers.get("Last-Modified", ""),
+        )
+        with self._lock:
+            self._indexes.pop(coordinate, None)
+        return FetchResult(coordinate, UPDATED, index)
+
+    def _index(self, coordinate: str, stored: dict) -> Optional[VersionIndex]:
+        if stored["missing"]:
+            return None
+        marker = (stored["etag"], stored["last_modified"], stored["last_updated"], len(stored["versions"]))
+        with self._lock:
+            cached = self._indexes.get(coordinate)
+            if cached is not None and cached[0] == marker:
+                return cached[1]
+        index = VersionIndex(
+            coordinate, stored["versions"], stored["release"], stored["last_updated"], presorted=True
+        )
+        with self._lock:
+            self._indexes[coordinate] = (marker, index)
+        return index
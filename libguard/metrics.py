@@ -0,0 +1,198 @@
+# 분석 실행 계측
+# 단계별(캐시 / Maven / 지식 베이스 / 보안 색인 / AI) 소요 시간, 업스트림별 HTTP 호출,
+# OpenAI usage 의 프롬프트/응답 토큰, 캐시 적중을 모아 예상 비용과 함께 보여준다.
+# 같은 데이터를 JSON 실행 로그와 Prometheus 텍스트 형식으로 내보낼 수 있어
+# 야간 실행의 지연/비용 추이를 지켜볼 수 있다.
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+STAGE_CACHE = "cache"
+STAGE_MAVEN = "maven"
+STAGE_KNOWLEDGE = "knowledge"
+STAGE_SECURITY = "security"
+STAGE_LLM = "llm"
+
+# 모델별 1K 토큰당 가격 (USD, 입력 / 출력)
+MODEL_PRICES_PER_1K: Dict[str, Tuple[float, float]] = {
+    "gpt-3.5-turbo": (0.0005, 0.0015),
+    "gpt-4o-mini": (0.00015, 0.0006),
+    "gpt-4o": (0.0025, 0.01),
+}
+
+QUANTILES = (0.5, 0.95)
+
+
+def _quantile(samples: List[float], fraction: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def _timing_summary(samples: List[float]) -> dict:
+    return {
+        "count": len(samples),
+        "total_seconds": round(sum(samples), 6),
+        "p50_seconds": round(_quantile(samples, 0.5), 6),
+        "p95_seconds": round(_quantile(samples, 0.95), 6),
+        "max_seconds": round(max(samples), 6) if samples else 0.0,
+    }
+
+
+def _label_value(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class RunMetrics:
+    def __init__(self, model: str = ""):
+        """분석 한 번(또는 CLI 스캔 한 번)의 계측값 (여러 스레드가 함께 기록)"""
+        self.model = model
+        self.started_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.libraries = 0
+        self._lock = threading.Lock()
+        self._stages: Dict[str, List[float]] = {}
+        self._http: Dict[Tuple[str, str], List[float]] = {}
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.llm_calls = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """with 블록의 소요 시간을 단계별로 기록"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_stage(name, time.perf_counter() - started)
+
+    def record_stage(self, name: str, seconds: float):
+        with self._lock:
+            self._stages.setdefault(name, []).append(seconds)
+
+    def record_http(self, upstream: str, status: str, seconds: float):
+        """HTTP 호출 한 번 (status 는 응답 코드 또는 'error')"""
+        with self._lock:
+            self._http.setdefault((upstream, str(status)), []).append(seconds)
+
+    def record_usage(self, usage: Optional[dict]):
+        """OpenAI 응답의 usage 블록 (없으면 호출 횟수만 센다)"""
+        with self._lock:
+            self.llm_calls += 1
+            if usage:
+                self.prompt_tokens += int(usage.get("prompt_tokens") or 0)
+                self.completion_tokens += int(usage.get("completion_tokens") or 0)
+
+    def record_cache(self, hit: bool):
+        with self._lock:
+            if hit:
+                self.cache_hits += 1
+            else:
+                self.cache_misses += 1
+
+    def finish(self, libraries: Optional[int] = None):
+        """실행 종료 시각과 분석한 라이브러리 수 기록"""
+        with self._lock:
+            self.finished_at = time.time()
+            if libraries is not None:
+                self.libraries = libraries
+
+    def estimated_cost(self) -> Optional[float]:
+        """기록된 토큰으로 계산한 비용 (USD, 가격을 모르는 모델이면 None)"""
+        prices = MODEL_PRICES_PER_1K.get(self.model)
+        if prices is None:
+            return None
+        return (self.prompt_tokens * prices[0] + self.completion_tokens * prices[1]) / 1000
+
+    def snapshot(self) -> dict:
+        """JSON 으로 저장할 수 있는 요약"""
+        with self._lock:
+            stages = {name: _timing_summary(samples) for name, samples in sorted(self._stages.items())}
+            http = [
+                {"upstream": upstream, "status": status, **_timing_summary(samples)}
+                for (upstream, status), samples in sorted(self._http.items())
+            ]
+            finished_at = self.finished_at or time.time()
+            data = {
+                "model": self.model,
+                "started_at": time.strftime("%Y-%m-%dT%H:%M:%S%z", time.localtime(self.started_at)),
+                "duration_seconds": round(finished_at - self.started_at, 3),
+                "libraries": self.libraries,
+                "llm_calls": self.llm_calls,
+                "prompt_tokens": self.prompt_tokens,
+                "completion_tokens": self.completion_tokens,
+                "cache_hits": self.cache_hits,
+                "cache_misses": self.cache_misses,
+                "stages": stages,
+                "http": http,
+            }
+
+        cost = self.estimated_cost()
+        data["estimated_cost_usd"] = round(cost, 6) if cost is not None else None
+        return data
+
+    def to_json(self) -> str:
+        """실행 로그 (JSON)"""
+        return json.dumps(self.snapshot(), ensure_ascii=False, indent=2)
+
+    def to_prometheus(self, prefix: str = "libguard") -> str:
+        """Prometheus 텍스트 형식 (node_exporter textfile 수집기 등에 그대로 쓸 수 있다)"""
+        with self._lock:
+            stages = {name: list(samples) for name, samples in self._stages.items()}
+            http = {key: list(samples) for key, samples in self._http.items()}
+
+        lines: List[str] = []
+
+        def summary(name: str, help_text: str, series: Dict[str, List[float]]):
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} summary")
+            for labels, samples in sorted(series.items()):
+                for quantile in QUANTILES:
+                    lines.append(
+                        f'{prefix}_{name}{{{labels},quantile="{quantile}"}} {_quantile(samples, quantile):.6f}'
+                    )
+                lines.append(f"{prefix}_{name}_sum{{{labels}}} {sum(samples):.6f}")
+                lines.append(f"{prefix}_{name}_count{{{labels}}} {len(samples)}")
+
+        def simple(name: str, kind: str, help_text: str, values: Dict[str, float]):
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            for labels, value in sorted(values.items()):
+                lines.append(f"{prefix}_{name}{{{labels}}} {value}" if labels else f"{prefix}_{name} {value}")
+
+        summary(
+            "stage_duration_seconds", "Time spent in each analysis stage.",
+            {f'stage="{_label_value(name)}"': samples for name, samples in stages.items()},
+        )
+        summary(
+            "http_request_duration_seconds", "Upstream HTTP request latency.",
+            {
+                f'upstream="{_label_value(upstream)}",status="{_label_value(status)}"': samples
+                for (upstream, status), samples in http.items()
+            },
+        )
+        model = f'model="{_label_value(self.model)}"'
+        simple("llm_calls_total", "counter", "Chat completion calls.", {model: self.llm_calls})
+        simple("tokens_total", "counter", "Tokens reported by the API usage block.", {
+            f'{model},kind="prompt"': self.prompt_tokens,
+            f'{model},kind="completion"': self.completion_tokens,
+        })
+        simple("cache_lookups_total", "counter", "Result cache lookups.", {
+            'result="hit"': self.cache_hits,
+            'result="miss"': self.cache_misses,
+        })
+        cost = self.estimated_cost()
+        if cost is not None:
+            simple("estimated_cost_usd", "gauge", "Estimated API cost of the run.", {model: round(cost, 6)})
+        simple("libraries_analyzed", "gauge", "Libraries in the run.", {"": self.libraries})
+        finished_at = self.finished_at or time.time()
+        simple("run_duration_seconds", "gauge", "Wall-clock duration of the run.", {
+            "": round(finished_at - self.started_at, 3),
+        })
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,223 @@
+# OpenAI 응답 헤더 기반 적응형 속도 제한기
+# 요청 수 / 토큰 수 두 개의 토큰 버킷으로 호출 속도를 맞춘다.
+#   - 한도는 처음엔 알 수 없으므로 제한 없이 시작하고, x-ratelimit-* 헤더를 받을 때마다 학습한다
+#   - 429 응답의 Retry-After 만큼 모든 호출을 멈추고 분당 요청 한도를 낮춘 뒤,
+#     429 없이 한 창(1분)이 지날 때마다 서버/사용자 한도까지 다시 올린다
+
+import re
+import threading
+import time
+from typing import Mapping, Optional
+
+# OpenAI 의 요청/토큰 한도는 분 단위
+LIMIT_WINDOW_SECONDS = 60.0
+DEFAULT_THROTTLE_SECONDS = 5.0
+MAX_WAIT_SLICE_SECONDS = 1.0
+# 429 를 받으면 분당 요청 한도에 곱하는 배율, 429 없이 RECOVERY_WINDOW_SECONDS 가 지날 때마다 곱하는 배율
+THROTTLE_BACKOFF = 0.5
+RECOVERY_FACTOR = 1.5
+RECOVERY_WINDOW_SECONDS = LIMIT_WINDOW_SECONDS
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+
+
+class RateLimitExceeded(Exception):
+    def __init__(self, retry_after: float = DEFAULT_THROTTLE_SECONDS, message: str = ""):
+        """429 로 거절된 요청 (호출자가 retry_after 초 뒤 다시 시도해야 함)"""
+        super().__init__(message or f"API 호출 제한 (재시도까지 {retry_after:.1f}초)")
+        self.retry_after = retry_after
+
+
+def parse_duration(value: Optional[str]) -> Optional[float]:
+    """'1s', '6m0s', '20ms', '1h2m3.5s', '30' 형태의 기간을 초로 변환"""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+
+    parts = _DURATION_PART.findall(value)
+    if not parts:
+        return None
+    scale = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+    return sum(float(number) * scale[unit] for number, unit in parts)
+
+
+def parse_retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    """Retry-After(초) 또는 retry-after-ms 헤더 해석"""
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return float(retry_after_ms) / 1000.0
+        except ValueError:
+            pass
+    return parse_duration(headers.get("retry-after"))
+
+
+class _Bucket:
+    def __init__(self, capacity: Optional[float] = None):
+        """capacity 가 None 이면 제한 없음"""
+        self.capacity = capacity
+        self.level = capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float):
+        if self.capacity is None:
+            return
+        rate = self.capacity / LIMIT_WINDOW_SECONDS
+        self.level = min(self.capacity, self.level + (now - self.updated) * rate)
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """amount 만큼 꺼내려면 기다려야 하는 시간"""
+        if self.capacity is None:
+            return 0.0
+        self._refill(now)
+        amount = min(amount, self.capacity)
+        if self.level >= amount:
+            return 0.0
+        return (amount - self.level) * LIMIT_WINDOW_SECONDS / self.capacity
+
+    def take(self, amount: float):
+        if self.capacity is not None:
+            self.level -= min(amount, self.capacity)
+
+    def resize(self, capacity: Optional[float], now: float):
+        """용량 변경 (늘려도 잔량은 그대로 두고 새 속도로 채운다, None 이면 제한 없음)"""
+        self._refill(now)
+        if capacity is None:
+            self.capacity = self.level = None
+        else:
+            self.level = capacity if self.capacity is None else min(self.level, capacity)
+            self.capacity = capacity
+        self.updated = now
+
+    def observe(self, limit: Optional[float], remaining: Optional[float], now: float):
+        """서버가 알려준 한도/잔량으로 버킷 보정"""
+        if limit is not None and limit > 0:
+            if self.capacity is None:
+                self.level = limit
+            self.capacity = limit
+            self.level = min(self.level, limit)
+        if remaining is not None and self.capacity is not None:
+            self._refill(now)
+            self.level = min(self.level, remaining)
+
+
+class AdaptiveRateLimiter:
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+    ):
+        """요청/토큰 토큰 버킷 (여러 스레드·분석기가 하나를 공유)
+
+        한도를 주지 않으면 응답 헤더에서 배울 때까지 최대 속도로 호출한다.
+        """
+        self._lock = threading.Lock()
+        self._requests = _Bucket(requests_per_minute)
+        self._tokens = _Bucket(tokens_per_minute)
+        self._paused_until = 0.0
+        self.requests_cap = requests_per_minute
+        self.throttled = 0
+        # 헤더로 배운 서버 한도, 429 로 낮춘 한도와 그 시각
+        self._server_limit: Optional[float] = None
+        self._backoff_limit: Optional[float] = None
+        self._backoff_since = 0.0
+
+    def _request_capacity(self, backoff: bool = True) -> Optional[float]:
+        limits = [self._server_limit, self.requests_cap, self._backoff_limit if backoff else None]
+        limits = [limit for limit in limits if limit]
+        return min(limits) if limits else None
+
+    def _recover(self, now: float):
+        """429 없이 한 창이 지날 때마다 낮춘 한도를 RECOVERY_FACTOR 배씩 되돌린다"""
+        if self._backoff_limit is None or now - self._backoff_since < RECOVERY_WINDOW_SECONDS:
+            return
+        self._backoff_since = now
+        self._backoff_limit *= RECOVERY_FACTOR
+        ceiling = self._request_capacity(backoff=False)
+        if ceiling is None or self._backoff_limit >= ceiling:
+            self._backoff_limit = None
+        self._requests.resize(self._request_capacity(), now)
+
+    def set_request_cap(self, requests_per_minute: Optional[float]):
+        """사용자가 지정한 분당 요청 상한 (올리면 헤더로 배운 서버 한도까지, None 이면 서버 한도만 사용)"""
+        with self._lock:
+            self.requests_cap = requests_per_minute or None
+            self._requests.resize(self._request_capacity(), time.monotonic())
+
+    def acquire(self, tokens: int = 0):
+        """요청 1건과 예상 토큰 수만큼 여유가 생길 때까지 대기"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._recover(now)
+                wait = max(
+                    self._paused_until - now,
+                    self._requests.wait_time(1, now),
+                    self._tokens.wait_time(tokens, now),
+                )
+                if wait <= 0:
+                    self._requests.take(1)
+                    self._tokens.take(tokens)
+                    return
+            time.sleep(min(wait, MAX_WAIT_SLICE_SECONDS))
+
+    def update_from_headers(self, headers: Mapping[str, str]):
+        """x-ratelimit-limit/remaining-requests/tokens 헤더로 한도와 잔량 학습"""
+        def number(name: str) -> Optional[float]:
+            try:
+                return float(headers[name])
+            except (KeyError, TypeError, ValueError):
+                return None
+
+        with self._lock:
+            now = time.monotonic()
+            request_limit = number("x-ratelimit-limit-requests")
+            if request_limit is not None and request_limit > 0:
+                self._server_limit = request_limit
+            self._recover(now)
+            self._requests.resize(self._request_capacity(), now)
+            self._requests.observe(None, number("x-ratelimit-remaining-requests"), now)
+            self._tokens.observe(
+                number("x-ratelimit-limit-tokens"), number("x-ratelimit-remaining-tokens"), now
+            )
+
+            # 잔량이 0 이면 reset 시각까지 멈춘다
+            for kind in ("requests", "tokens"):
+                if number(f"x-ratelimit-remaining-{kind}") == 0:
+                    reset = parse_duration(headers.get(f"x-ratelimit-reset-{kind}"))
+                    if reset:
+                        self._paused_until = max(self._paused_until, now + reset)
+
+    def on_throttled(self, retry_after: Optional[float] = None) -> float:
+        """429 응답 처리: 모든 호출을 retry_after 초 동안 멈추고 분당 요청 한도를 낮춘 뒤 실제 대기 시간을 반환"""
+        delay = retry_after if retry_after and retry_after > 0 else DEFAULT_THROTTLE_SECONDS
+        with self._lock:
+            now = time.monotonic()
+            self._paused_until = max(self._paused_until, now + delay)
+            self.throttled += 1
+            if self._requests.capacity:
+                self._backoff_limit = max(1.0, self._requests.capacity * THROTTLE_BACKOFF)
+                self._backoff_since = now
+                self._requests.resize(self._request_capacity(), now)
+        return delay
+
+    def snapshot(self) -> dict:
+        """현재 학습된 한도와 잔량 (UI 표시용)"""
+        with self._lock:
+            now = time.monotonic()
+            self._recover(now)
+            for bucket in (self._requests, self._tokens):
+                bucket._refill(now)
+            return {
+                "requests_per_minute": self._requests.capacity,
+                "requests_remaining": self._requests.level,
+                "tokens_per_minute": self._tokens.capacity,
+                "tokens_remaining": self._tokens.level,
+                "paused_for": max(0.0, self._paused_until - now),
+                "throttled": self.throttled,
+            }
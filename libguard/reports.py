@@ -0,0 +1,406 @@
+# 분석 리포트 작성기 (Markdown / JSON Lines / SARIF / HTML)
+# 결과를 다 모은 뒤 문자열을 이어 붙이지 않고, LibraryInfo 가 완료될 때마다 출력 스트림(파일, StringIO)에 바로 쓴다.
+# 전체 결과가 있어야 하는 요약(핫픽스 목록, 개수)은 이름만 모아 두었다가 마지막에 쓴다.
+# 여러 스레드가 하나의 작성기에 함께 쓸 수 있다 (CLI 의 카탈로그 병렬 분석).
+#
+# SARIF 는 GitHub code scanning 등에 그대로 올릴 수 있고, HTML 은 한 번에 page_size 개씩만 보여준다.
+
+import html
+import io
+import json
+import re
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterable, List, Optional, TextIO, Type
+
+from libguard.analyzer import LibraryInfo
+from libguard.catalog import parse_catalog
+from libguard.versions import UP_TO_DATE, UPDATE_TYPE_LABELS
+
+REPORT_TITLE = "🛡️ LibGuard 라이브러리 업데이트 분석 리포트"
+DEFAULT_HTML_PAGE_SIZE = 50
+
+SARIF_VERSION = "2.1.0"
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+RULE_VULNERABLE = "LG001"
+RULE_HOTFIX = "LG002"
+RULE_OUTDATED = "LG003"
+SARIF_RULES = [
+    {
+        "id": RULE_VULNERABLE,
+        "name": "VulnerableDependency",
+        "shortDescription": {"text": "현재 버전에 보안 권고가 있는 의존성"},
+        "defaultConfiguration": {"level": "error"},
+    },
+    {
+        "id": RULE_HOTFIX,
+        "name": "HotfixAvailable",
+        "shortDescription": {"text": "핫픽스(패치) 업데이트가 있는 의존성"},
+        "defaultConfiguration": {"level": "warning"},
+    },
+    {
+        "id": RULE_OUTDATED,
+        "name": "OutdatedDependency",
+        "shortDescription": {"text": "새 버전이 있는 의존성"},
+        "defaultConfiguration": {"level": "note"},
+    },
+]
+
+_TABLE_HEADER = re.compile(r"^\s*\[\s*([A-Za-z0-9_.-]+)\s*\]")
+_TABLE_KEY = re.compile(r"^\s*(?:\"([^\"]+)\"|([A-Za-z0-9_.-]+))\s*=")
+
+
+@dataclass(frozen=True)
+class ReportLocation:
+    path: str
+    line: int = 0
+    coordinate: str = ""  # group:artifact (모르면 빈 문자열)
+
+
+def catalog_locations(path: str, toml_content: str) -> Dict[str, ReportLocation]:
+    """카탈로그 항목 키(okhttp, plugins.kotlin-android) → 선언 위치와 좌표 (SARIF / 리포트 표시용)"""
+    try:
+        coordinates = {entry.key: entry.coordinate for entry in parse_catalog(toml_content).entries()}
+    except ValueError:
+        coordinates = {}
+    locations: Dict[str, ReportLocation] = {}
+    table = ""
+    for number, line in enumerate(toml_content.splitlines(), 1):
+        header = _TABLE_HEADER.match(line)
+        if header:
+            table = header.group(1)
+            continue
+        key = _TABLE_KEY.match(line)
+        if key and table in ("libraries", "plugins"):
+            alias = key.group(1) or key.group(2)
+            name = alias if table == "libraries" else f"plugins.{alias}"
+            locations.setdefault(name, ReportLocation(path, number, coordinates.get(name, "")))
+    return locations
+
+
+class ReportWriter:
+    format = ""
+    extension = ""
+    mime = "text/plain"
+
+    def __init__(self, out: TextIO, analyzed_at: Optional[float] = None):
+        """out 에 결과를 하나씩 바로 쓰는 리포트 작성기 (with 문 또는 begin/write/close)"""
+        self.out = out
+        self.analyzed_at = analyzed_at or time.time()
+        self.count = 0
+        self.hotfix: List[str] = []
+        self.high_priority: List[str] = []
+        self.vulnerable: List[str] = []
+        self._lock = threading.Lock()
+        self._begun = False
+        self._closed = False
+
+    def __enter__(self) -> "ReportWriter":
+        self.begin()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def begin(self):
+        with self._lock:
+            if not self._begun:
+                self._begun = True
+                self._write_header()
+
+    def write(self, result: LibraryInfo, location: Optional[ReportLocation] = None):
+        """완료된 결과 하나 쓰기"""
+        self.begin()
+        label = f"{result.name} ({result.current_version})"
+        if location is not None:
+            label += f" - {location.path}"
+        with self._lock:
+            self.count += 1
+            if result.is_hotfix:
+                self.hotfix.append(label)
+            if result.is_high_priority:
+                self.high_priority.append(label)
+            if result.advisories:
+                self.vulnerable.append(label)
+            self._write_result(result, location)
+
+    def close(self):
+        self.begin()
+        with self._lock:
+            if not self._closed:
+                self._closed = True
+                self._write_footer()
+                self.out.flush()
+
+    @property
+    def analyzed_at_text(self) -> str:
+        return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self.analyzed_at))
+
+    def _write_header(self):
+        pass
+
+    def _write_result(self, result: LibraryInfo, location: Optional[ReportLocation]):
+        raise NotImplementedError
+
+    def _write_footer(self):
+        pass
+
+
+class MarkdownReportWriter(ReportWriter):
+    format = "markdown"
+    extension = "md"
+    mime = "text/markdown"
+
+    def _write_header(self):
+        self.out.write(f"# {REPORT_TITLE}\n\n**분석 일시:** {self.analyzed_at_text}\n\n## 📚 상세 분석 결과\n\n")
+
+    def _write_result(self, result: LibraryInfo, location: Optional[ReportLocation]):
+        lines = [f"### {self.count}. {result.name}", f"**현재 버전:** {result.current_version}"]
+        if result.latest_version:
+            lines.append(f"**최신 버전:** {result.latest_version}")
+        if result.update_type:
+            lines.append(f"**업데이트 유형:** {UPDATE_TYPE_LABELS.get(result.update_type, result.update_type)}")
+        if result.priority and result.priority != "low":
+            lines.append(f"**우선순위:** {result.priority}")
+        if result.recommendation:
+            lines.append(f"**권장사항:** {result.recommendation}")
+        if result.advisories:
+            lines.append(f"**보안 권고:** {', '.join(result.advisories)}")
+        if result.is_hotfix:
+            lines.append("**핫픽스 여부:** 예 🔥")
+        if location is not None and location.line:
+            lines.append(f"**위치:** {location.path}:{location.line}")
+        self.out.write("\n".join(lines) + f"\n\n**분석 결과:**\n{result.summary}\n\n---\n\n")
+
+    def _write_footer(self):
+        self.out.write(f"## 🎯 주요 업데이트 권장사항\n\n**총 라이브러리 수:** {self.count}개\n\n")
+        for title, names in (
+            ("### 🛡️ 보안 권고", self.vulnerable),
+            ("### 🔥 즉시 업데이트 권장 (핫픽스)", self.hotfix),
+            ("### ⚠️ 높은 우선순위 업데이트", self.high_priority),
+        ):
+            if names:
+                self.out.write(title + "\n" + "".join(f"- **{name}**\n" for name in names) + "\n")
+
+
+class JsonLinesReportWriter(ReportWriter):
+    format = "jsonl"
+    extension = "jsonl"
+    mime = "application/x-ndjson"
+
+    def _write_result(self, result: LibraryInfo, location: Optional[ReportLocation]):
+        record = asdict(result)
+        if location is not None:
+            record["path"] = location.path
+            record["line"] = location.line
+        self.out.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def _json(value) -> str:
+    return json.dumps(value, ensure_ascii=False)
+
+
+def sarif_rule(result: LibraryInfo) -> Optional[str]:
+    """결과에 해당하는 가장 심각한 규칙 (업데이트가 필요 없으면 None)"""
+    if result.advisories:
+        return RULE_VULNERABLE
+    if result.is_hotfix:
+        return RULE_HOTFIX
+    if result.latest_version and result.update_type not in ("", UP_TO_DATE) and not result.is_failed:
+        return RULE_OUTDATED
+    return None
+
+
+class SarifReportWriter(ReportWriter):
+    format = "sarif"
+    extension = "sarif"
+    mime = "application/sarif+json"
+
+    def _write_header(self):
+        # {"version", "$schema", "runs": [{"tool", "invocations", "results": [ 까지 쓰고 결과는 하나씩 이어 쓴다
+        # (닫는 괄호는 _write_footer 가 같은 순서로 쓴다)
+        tool = {"driver": {"name": "LibGuard", "rules": SARIF_RULES}}
+        invocations = [{
+            "executionSuccessful": True,
+            "startTimeUtc": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(self.analyzed_at)),
+        }]
+        self.out.write(
+            f'{{"version": {_json(SARIF_VERSION)}, "$schema": {_json(SARIF_SCHEMA)}, "runs": [{{'
+            f'"tool": {_json(tool)}, "invocations": {_json(invocations)}, "results": [\n'
+        )
+        self._emitted = 0
+
+    def _write_result(self, result: LibraryInfo, location: Optional[ReportLocation]):
+        rule = sarif_rule(result)
+        if rule is None:
+            return
+
+        level = "error" if rule == RULE_VULNERABLE and result.is_high_priority else (
+            "note" if rule == RULE_OUTDATED else "warning"
+        )
+        target = f" → {result.latest_version}" if result.latest_version else ""
+        message = f"{result.name} {result.current_version}{target}"
+        if result.advisories:
+            message += f" (보안 권고: {', '.join(result.advisories)})"
+        if result.recommendation:
+            message += f" - {result.recommendation}"
+
+        uri = location.path if location else "gradle/libs.versions.toml"
+        physical = {"artifactLocation": {"uri": uri}}
+        if location is not None and location.line:
+            physical["region"] = {"startLine": location.line}
+        record = {
+            "ruleId": rule,
+            "level": level,
+            "message": {"text": message},
+            "locations": [{"physicalLocation": physical}],
+            # 같은 이름/버전이 다른 카탈로그나 모듈에도 있으므로 파일과 좌표까지 넣어 경고를 구분한다
+            "partialFingerprints": {
+                "libguard/v2": f"{uri}#{(location and location.coordinate) or result.name}@{result.current_version}"
+            },
+            "properties": {
+                "priority": result.priority,
+                "updateType": result.update_type,
+                "latestVersion": result.latest_version,
+                "summary": result.summary,
+            },
+        }
+        self.out.write(("," if self._emitted else "") + _json(record) + "\n")
+        self._emitted += 1
+
+    def _write_footer(self):
+        # results 배열, run 객체, runs 배열, 최상위 객체 순서로 닫는다
+        self.out.write("]}]}\n")
+
+
+_HTML_HEAD = """<!DOCTYPE html>
+<html lang="ko"><head><meta charset="utf-8"><title>{title}</title>
+<style>
+body{{font-family:system-ui,sans-serif;max-width:960px;margin:2rem auto;padding:0 1rem;color:#222}}
+.lib{{display:none;border:1px solid #ddd;border-radius:8px;padding:0.75rem 1rem;margin:0.75rem 0}}
+.lib.hotfix{{border-left:4px solid #e8590c}}.lib.vulnerable{{border-left:4px solid #c92a2a}}
+.lib h3{{margin:0 0 0.5rem}}.meta{{color:#555;font-size:0.9rem}}.summary{{white-space:pre-wrap}}
+nav button{{margin:0 2px}}nav button[disabled]{{font-weight:bold}}
+</style>
+<noscript><style>.lib{{display:block}}</style></noscript>
+</head><body>
+<h1>{title}</h1>
+<p class="meta">분석 일시: {analyzed_at}</p>
+<nav id="pages-top"></nav>
+"""
+
+_HTML_FOOT = """<nav id="pages-bottom"></nav>
+<h2>🎯 주요 업데이트 권장사항</h2>
+<p>총 라이브러리 수: {count}개</p>
+{lists}
+<script>
+(function () {{
+  var pageSize = {page_size}, items = document.querySelectorAll(".lib");
+  var pages = Math.max(1, Math.ceil(items.length / pageSize));
+  function show(page) {{
+    for (var i = 0; i < items.length; i++) {{
+      items[i].style.display = Math.floor(i / pageSize) === page ? "block" : "none";
+    }}
+    ["pages-top", "pages-bottom"].forEach(function (id) {{
+      var nav = document.getElementById(id);
+      nav.innerHTML = "";
+      for (var p = 0; p < pages && pages > 1; p++) {{
+        var button = document.createElement("button");
+        button.textContent = p + 1;
+        button.disabled = p === page;
+        button.onclick = (function (target) {{ return function () {{ show(target); }}; }})(p);
+        nav.appendChild(button);
+      }}
+    }});
+  }}
+  show(0);
+}})();
+</script>
+</body></html>
+"""
+
+
+class HtmlReportWriter(ReportWriter):
+    format = "html"
+    extension = "html"
+    mime = "text/html"
+
+    def __init__(self, out: TextIO, analyzed_at: Optional[float] = None, page_size: int = DEFAULT_HTML_PAGE_SIZE):
+        """한 페이지에 page_size 개씩 보여주는 HTML (스크립트 없이 열면 전체 표시)"""
+        super().__init__(out, analyzed_at)
+        self.page_size = max(1, page_size)
+
+    def _write_header(self):
+        self.out.write(_HTML_HEAD.format(title=html.escape(REPORT_TITLE), analyzed_at=self.analyzed_at_text))
+
+    def _write_result(self, result: LibraryInfo, location: Optional[ReportLocation]):
+        classes = ["lib"] + (["hotfix"] if result.is_hotfix else []) + (["vulnerable"] if result.advisories else [])
+        meta = [f"현재 버전 {html.escape(result.current_version)}"]
+        if result.latest_version:
+            meta.append(f"최신 버전 {html.escape(result.latest_version)}")
+        if result.update_type:
+            meta.append(html.escape(UPDATE_TYPE_LABELS.get(result.update_type, result.update_type)))
+        if result.priority and result.priority != "low":
+            meta.append(f"우선순위 {html.escape(result.priority)}")
+        if result.recommendation:
+            meta.append(html.escape(result.recommendation))
+        if location is not None and location.line:
+            meta.append(f"{html.escape(location.path)}:{location.line}")
+        advisories = (
+            f'<p class="meta">🛡️ 보안 권고: {html.escape(", ".join(result.advisories))}</p>'
+            if result.advisories else ""
+        )
+        self.out.write(
+            f'<article class="{" ".join(classes)}"><h3>{self.count}. {html.escape(result.name)}</h3>'
+            f'<p class="meta">{" · ".join(meta)}</p>{advisories}'
+            f'<div class="summary">{html.escape(result.summary)}</div></article>\n'
+        )
+
+    def _write_footer(self):
+        lists = "".join(
+            f"<h3>{title}</h3><ul>" + "".join(f"<li>{html.escape(name)}</li>" for name in names) + "</ul>\n"
+            for title, names in (
+                ("🛡️ 보안 권고", self.vulnerable),
+                ("🔥 즉시 업데이트 권장 (핫픽스)", self.hotfix),
+                ("⚠️ 높은 우선순위 업데이트", self.high_priority),
+            )
+            if names
+        )
+        self.out.write(_HTML_FOOT.format(count=self.count, lists=lists, page_size=self.page_size))
+
+
+REPORT_WRITERS: Dict[str, Type[ReportWriter]] = {
+    writer.format: writer
+    for writer in (MarkdownReportWriter, JsonLinesReportWriter, SarifReportWriter, HtmlReportWriter)
+}
+
+
+def report_format_for_path(path: str, default: str = "markdown") -> str:
+    """파일 확장자로 리포트 형식 추측 (.md / .jsonl / .sarif / .html)"""
+    lowered = path.lower()
+    for writer in REPORT_WRITERS.values():
+        if lowered.endswith("." + writer.extension) or (writer.format == "html" and lowered.endswith(".htm")):
+            return writer.format
+    return default
+
+
+def create_report_writer(report_format: str, out: TextIO, **kwargs) -> ReportWriter:
+    writer = REPORT_WRITERS.get(report_format)
+    if writer is None:
+        raise ValueError(f"지원하지 않는 리포트 형식입니다: {report_format} (가능: {', '.join(REPORT_WRITERS)})")
+    return writer(out, **kwargs)
+
+
+def render_report(
+    results: Iterable[LibraryInfo],
+    report_format: str = "markdown",
+    analyzed_at: Optional[float] = None,
+    locations: Optional[Dict[str, ReportLocation]] = None,
+) -> str:
+    """저장된 결과 전체로 리포트 문자열 만들기 (다운로드 버튼용)"""
+    buffer = io.StringIO()
+    with create_report_writer(report_format, buffer, analyzed_at=analyzed_at) as writer:
+        for result in results:
+            writer.write(result, (locations or {}).get(result.name))
+    return buffer.getvalue()
@@ -0,0 +1,110 @@
+# 결과 표 모델 (웹 앱 결과 탭용)
+# LibraryInfo 목록을 열 단위 DataFrame 으로 한 번만 바꿔 두고,
+# 우선순위 / 핫픽스 / 업데이트 유형 / 검색 필터와 정렬, 페이지 나누기를 열 연산으로 처리한다.
+# 화면에는 한 페이지 분량만 보내므로 카탈로그가 커져도 그리는 양은 일정하다.
+# pandas 는 streamlit 과 함께 설치되므로 웹 앱에서만 import 한다 (CLI 는 사용하지 않음).
+
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from libguard.analyzer import LibraryInfo
+from libguard.versions import UPDATE_TYPE_LABELS
+
+# 정렬용 우선순위 순서 (높을수록 위험)
+PRIORITY_RANKS = {"높음": 3, "중간": 2, "낮음": 1}
+
+COLUMNS = [
+    "name", "current_version", "latest_version", "update_type", "priority", "recommendation",
+    "is_hotfix", "advisories", "failed", "estimated", "priority_rank",
+]
+
+
+@dataclass
+class ResultFilter:
+    priorities: List[str] = field(default_factory=list)
+    update_types: List[str] = field(default_factory=list)
+    hotfix_only: bool = False
+    vulnerable_only: bool = False
+    query: str = ""
+
+
+def results_frame(results: Sequence[LibraryInfo]) -> pd.DataFrame:
+    """결과 목록 → 열 단위 표 (index 는 results 안의 위치, 상세 정보는 넣지 않는다)"""
+    frame = pd.DataFrame({
+        "name": [r.name for r in results],
+        "current_version": [r.current_version for r in results],
+        "latest_version": [r.latest_version for r in results],
+        "update_type": [r.update_type for r in results],
+        "priority": [r.priority for r in results],
+        "recommendation": [r.recommendation for r in results],
+        "is_hotfix": [r.is_hotfix for r in results],
+        "advisories": [len(r.advisories) for r in results],
+        "failed": [r.is_failed for r in results],
+        "estimated": [r.is_estimated for r in results],
+    }, columns=COLUMNS[:-1])
+    # 우선순위는 "높음 (보안)" 처럼 설명이 붙을 수 있으므로 포함 여부로 등급을 매긴다 (LibraryInfo.is_high_priority 와 같은 기준)
+    rank = pd.Series(0, index=frame.index)
+    for label, value in PRIORITY_RANKS.items():
+        rank = rank.mask((rank == 0) & frame["priority"].str.contains(label, regex=False), value)
+    frame["priority_rank"] = rank.astype(int)
+    frame["update_type"] = frame["update_type"].astype("category")
+    return frame
+
+
+def summary_counts(frame: pd.DataFrame) -> dict:
+    """요약 탭 지표 (열 합계 한 번씩)"""
+    return {
+        "total": len(frame),
+        "hotfix": int(frame["is_hotfix"].sum()),
+        "high_priority": int((frame["priority_rank"] == PRIORITY_RANKS["높음"]).sum()),
+        "vulnerable": int((frame["advisories"] > 0).sum()),
+        "failed": int(frame["failed"].sum()),
+    }
+
+
+def filter_frame(frame: pd.DataFrame, criteria: ResultFilter) -> pd.DataFrame:
+    """조건에 맞는 행만 (모든 조건을 하나의 불리언 마스크로 계산)"""
+    mask = pd.Series(True, index=frame.index)
+    if criteria.priorities:
+        mask &= frame["priority_rank"].isin([PRIORITY_RANKS.get(label, 0) for label in criteria.priorities])
+    if criteria.update_types:
+        mask &= frame["update_type"].isin(criteria.update_types)
+    if criteria.hotfix_only:
+        mask &= frame["is_hotfix"]
+    if criteria.vulnerable_only:
+        mask &= frame["advisories"] > 0
+    if criteria.query:
+        mask &= frame["name"].str.contains(criteria.query, case=False, regex=False)
+    return frame[mask]
+
+
+def sort_frame(frame: pd.DataFrame, column: Optional[str], descending: bool = False) -> pd.DataFrame:
+    """열 기준 정렬 (같은 값은 카탈로그 순서 유지, column 이 None 이면 카탈로그 순서)"""
+    if column not in frame.columns:
+        return frame
+    return frame.sort_values(column, ascending=not descending, kind="stable")
+
+
+def page_slice(frame: pd.DataFrame, page: int, page_size: int) -> Tuple[pd.DataFrame, int]:
+    """(page 번째 페이지, 전체 페이지 수), page 는 1부터 시작하고 범위를 넘으면 마지막 페이지"""
+    page_size = max(1, page_size)
+    pages = max(1, -(-len(frame) // page_size))
+    page = min(max(1, page), pages)
+    start = (page - 1) * page_size
+    return frame.iloc[start:start + page_size], pages
+
+
+def display_frame(frame: pd.DataFrame) -> pd.DataFrame:
+    """화면 표시용 열 이름/값 (한 페이지 분량에만 적용)"""
+    return pd.DataFrame({
+        "라이브러리": frame["name"],
+        "현재 버전": frame["current_version"],
+        "최신 버전": frame["latest_version"],
+        "업데이트": frame["update_type"].astype(str).map(lambda value: UPDATE_TYPE_LABELS.get(value, value)),
+        "우선순위": frame["priority"].where(frame["priority"] != "low", ""),
+        "권장사항": frame["recommendation"],
+        "핫픽스": frame["is_hotfix"].map({True: "🔥", False: ""}),
+        "보안 권고": frame["advisories"],
+    })
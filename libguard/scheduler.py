@@ -0,0 +1,159 @@
+# 위험도 순서 / 예산 기반 분석 스케줄러
+# "카탈로그의 처음 N개" 대신, 모든 항목을 AI 호출 없이 먼저 점수 매기고
+# (업데이트 유형, 오프라인 색인의 보안 권고, 버전 차이, 캐시 여부)
+# 위험한 항목부터 토큰/달러 예산이 허락하는 만큼만 AI 로 분석한다.
+# 예산 밖 항목은 analyzer.estimated_result 로 버전 비교와 로컬 정보만으로 결과를 만든다.
+# 캐시에 있거나 최신 버전인 항목은 AI 호출이 없으므로 예산과 관계없이 분석한다.
+
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Sequence, Tuple
+
+from libguard.analyzer import (
+    ANALYSIS_PROMPT_TEMPLATE, ANALYSIS_SYSTEM_PROMPT, BATCH_ENTRY_TEMPLATE, BATCH_PROMPT_TEMPLATE,
+    BATCH_TOKENS_PER_LIBRARY, OPENAI_MODEL, SINGLE_MAX_TOKENS, estimate_tokens,
+)
+from libguard.metrics import MODEL_PRICES_PER_1K
+from libguard.versions import (
+    MAJOR, MINOR, PATCH, PRERELEASE, UNKNOWN, UP_TO_DATE, classify_update, numeric_parts,
+)
+from libguard.vulnerabilities import SEVERITY_ORDER
+
+# 업데이트 유형별 기본 점수 (핫픽스 > 메이저 > 마이너)
+UPDATE_TYPE_SCORES = {PATCH: 3.0, MAJOR: 2.5, MINOR: 2.0, PRERELEASE: 2.0, UNKNOWN: 1.5, UP_TO_DATE: 0.0}
+# 보안 권고 점수 (심각도 1단계당)
+ADVISORY_SCORE = 5.0
+# 버전 차이 점수 상한
+MAX_STALENESS_SCORE = 3.0
+
+# 프롬프트에 들어가는 수집 정보(Maven 결과, 기본 정보)의 대략적인 토큰 수
+CONTEXT_TOKENS = 120
+
+WorkItem = Tuple[str, str, str, Optional[str]]
+
+
+@dataclass
+class AnalysisBudget:
+    """AI 분석에 쓸 예산 (지정한 한도 중 먼저 닿는 것에서 멈춘다, None = 제한 없음)"""
+    tokens: Optional[int] = None
+    usd: Optional[float] = None
+    max_libraries: Optional[int] = None
+    model: str = OPENAI_MODEL
+
+    @property
+    def limited(self) -> bool:
+        return self.tokens is not None or self.usd is not None or self.max_libraries is not None
+
+
+@dataclass
+class ScheduledItem:
+    index: int
+    score: float
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    free: bool = False
+
+
+@dataclass
+class SchedulePlan:
+    analyze: List[int] = field(default_factory=list)
+    estimate: List[int] = field(default_factory=list)
+    tokens: int = 0
+    usd: float = 0.0
+
+    @property
+    def skipped(self) -> int:
+        return len(self.estimate)
+
+
+def staleness(current_version: str, latest_version: str) -> float:
+    """버전 차이 점수 (메이저 1, 마이너 0.2 씩, 상한 MAX_STALENESS_SCORE)"""
+    current, latest = numeric_parts(current_version), numeric_parts(latest_version)
+    if not current or not latest:
+        return 0.0
+    current, latest = current + (0,) * (2 - len(current)), latest + (0,) * (2 - len(latest))
+    major_gap = latest[0] - current[0]
+    minor_gap = 0 if major_gap else latest[1] - current[1]
+    return min(MAX_STALENESS_SCORE, max(0, major_gap) + 0.2 * max(0, minor_gap))
+
+
+def risk_score(update_type: str, severities: Sequence[str], current_version: str, latest_version: str) -> float:
+    """항목 위험도 (보안 권고 > 업데이트 유형 > 버전 차이)"""
+    score = UPDATE_TYPE_SCORES.get(update_type, UPDATE_TYPE_SCORES[UNKNOWN])
+    if severities:
+        score += ADVISORY_SCORE * max(1, max(SEVERITY_ORDER.get(severity, 0) for severity in severities))
+    return score + staleness(current_version, latest_version)
+
+
+def estimate_library_tokens(batch_size: int = 1) -> Tuple[int, int]:
+    """라이브러리 하나를 AI 로 분석할 때의 (프롬프트, 응답) 토큰 상한 추정
+
+    속도 제한기처럼 응답은 max_tokens 만큼 잡아서 예산을 넘기지 않도록 한다.
+    """
+    if batch_size > 1:
+        header = estimate_tokens(ANALYSIS_SYSTEM_PROMPT + BATCH_PROMPT_TEMPLATE)
+        prompt = -(-header // batch_size) + estimate_tokens(BATCH_ENTRY_TEMPLATE) + CONTEXT_TOKENS
+        return prompt, BATCH_TOKENS_PER_LIBRARY
+    prompt = estimate_tokens(ANALYSIS_SYSTEM_PROMPT + ANALYSIS_PROMPT_TEMPLATE) + CONTEXT_TOKENS
+    return prompt, SINGLE_MAX_TOKENS
+
+
+def score_items(analyzer: Any, items: Sequence[WorkItem], batch_size: int = 1) -> List[ScheduledItem]:
+    """작업 목록을 위험도 높은 순서로 점수 매기기 (네트워크/AI 호출 없음)"""
+    prompt_tokens, completion_tokens = estimate_library_tokens(batch_size)
+    index = getattr(analyzer, "vulnerability_index", None)
+    scored = []
+
+    for position, (lib_name, version, coordinate, latest_version) in enumerate(items):
+        update_type = classify_update(version, latest_version or "")
+        severities = (
+            [advisory.severity for advisory in index.affected(coordinate, version)]
+            if index is not None and coordinate else []
+        )
+        free = update_type == UP_TO_DATE or (
+            hasattr(analyzer, "is_cached") and analyzer.is_cached(lib_name, version, coordinate, latest_version)
+        )
+        scored.append(ScheduledItem(
+            index=position,
+            score=risk_score(update_type, severities, version, latest_version or ""),
+            prompt_tokens=0 if free else prompt_tokens,
+            completion_tokens=0 if free else completion_tokens,
+            free=free,
+        ))
+
+    # 점수가 같으면 카탈로그 순서를 유지
+    scored.sort(key=lambda item: (-item.score, item.index))
+    return scored
+
+
+def plan_schedule(
+    analyzer: Any,
+    items: Sequence[WorkItem],
+    budget: AnalysisBudget,
+    batch_size: int = 1,
+) -> SchedulePlan:
+    """위험도 순서로 예산을 배정해 (AI 로 분석할 인덱스, 로컬 결과로 대신할 인덱스)를 계산"""
+    plan = SchedulePlan()
+    prices = MODEL_PRICES_PER_1K.get(budget.model)
+    paid = 0
+
+    for item in score_items(analyzer, items, batch_size):
+        if item.free:
+            plan.analyze.append(item.index)
+            continue
+
+        tokens = item.prompt_tokens + item.completion_tokens
+        usd = (item.prompt_tokens * prices[0] + item.completion_tokens * prices[1]) / 1000 if prices else 0.0
+        if (
+            (budget.max_libraries is not None and paid >= budget.max_libraries)
+            or (budget.tokens is not None and plan.tokens + tokens > budget.tokens)
+            or (budget.usd is not None and plan.usd + usd > budget.usd)
+        ):
+            plan.estimate.append(item.index)
+            continue
+
+        paid += 1
+        plan.tokens += tokens
+        plan.usd += usd
+        plan.analyze.append(item.index)
+
+    return plan
@@ -0,0 +1,57 @@
+# 동일 작업 병합 (single-flight)
+# 같은 키의 작업이 이미 실행 중이면 새로 실행하지 않고 먼저 시작한 작업의 결과를 함께 받는다.
+# 모듈 단위 인스턴스를 쓰면 같은 프로세스의 모든 Streamlit 세션/CLI 카탈로그가 작업을 공유한다.
+
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+
+class SingleFlight:
+    def __init__(self):
+        """키별로 실행 중인 작업을 하나만 유지하는 그룹"""
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+        self.coalesced = 0
+
+    def claim(self, key: Hashable) -> Tuple[Future, bool]:
+        """(future, 직접 실행해야 하는지) 반환
+
+        True 를 받은 호출자는 반드시 finish() 로 결과를 알려야 한다.
+        False 를 받은 호출자는 future.result() 로 결과를 기다린다.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                self.coalesced += 1
+                return future, False
+            future = self._calls[key] = Future()
+            return future, True
+
+    def finish(self, key: Hashable, future: Future, result: Any = None, error: BaseException = None):
+        """claim 으로 맡은 작업의 결과(또는 예외)를 기다리는 모든 호출자에게 전달"""
+        with self._lock:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def do(self, key: Hashable, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """같은 키의 작업이 실행 중이면 그 결과를, 아니면 fn 을 실행한 결과를 반환"""
+        future, is_leader = self.claim(key)
+        if not is_leader:
+            return future.result()
+
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            self.finish(key, future, error=e)
+            raise
+        self.finish(key, future, result)
+        return result
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
@@ -0,0 +1,188 @@
+# 카탈로그 스냅샷 기반 증분 분석
+# 카탈로그별로 항목(좌표, 버전, 당시 최신 버전)과 분석 결과를 저장해 두고,
+# 다음 실행에서는 추가/변경된 항목과 업스트림 최신 버전이 바뀐 항목만 다시 분석한다.
+# 나머지는 Maven 묶음 조회(저렴한 메타데이터 확인) 한 번으로 재사용 여부를 판단한다.
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from libguard.analyzer import LibraryInfo
+from libguard.cache import default_cache_dir
+from libguard.engine import AnalysisEngine
+from libguard.streaming import PartialResult
+
+
+def default_snapshot_path() -> str:
+    return os.path.join(default_cache_dir(), "snapshots.sqlite3")
+
+
+@dataclass
+class SnapshotEntry:
+    key: str
+    coordinate: str
+    version: str
+    latest_version: str
+    result: dict
+
+
+class SnapshotStore:
+    def __init__(self, path: Optional[str] = None):
+        """카탈로그 ID(파일 경로나 업로드 파일 이름) 별 마지막 분석 결과 저장소"""
+        self.path = path or default_snapshot_path()
+        self._lock = threading.Lock()
+
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS snapshot_entries (
+                    catalog_id TEXT NOT NULL,
+                    entry_key TEXT NOT NULL,
+                    coordinate TEXT NOT NULL,
+                    version TEXT NOT NULL,
+                    latest_version TEXT NOT NULL,
+                    result TEXT NOT NULL,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (catalog_id, entry_key)
+                )
+                """
+            )
+
+    def load(self, catalog_id: str) -> Dict[str, SnapshotEntry]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT entry_key, coordinate, version, latest_version, result "
+                "FROM snapshot_entries WHERE catalog_id = ?",
+                (catalog_id,),
+            ).fetchall()
+        return {
+            row[0]: SnapshotEntry(row[0], row[1], row[2], row[3], json.loads(row[4]))
+            for row in rows
+        }
+
+    def save(self, catalog_id: str, entries: List[SnapshotEntry]):
+        """카탈로그의 스냅샷을 통째로 교체 (삭제된 항목은 함께 사라진다)"""
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM snapshot_entries WHERE catalog_id = ?", (catalog_id,))
+            self._conn.executemany(
+                "INSERT INTO snapshot_entries "
+                "(catalog_id, entry_key, coordinate, version, latest_version, result, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        catalog_id, entry.key, entry.coordinate, entry.version, entry.latest_version,
+                        json.dumps(entry.result, ensure_ascii=False), now,
+                    )
+                    for entry in entries
+                ],
+            )
+
+
+def upload_catalog_id(owner: str, file_name: str, project: str = "") -> str:
+    """업로드한 카탈로그의 스냅샷 ID (소유자 + 프로젝트 이름, 없으면 파일 이름)
+
+    업로드 파일에는 경로가 없어 이름만으로는 서로 다른 프로젝트의 libs.versions.toml 을 구분할 수 없으므로
+    여러 프로젝트를 올리는 사용자는 프로젝트 이름을 준다. 항목이 추가/제거되어도 ID 는 그대로이고
+    바뀐 항목은 plan_incremental 이 골라 다시 분석한다.
+    """
+    return f"{owner}:{project.strip() or file_name}"
+
+
+def plan_incremental(
+    previous: Dict[str, SnapshotEntry],
+    libraries: Dict[str, str],
+    coordinates: Dict[str, str],
+    latest_versions: Optional[Dict[str, str]],
+) -> Tuple[Dict[str, dict], List[str]]:
+    """(재사용할 결과, 다시 분석할 항목 키 목록) 계산
+
+    좌표·현재 버전·업스트림 최신 버전이 모두 지난 실행과 같을 때만 재사용한다.
+    최신 버전을 확인하지 못한 경우(조회 실패)에는 안전하게 다시 분석한다.
+    """
+    reused: Dict[str, dict] = {}
+    changed: List[str] = []
+
+    for key, version in libraries.items():
+        entry = previous.get(key)
+        coordinate = coordinates.get(key, "")
+        latest_version = latest_versions.get(coordinate) if latest_versions is not None and coordinate else None
+
+        if (
+            entry is not None
+            and latest_version is not None
+            and entry.coordinate == coordinate
+            and entry.version == version
+            and entry.latest_version == latest_version
+        ):
+            reused[key] = entry.result
+        else:
+            changed.append(key)
+
+    return reused, changed
+
+
+def analyze_incremental(
+    engine: AnalysisEngine,
+    store: SnapshotStore,
+    catalog_id: str,
+    libraries: Dict[str, str],
+    coordinates: Dict[str, str],
+    on_result: Optional[Callable[[int, int, LibraryInfo], None]] = None,
+    on_partial: Optional[Callable[[PartialResult], None]] = None,
+) -> Tuple[List[LibraryInfo], int]:
+    """이전 스냅샷과 비교해 바뀐 항목만 분석하고 (입력 순서 결과, 재사용 개수)를 반환"""
+    targets = {key: coordinates[key] for key in libraries if coordinates.get(key)}
+    latest_versions = engine.prefetch_latest_versions(targets)
+
+    reused, changed = plan_incremental(store.load(catalog_id), libraries, coordinates, latest_versions)
+
+    results: Dict[str, LibraryInfo] = {key: LibraryInfo(**result) for key, result in reused.items()}
+    # 재사용한 결과에도 최신 취약점 색인 판단을 반영
+    if hasattr(engine.analyzer, "apply_security"):
+        results = {
+            key: engine.analyzer.apply_security(result, coordinates.get(key, ""))
+            for key, result in results.items()
+        }
+    total = len(libraries)
+    done = 0
+    for result in results.values():
+        done += 1
+        if on_result:
+            on_result(done, total, result)
+
+    changed_libraries = {key: libraries[key] for key in changed}
+    changed_keys = list(changed_libraries)
+    for index, result in engine.iter_results(
+        changed_libraries, coordinates, latest_versions, on_partial
+    ):
+        results[changed_keys[index]] = result
+        done += 1
+        if on_result:
+            on_result(done, total, result)
+
+    # 최신 버전을 확인하지 못한 실행은 스냅샷을 갱신하지 않는다.
+    # 실패한 결과와 예산 밖이라 로컬 판단만 한 결과는 저장하지 않아 다음 실행에서 다시 분석되게 한다.
+    if latest_versions is not None:
+        store.save(catalog_id, [
+            SnapshotEntry(
+                key=key,
+                coordinate=coordinates.get(key, ""),
+                version=libraries[key],
+                latest_version=latest_versions.get(coordinates.get(key, ""), ""),
+                result=asdict(results[key]),
+            )
+            for key in libraries
+            if not results[key].is_failed and not results[key].is_estimated
+        ])
+
+    return [results[key] for key in libraries], len(reused)
@@ -0,0 +1,144 @@
+# OpenAI 스트리밍 응답 처리
+# server-sent events 로 도착하는 토큰 조각을 이어 붙이면서
+#   - 응답 JSON 안의 항목(라이브러리 하나)이 닫히는 순간 그 항목을 꺼내고
+#   - 아직 닫히지 않은 항목의 summary 를 부분 문자열로 미리 보여준다.
+# 최종 결과는 언제나 전체 응답을 다시 파싱해서 확정하므로, 여기서는 빠른 표시만 담당한다.
+
+import json
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+SSE_DATA_PREFIX = b"data:"
+SSE_DONE = "[DONE]"
+
+# 단독 분석 응답은 최상위 객체, 묶음 분석 응답은 {"results": [ {...}, ... ]} 의 원소
+SINGLE_ITEM_DEPTH = 1
+BATCH_ITEM_DEPTH = 3
+
+
+@dataclass
+class PartialResult:
+    """분석 중인 라이브러리의 중간 결과 (done 이면 result 에 확정 결과가 담긴다)"""
+    name: str
+    summary: str = ""
+    done: bool = False
+    result: Any = None
+
+
+def iter_sse_data(lines: Iterable[bytes]) -> Iterator[str]:
+    """SSE 줄들에서 data 페이로드만 꺼낸다 ([DONE] 을 만나면 종료)
+
+    text/event-stream 에는 charset 이 없어 requests 가 latin-1 로 해석하므로 직접 UTF-8 로 디코딩한다.
+    """
+    for line in lines:
+        if not line.startswith(SSE_DATA_PREFIX):
+            continue
+        payload = line[len(SSE_DATA_PREFIX):].strip().decode("utf-8")
+        if payload == SSE_DONE:
+            return
+        if payload:
+            yield payload
+
+
+def iter_content_deltas(
+    lines: Iterable[bytes],
+    on_usage: Optional[Callable[[dict], None]] = None
+) -> Iterator[str]:
+    """chat completions 스트림에서 본문 조각(choices[0].delta.content)만 꺼낸다
+
+    stream_options.include_usage 로 받은 usage 조각은 on_usage 로 넘긴다.
+    """
+    for payload in iter_sse_data(lines):
+        chunk = json.loads(payload)
+        if on_usage is not None and chunk.get("usage"):
+            on_usage(chunk["usage"])
+        choices = chunk.get("choices") or []
+        if not choices:
+            continue
+        content = (choices[0].get("delta") or {}).get("content")
+        if content:
+            yield content
+
+
+def _decode_partial_string(raw: str) -> str:
+    """끝이 잘린 JSON 문자열 내용 디코딩 (미완성 이스케이프는 버린다)"""
+    for cut in range(0, min(len(raw), 6) + 1):
+        try:
+            return json.loads('"' + raw[:len(raw) - cut] + '"')
+        except ValueError:
+            continue
+    return ""
+
+
+def partial_string_field(text: str, field: str) -> Tuple[Optional[str], bool]:
+    """JSON 조각에서 문자열 필드 값을 (지금까지의 값, 닫혔는지)로 반환 (없으면 (None, False))"""
+    match = re.search(r'"%s"\s*:\s*"' % re.escape(field), text)
+    if not match:
+        return None, False
+
+    escaped = False
+    for end in range(match.end(), len(text)):
+        char = text[end]
+        if escaped:
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif char == '"':
+            return _decode_partial_string(text[match.end():end]), True
+    return _decode_partial_string(text[match.end():]), False
+
+
+class JsonItemScanner:
+    def __init__(self, item_depth: int = SINGLE_ITEM_DEPTH):
+        """조각난 JSON 텍스트에서 지정한 깊이의 객체가 닫힐 때마다 꺼내는 스캐너
+
+        문자열 안의 괄호는 무시하며, 코드 블록 표시(```json) 같은 JSON 바깥 문자는 건너뛴다.
+        """
+        self.item_depth = item_depth
+        self.text = ""
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._item_start: Optional[int] = None
+
+    def feed(self, chunk: str) -> List[dict]:
+        """새 조각을 추가하고 이번에 닫힌 항목들을 파싱해서 반환"""
+        offset = len(self.text)
+        self.text += chunk
+        completed = []
+
+        for position in range(offset, len(self.text)):
+            char = self.text[position]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+                if char == "{" and self._depth == self.item_depth:
+                    self._item_start = position
+            elif char in "}]":
+                if char == "}" and self._depth == self.item_depth and self._item_start is not None:
+                    try:
+                        item = json.loads(self.text[self._item_start:position + 1])
+                    except ValueError:
+                        item = None
+                    if isinstance(item, dict):
+                        completed.append(item)
+                    self._item_start = None
+                self._depth = max(0, self._depth - 1)
+
+        return completed
+
+    @property
+    def current_item(self) -> str:
+        """아직 닫히지 않은 항목의 텍스트 (없으면 빈 문자열)"""
+        if self._item_start is None:
+            return ""
+        return self.text[self._item_start:]
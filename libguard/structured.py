@@ -0,0 +1,197 @@
+# 구조화 출력 (JSON 모드 / JSON 스키마) 과 로컬 검증·복구
+# 지원하는 모델에는 strict JSON 스키마를, 그 외 모델에는 JSON 모드(json_object)를 요청해서
+# 모델이 답을 설명 문장으로 감싸는 일을 막는다.
+# 그래도 어긋난 응답(코드 블록, 앞뒤 설명, 끝의 쉼표, max_tokens 로 잘린 JSON, 영문 등급 등)은
+# 다시 호출하지 않고 여기서 고쳐서 결과로 쓴다.
+
+import json
+import re
+from typing import Any, Dict, List, Optional
+
+PRIORITIES = ("높음", "중간", "낮음")
+RECOMMENDATIONS = ("업데이트 권장", "검토 필요", "선택사항")
+
+# strict JSON 스키마(response_format=json_schema)를 지원하는 모델 (접두어)
+SCHEMA_MODELS = ("gpt-4o", "gpt-4.1", "o1", "o3", "o4")
+
+_ANALYSIS_PROPERTIES = {
+    "latest_version": {"type": "string"},
+    "priority": {"type": "string", "enum": list(PRIORITIES)},
+    "summary": {"type": "string"},
+    "recommendation": {"type": "string", "enum": list(RECOMMENDATIONS)},
+}
+
+ANALYSIS_SCHEMA = {
+    "type": "object",
+    "properties": _ANALYSIS_PROPERTIES,
+    "required": list(_ANALYSIS_PROPERTIES),
+    "additionalProperties": False,
+}
+
+BATCH_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "results": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {"name": {"type": "string"}, **_ANALYSIS_PROPERTIES},
+                "required": ["name", *_ANALYSIS_PROPERTIES],
+                "additionalProperties": False,
+            },
+        },
+    },
+    "required": ["results"],
+    "additionalProperties": False,
+}
+
+_PRIORITY_ALIASES = {
+    "high": "높음", "critical": "높음", "urgent": "높음", "상": "높음",
+    "medium": "중간", "moderate": "중간", "normal": "중간", "중": "중간",
+    "low": "낮음", "minor": "낮음", "하": "낮음",
+}
+# 신중한 쪽부터 찾는다 ("review before update", "검토 후 업데이트 권장" → 검토 필요)
+_RECOMMENDATION_KEYWORDS = (
+    ("검토", "검토 필요"), ("review", "검토 필요"),
+    ("선택", "선택사항"), ("optional", "선택사항"),
+    ("권장", "업데이트 권장"), ("recommend", "업데이트 권장"), ("update", "업데이트 권장"),
+)
+_KEY_ALIASES = {
+    "요약": "summary", "우선순위": "priority", "권장사항": "recommendation", "권장": "recommendation",
+    "최신 버전": "latest_version", "최신버전": "latest_version", "latestversion": "latest_version",
+    "이름": "name", "library": "name",
+}
+
+_FENCE = re.compile(r"```(?:json)?\s*(.*?)(?:```|$)", re.DOTALL | re.IGNORECASE)
+_TRAILING_COMMA = re.compile(r",\s*([}\]])")
+
+
+def response_format(model: str, schema: dict, name: str) -> dict:
+    """모델이 지원하면 strict JSON 스키마, 아니면 JSON 모드"""
+    if model.startswith(SCHEMA_MODELS):
+        return {"type": "json_schema", "json_schema": {"name": name, "strict": True, "schema": schema}}
+    return {"type": "json_object"}
+
+
+def _close_truncated(text: str) -> str:
+    """max_tokens 로 잘린 JSON 의 열린 문자열/괄호를 닫는다 (마지막 미완성 키나 쉼표는 버린다)"""
+    stack: List[str] = []
+    in_string = escaped = False
+    for c in text:
+        if in_string:
+            if escaped:
+                escaped = False
+            elif c == "\\":
+                escaped = True
+            elif c == '"':
+                in_string = False
+        elif c == '"':
+            in_string = True
+        elif c in "{[":
+            stack.append("}" if c == "{" else "]")
+        elif c in "}]" and stack:
+            stack.pop()
+
+    if in_string:
+        text = (text[:-1] if escaped else text) + '"'
+    text = text.rstrip()
+    # {"a": "b", "c   /   {"a": "b", "c":   처럼 값이 없는 마지막 키 제거
+    text = re.sub(r'(,|\{)\s*"[^"]*"\s*:?\s*$', r"\1", text)
+    text = text.rstrip().rstrip(",")
+    return text + "".join(reversed(stack))
+
+
+def loads_lenient(text: str) -> Optional[Any]:
+    """JSON 파싱, 실패하면 흔한 어긋남을 고쳐서 다시 시도 (고칠 수 없으면 None)"""
+    try:
+        return json.loads(text)
+    except (TypeError, ValueError):
+        pass
+    if not isinstance(text, str):
+        return None
+
+    fenced = _FENCE.search(text)
+    candidate = fenced.group(1) if fenced else text
+    starts = [i for i in (candidate.find("{"), candidate.find("[")) if i >= 0]
+    if not starts:
+        return None
+    candidate = candidate[min(starts):]
+
+    decoder = json.JSONDecoder()
+    for attempt in (candidate, _TRAILING_COMMA.sub(r"\1", candidate)):
+        try:
+            # raw_decode 는 JSON 뒤에 붙은 설명 문장을 무시한다
+            return decoder.raw_decode(attempt)[0]
+        except ValueError:
+            continue
+    try:
+        return json.loads(_TRAILING_COMMA.sub(r"\1", _close_truncated(candidate)))
+    except ValueError:
+        return None
+
+
+def _text(value: Any) -> str:
+    if isinstance(value, list):
+        return "\n".join(str(item) for item in value if item)
+    return "" if value is None else str(value).strip()
+
+
+def _priority(value: Any) -> str:
+    text = _text(value)
+    for priority in PRIORITIES:
+        if priority in text:
+            return priority
+    return _PRIORITY_ALIASES.get(text.lower(), "중간")
+
+
+def _recommendation(value: Any) -> str:
+    text = _text(value)
+    if text in RECOMMENDATIONS:
+        return text
+    lowered = text.lower()
+    for keyword, recommendation in _RECOMMENDATION_KEYWORDS:
+        if keyword in lowered:
+            return recommendation
+    return "검토 필요"
+
+
+def normalize_analysis(data: Any) -> Optional[Dict[str, str]]:
+    """응답 한 건을 스키마 모양으로 정리 (summary 가 없으면 쓸 수 없으므로 None)"""
+    if not isinstance(data, dict):
+        return None
+    fields = {_KEY_ALIASES.get(str(key).strip().lower(), str(key).strip().lower()): value
+              for key, value in data.items()}
+
+    summary = _text(fields.get("summary"))
+    if not summary:
+        return None
+    analysis = {
+        "latest_version": _text(fields.get("latest_version")),
+        "priority": _priority(fields.get("priority")),
+        "summary": summary,
+        "recommendation": _recommendation(fields.get("recommendation")),
+    }
+    if "name" in fields:
+        analysis["name"] = _text(fields["name"])
+    return analysis
+
+
+def parse_analysis(text: str) -> Optional[Dict[str, str]]:
+    """단독 분석 응답 → 정리된 분석 (묶음 모양으로 온 한 건짜리 응답도 받아준다)"""
+    data = loads_lenient(text)
+    if isinstance(data, dict) and isinstance(data.get("results"), list) and len(data["results"]) == 1:
+        data = data["results"][0]
+    elif isinstance(data, list) and len(data) == 1:
+        data = data[0]
+    return normalize_analysis(data)
+
+
+def parse_batch(text: str) -> List[Dict[str, str]]:
+    """묶음 분석 응답 → name 이 있는 정리된 분석 목록 (쓸 수 없는 항목은 뺀다)"""
+    data = loads_lenient(text)
+    if isinstance(data, dict):
+        data = data.get("results", [data] if "name" in data else [])
+    if not isinstance(data, list):
+        return []
+    analyses = [normalize_analysis(item) for item in data]
+    return [analysis for analysis in analyses if analysis and analysis.get("name")]
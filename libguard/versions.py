@@ -0,0 +1,259 @@
+# Maven 버전 비교기
+# org.apache.maven.artifact.versioning.ComparableVersion 의 규칙을 따른다.
+#   - '.' / '-' 및 숫자↔문자 경계로 항목을 나눈다
+#   - 한정자 순서: alpha < beta < milestone < rc(=cr) < snapshot < ""(=ga/final/release) < sp < 그 외(사전순)
+#   - 끝의 0 / 빈 한정자는 무시한다 (1.0 == 1 == 1.0.0.Final)
+
+import re
+from functools import total_ordering
+from typing import List, Optional, Tuple, Union
+
+UP_TO_DATE = "up-to-date"
+PATCH = "patch"
+PRERELEASE = "prerelease"  # 사전 릴리스가 낀 업데이트: 같은 라인의 정식 출시(1.0.0-rc1 → 1.0.0) 또는 사전 릴리스로(1.0.0 → 1.0.1-rc1)
+MINOR = "minor"
+MAJOR = "major"
+UNKNOWN = "unknown"
+
+UPDATE_TYPE_LABELS = {
+    UP_TO_DATE: "최신",
+    PATCH: "패치",
+    PRERELEASE: "사전 릴리스",
+    MINOR: "마이너",
+    MAJOR: "메이저",
+    UNKNOWN: "알 수 없음",
+}
+
+_QUALIFIERS = ["alpha", "beta", "milestone", "rc", "snapshot", "", "sp"]
+_ALIASES = {"ga": "", "final": "", "release": "", "cr": "rc"}
+_RELEASE_INDEX = str(_QUALIFIERS.index(""))
+_NUMERIC_PREFIX = re.compile(r"^\d+(?:\.\d+)*")
+
+# 파싱된 항목: int (숫자), str (한정자), list (하위 목록)
+Item = Union[int, str, list]
+
+
+def _comparable_qualifier(qualifier: str) -> str:
+    if qualifier in _QUALIFIERS:
+        return str(_QUALIFIERS.index(qualifier))
+    return f"{len(_QUALIFIERS)}-{qualifier}"
+
+
+def _string_item(value: str, followed_by_digit: bool) -> str:
+    if followed_by_digit and len(value) == 1:
+        value = {"a": "alpha", "b": "beta", "m": "milestone"}.get(value, value)
+    return _ALIASES.get(value, value)
+
+
+def _parse_item(is_digit: bool, buf: str) -> Item:
+    return int(buf) if is_digit else _string_item(buf, False)
+
+
+def _is_null(item: Item) -> bool:
+    if isinstance(item, list):
+        return not item
+    return item == 0 or item == ""
+
+
+def _normalize(items: list):
+    """끝에 붙은 의미 없는 항목(0, 빈 한정자, 빈 목록) 제거"""
+    for i in range(len(items) - 1, -1, -1):
+        if _is_null(items[i]):
+            del items[i]
+        elif not isinstance(items[i], list):
+            break
+
+
+def _parse(version: str) -> list:
+    version = version.lower()
+    items: list = []
+    current = items
+    stack = [current]
+    is_digit = False
+    start = 0
+
+    for i, c in enumerate(version):
+        if c == ".":
+            current.append(0 if i == start else _parse_item(is_digit, version[start:i]))
+            start = i + 1
+        elif c == "-":
+            current.append(0 if i == start else _parse_item(is_digit, version[start:i]))
+            start = i + 1
+            sub: list = []
+            current.append(sub)
+            current = sub
+            stack.append(current)
+        elif c.isdigit():
+            if not is_digit and i > start:
+                # 1.0alpha1 → [1, 0, [alpha, [1]]]
+                current.append(_string_item(version[start:i], True))
+                start = i
+                sub = []
+                current.append(sub)
+                current = sub
+                stack.append(current)
+            is_digit = True
+        else:
+            if is_digit and i > start:
+                current.append(int(version[start:i]))
+                start = i
+                sub = []
+                current.append(sub)
+                current = sub
+                stack.append(current)
+            is_digit = False
+
+    if len(version) > start:
+        current.append(_parse_item(is_digit, version[start:]))
+
+    while stack:
+        _normalize(stack.pop())
+
+    return items
+
+
+def _compare(left: Optional[Item], right: Optional[Item]) -> int:
+    """두 항목 비교 (None 은 '항목 없음')"""
+    if left is None:
+        return 0 if right is None else -_compare(right, None)
+
+    if isinstance(left, int):
+        if right is None:
+            return 0 if left == 0 else 1
+        if isinstance(right, int):
+            return (left > right) - (left < right)
+        return 1  # 숫자 > 한정자, 숫자 > 목록
+
+    if isinstance(left, str):
+        if right is None:
+            lq = _comparable_qualifier(left)
+            return (lq > _RELEASE_INDEX) - (lq < _RELEASE_INDEX)
+        if isinstance(right, str):
+            lq, rq = _comparable_qualifier(left), _comparable_qualifier(right)
+            return (lq > rq) - (lq < rq)
+        return -1  # 한정자 < 숫자, 한정자 < 목록
+
+    # 목록
+    if right is None:
+        return 0 if not left else _compare(left[0], None)
+    if isinstance(right, int):
+        return -1
+    if isinstance(right, str):
+        return 1
+
+    for i in range(max(len(left), len(right))):
+        result = _compare(
+            left[i] if i < len(left) else None,
+            right[i] if i < len(right) else None,
+        )
+        if result:
+            return result
+    return 0
+
+
+def _canonical(items: list) -> str:
+    parts = []
+    for item in items:
+        if isinstance(item, list):
+            parts.append("-" + _canonical(item))
+        else:
+            parts.append(("." if parts else "") + str(item))
+    return "".join(parts)
+
+
+@total_ordering
+class ComparableVersion:
+    __slots__ = ("value", "_items", "canonical")
+
+    def __init__(self, value: str):
+        """Maven 규칙으로 비교 가능한 버전 (정렬/이진 탐색 키로 사용)"""
+        self.value = value
+        self._items = _parse(value.strip())
+        self.canonical = _canonical(self._items)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ComparableVersion):
+            return NotImplemented
+        return _compare(self._items, other._items) == 0
+
+    def __lt__(self, other) -> bool:
+        if not isinstance(other, ComparableVersion):
+            return NotImplemented
+        return _compare(self._items, other._items) < 0
+
+    def __hash__(self) -> int:
+        return hash(self.canonical)
+
+    def __repr__(self) -> str:
+        return f"ComparableVersion({self.value!r})"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+def compare_versions(left: str, right: str) -> int:
+    """left < right 이면 음수, 같으면 0, 크면 양수"""
+    return _compare(_parse(left.strip()), _parse(right.strip()))
+
+
+def numeric_parts(version: str) -> Tuple[int, ...]:
+    """앞쪽 숫자 부분 (예: '4.11.0-rc1' → (4, 11, 0))"""
+    match = _NUMERIC_PREFIX.match(version.strip())
+    if not match:
+        return ()
+    return tuple(int(part) for part in match.group(0).split("."))
+
+
+def classify_update(current: str, latest: str) -> str:
+    """(현재, 최신) 버전 쌍을 up-to-date / prerelease / patch / minor / major / unknown 으로 분류
+
+    사전 릴리스에서 같은 라인의 정식 버전으로 가는 것(1.0.0-rc1 → 1.0.0)과 사전 릴리스로 가는 것(1.0.0 → 1.0.1-rc1)은
+    버그 수정 배포가 아니므로 patch 가 아니다. 숫자로 시작하지 않는 동적 버전(latest.release, +)은 비교할 수 없다.
+    """
+    if not current or not latest:
+        return UNKNOWN
+
+    current_parts = numeric_parts(current)
+    latest_parts = numeric_parts(latest)
+    if not current_parts or not latest_parts:
+        return UNKNOWN
+
+    if compare_versions(current, latest) >= 0:
+        return UP_TO_DATE
+
+    def part(parts: Tuple[int, ...], index: int) -> int:
+        return parts[index] if index < len(parts) else 0
+
+    width = max(len(current_parts), len(latest_parts), 3)
+    if is_prerelease(latest):
+        return PRERELEASE
+    if is_prerelease(current) and all(part(current_parts, i) == part(latest_parts, i) for i in range(width)):
+        return PRERELEASE
+    if part(current_parts, 0) != part(latest_parts, 0):
+        return MAJOR
+    if part(current_parts, 1) != part(latest_parts, 1):
+        return MINOR
+    return PATCH
+
+
+def sort_versions(versions: List[str]) -> List[str]:
+    """Maven 규칙으로 오름차순 정렬"""
+    return sorted(versions, key=ComparableVersion)
+
+
+# 정식 릴리스가 아닌 버전의 한정자 (Maven 규칙 + 안드로이드/JetBrains 에서 흔한 이름)
+_PRERELEASE_QUALIFIERS = frozenset({"alpha", "beta", "milestone", "rc", "snapshot", "preview", "dev", "eap"})
+
+
+def is_prerelease(version: str) -> bool:
+    """alpha / beta / rc / SNAPSHOT 같은 사전 릴리스 버전인지 (1.0.0-alpha01, 2.0-M1, 1.1-SNAPSHOT)"""
+    def walk(items: list) -> bool:
+        for item in items:
+            if isinstance(item, list):
+                if walk(item):
+                    return True
+            elif isinstance(item, str) and item in _PRERELEASE_QUALIFIERS:
+                return True
+        return False
+
+    return walk(_parse(version.strip()))
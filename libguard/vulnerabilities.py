@@ -0,0 +1,359 @@
+# 오프라인 취약점 색인 (OSV 형식 Maven 권고 덤프 기반)
+# group:artifact 별로 영향 버전 구간을 Maven 버전 순서로 정렬된 겹치지 않는 구간 목록으로 바꿔 두고,
+# "버전 X 가 영향을 받는가" 를 이진 탐색 한 번으로 답한다. 네트워크 없이 동작하므로
+# 우선순위/핫픽스 판단은 이 색인이 맡고, AI 는 요약 문장만 작성한다.
+#
+# 덤프 받기 (예): https://osv-vulnerabilities.storage.googleapis.com/Maven/all.zip
+# 색인 만들기:    python -m libguard osv-import all.zip
+
+import bisect
+import json
+import os
+import threading
+import time
+import zipfile
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from libguard.cache import default_cache_dir
+from libguard.versions import MAJOR, PATCH, PRERELEASE, UNKNOWN, ComparableVersion
+
+VULNERABILITY_INDEX_FORMAT = 1
+OSV_ECOSYSTEM = "Maven"
+
+CRITICAL = "CRITICAL"
+HIGH = "HIGH"
+MODERATE = "MODERATE"
+LOW = "LOW"
+SEVERITY_ORDER = {"": 0, LOW: 1, MODERATE: 2, HIGH: 3, CRITICAL: 4}
+_SEVERITY_ALIASES = {"MEDIUM": MODERATE}
+
+# 구간 경계 키: (구분, 버전, 위치). 구분 0 = -∞, 1 = 일반 버전, 2 = +∞
+# 위치 0 은 "그 버전", 1 은 "그 버전 바로 다음" (last_affected 처럼 끝을 포함하는 구간용)
+Bound = Tuple[int, ComparableVersion, int]
+_NO_VERSION = ComparableVersion("")
+_MIN_BOUND: Bound = (0, _NO_VERSION, 0)
+_MAX_BOUND: Bound = (2, _NO_VERSION, 0)
+
+
+def default_vulnerability_index_path() -> str:
+    """색인 파일 경로 (LIBGUARD_VULNERABILITY_INDEX 환경 변수로 변경 가능)"""
+    return os.getenv(
+        "LIBGUARD_VULNERABILITY_INDEX",
+        os.path.join(default_cache_dir(), "vulnerabilities.json"),
+    )
+
+
+def _bound(version: str, after: bool = False) -> Bound:
+    return (1, ComparableVersion(version), 1 if after else 0)
+
+
+@dataclass(frozen=True)
+class Advisory:
+    id: str
+    aliases: Tuple[str, ...] = ()
+    summary: str = ""
+    severity: str = ""
+
+    def describe(self) -> str:
+        """'GHSA-xxxx (CVE-2023-1234, HIGH)' 형태의 한 줄 표시"""
+        details = [alias for alias in self.aliases if alias.startswith("CVE-")][:1]
+        if self.severity:
+            details.append(self.severity)
+        return f"{self.id} ({', '.join(details)})" if details else self.id
+
+
+@dataclass(frozen=True)
+class SecurityAssessment:
+    coordinate: str
+    version: str
+    advisories: Tuple[Advisory, ...] = ()
+    fixed_version: str = ""
+
+    @property
+    def affected(self) -> bool:
+        return bool(self.advisories)
+
+    @property
+    def severity(self) -> str:
+        """영향을 주는 권고 중 가장 높은 심각도"""
+        return max((advisory.severity for advisory in self.advisories), key=SEVERITY_ORDER.get, default="")
+
+
+class _PackageIndex:
+    def __init__(self, intervals: List[list]):
+        """한 좌표의 [권고 ID, 시작, 끝, 끝 포함 여부] 목록을 겹치지 않는 구간으로 변환"""
+        self.intervals: List[Tuple[str, Bound, Bound]] = []
+        for advisory_id, start, end, inclusive in intervals:
+            self.intervals.append((
+                advisory_id,
+                _bound(start) if start else _MIN_BOUND,
+                _bound(end, after=inclusive) if end else _MAX_BOUND,
+            ))
+
+        bounds = sorted({bound for _, start, end in self.intervals for bound in (start, end)})
+        self.starts: List[Bound] = []
+        self.covers: List[Tuple[int, ...]] = []
+        for bound in bounds:
+            covering = tuple(
+                i for i, (_, start, end) in enumerate(self.intervals) if start <= bound < end
+            )
+            # 이웃 구간과 덮는 권고가 같으면 합친다
+            if not self.covers or self.covers[-1] != covering:
+                self.starts.append(bound)
+                self.covers.append(covering)
+
+    def covering(self, version: str) -> Tuple[int, ...]:
+        """version 을 포함하는 구간 번호들 (이진 탐색)"""
+        position = bisect.bisect_right(self.starts, _bound(version)) - 1
+        return self.covers[position] if position >= 0 else ()
+
+
+class VulnerabilityIndex:
+    def __init__(self, path: Optional[str] = None):
+        """OSV 덤프로 만든 색인 파일 (첫 조회 때 한 번만 읽고, 좌표별 구간은 필요할 때 만든다)
+
+        파일이 없으면 available 이 False 이고 모든 버전을 영향 없음으로 본다.
+        """
+        self.path = path or default_vulnerability_index_path()
+        self.version = ""
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._advisories: Dict[str, dict] = {}
+        self._packages: Dict[str, List[list]] = {}
+        self._indexes: Dict[str, _PackageIndex] = {}
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            if os.path.exists(self.path):
+                with open(self.path, encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("format") != VULNERABILITY_INDEX_FORMAT:
+                    raise ValueError(f"지원하지 않는 취약점 색인 형식입니다: {self.path}")
+                self.version = data.get("version", "")
+                self._advisories = data.get("advisories", {})
+                self._packages = data.get("packages", {})
+            self._loaded = True
+
+    @property
+    def available(self) -> bool:
+        """색인 파일을 읽었고 좌표가 하나 이상 있는지"""
+        self._ensure_loaded()
+        return bool(self._packages)
+
+    def __len__(self) -> int:
+        self._ensure_loaded()
+        return len(self._packages)
+
+    def _package(self, coordinate: str) -> Optional[_PackageIndex]:
+        self._ensure_loaded()
+        index = self._indexes.get(coordinate)
+        if index is None:
+            intervals = self._packages.get(coordinate)
+            if not intervals:
+                return None
+            index = self._indexes[coordinate] = _PackageIndex(intervals)
+        return index
+
+    def _advisory(self, advisory_id: str) -> Advisory:
+        record = self._advisories.get(advisory_id, {})
+        return Advisory(
+            id=advisory_id,
+            aliases=tuple(record.get("aliases", ())),
+            summary=record.get("summary", ""),
+            severity=record.get("severity", ""),
+        )
+
+    def affected(self, coordinate: str, version: str) -> List[Advisory]:
+        """coordinate 의 version 에 영향을 주는 권고 목록"""
+        package = self._package(coordinate)
+        if package is None or not version:
+            return []
+        ids = dict.fromkeys(package.intervals[i][0] for i in package.covering(version))
+        return [self._advisory(advisory_id) for advisory_id in ids]
+
+    def assess(self, coordinate: str, version: str, latest_version: str = "") -> SecurityAssessment:
+        """영향 권고와 모든 권고가 해결되는 가장 낮은 수정 버전 계산
+
+        수정 버전이 없거나(last_affected, 끝이 열린 구간) 알려진 최신 버전보다 높으면 fixed_version 은 빈 문자열이다.
+        """
+        package = self._package(coordinate)
+        if package is None or not version:
+            return SecurityAssessment(coordinate, version)
+
+        covering = package.covering(version)
+        if not covering:
+            return SecurityAssessment(coordinate, version)
+
+        advisories = [
+            self._advisory(advisory_id)
+            for advisory_id in dict.fromkeys(package.intervals[i][0] for i in covering)
+        ]
+
+        # 수정 버전 후보가 또 다른 권고에 걸리면 그 구간의 끝으로 넘어간다 (구간 수만큼만 반복)
+        fixed_version = ""
+        for _ in range(len(package.intervals) + 1):
+            ends = [package.intervals[i][2] for i in covering]
+            if any(end[0] != 1 or end[2] for end in ends):
+                fixed_version = ""
+                break
+            fixed_version = max(ends)[1].value
+            covering = package.covering(fixed_version)
+            if not covering:
+                break
+        else:
+            fixed_version = ""
+
+        if fixed_version and latest_version and ComparableVersion(fixed_version) > ComparableVersion(latest_version):
+            fixed_version = ""
+
+        return SecurityAssessment(coordinate, version, tuple(advisories), fixed_version)
+
+
+def security_fields(assessment: SecurityAssessment, update_type: str) -> Optional[dict]:
+    """색인 판단으로 정한 priority / recommendation / is_hotfix (UNKNOWN 이고 영향도 없으면 None)
+
+    보안 권고에 걸린 버전은 심각도로, 그렇지 않으면 업데이트 유형으로 정한다.
+    """
+    if assessment.affected:
+        return {
+            "priority": "높음" if SEVERITY_ORDER.get(assessment.severity, 0) >= SEVERITY_ORDER[HIGH] else "중간",
+            "recommendation": "업데이트 권장" if assessment.fixed_version else "검토 필요",
+            "is_hotfix": bool(assessment.fixed_version) or update_type == PATCH,
+            "advisories": [advisory.describe() for advisory in assessment.advisories],
+        }
+    if update_type == UNKNOWN:
+        return None
+    return {
+        "priority": "중간" if update_type in (PATCH, PRERELEASE) else "낮음",
+        "recommendation": {PATCH: "업데이트 권장", PRERELEASE: "업데이트 권장", MAJOR: "검토 필요"}.get(
+            update_type, "선택사항"
+        ),
+        "is_hotfix": update_type == PATCH,
+        "advisories": [],
+    }
+
+
+def _normalize_severity(record: dict) -> str:
+    severity = str((record.get("database_specific") or {}).get("severity") or "").upper()
+    severity = _SEVERITY_ALIASES.get(severity, severity)
+    return severity if severity in SEVERITY_ORDER else ""
+
+
+def _record_intervals(affected: dict) -> Iterator[Tuple[str, str, bool]]:
+    """OSV affected 항목 하나의 (시작, 끝, 끝 포함 여부) 구간들 (빈 문자열은 열린 끝)"""
+    for version_range in affected.get("ranges", ()):
+        if version_range.get("type") not in ("ECOSYSTEM", "SEMVER"):
+            continue
+        start = None
+        for event in version_range.get("events", ()):
+            if "introduced" in event:
+                start = "" if event["introduced"] in ("0", "") else event["introduced"]
+            elif start is not None and "fixed" in event:
+                yield start, event["fixed"], False
+                start = None
+            elif start is not None and "last_affected" in event:
+                yield start, event["last_affected"], True
+                start = None
+        if start is not None:
+            yield start, "", False
+
+    for version in affected.get("versions", ()):
+        yield version, version, True
+
+
+def compile_osv_records(records: Iterable[dict]) -> Tuple[Dict[str, dict], Dict[str, List[list]]]:
+    """OSV 레코드들을 (권고 ID → 정보, 좌표 → [권고 ID, 시작, 끝, 끝 포함] 목록)으로 변환"""
+    advisories: Dict[str, dict] = {}
+    packages: Dict[str, List[list]] = {}
+
+    for record in records:
+        if record.get("withdrawn") or not record.get("id"):
+            continue
+        advisory_id = record["id"]
+
+        for affected in record.get("affected", ()):
+            package = affected.get("package") or {}
+            if package.get("ecosystem") != OSV_ECOSYSTEM or ":" not in package.get("name", ""):
+                continue
+
+            # 명시된 버전 목록이 구간과 겹치면 중복이지만 결과는 같으므로 그대로 둔다
+            intervals = {
+                (advisory_id, start, end, inclusive)
+                for start, end, inclusive in _record_intervals(affected)
+            }
+            if not intervals:
+                continue
+
+            packages.setdefault(package["name"], []).extend(sorted(list(i) for i in intervals))
+            advisories[advisory_id] = {
+                "aliases": list(record.get("aliases", ())),
+                "summary": record.get("summary", ""),
+                "severity": _normalize_severity(record),
+            }
+
+    return advisories, packages
+
+
+def iter_osv_dump(path: str) -> Iterator[dict]:
+    """OSV 덤프 읽기: all.zip, 권고 JSON 파일이 든 디렉터리, JSON 파일 하나, JSON Lines 파일"""
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as archive:
+            for name in archive.namelist():
+                if name.endswith(".json"):
+                    yield json.loads(archive.read(name).decode("utf-8"))
+        return
+
+    if os.path.isdir(path):
+        for root, _, files in os.walk(path):
+            for name in sorted(files):
+                if name.endswith(".json"):
+                    with open(os.path.join(root, name), encoding="utf-8") as f:
+                        yield json.load(f)
+        return
+
+    with open(path, encoding="utf-8") as f:
+        if path.endswith(".jsonl"):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+            return
+        data = json.load(f)
+    yield from data if isinstance(data, list) else [data]
+
+
+def build_vulnerability_index(dump_path: str, output_path: Optional[str] = None) -> Tuple[str, int, int]:
+    """OSV 덤프로 색인 파일을 만들고 (저장 경로, 권고 수, 좌표 수)를 반환"""
+    output_path = output_path or default_vulnerability_index_path()
+    advisories, packages = compile_osv_records(iter_osv_dump(dump_path))
+
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    data = {
+        "format": VULNERABILITY_INDEX_FORMAT,
+        "version": time.strftime("%Y-%m-%d"),
+        "advisories": advisories,
+        "packages": {coordinate: packages[coordinate] for coordinate in sorted(packages)},
+    }
+    temp_path = f"{output_path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(temp_path, output_path)
+
+    return output_path, len(advisories), len(packages)
+
+
+_default_index: Optional[VulnerabilityIndex] = None
+_default_lock = threading.Lock()
+
+
+def get_vulnerability_index() -> VulnerabilityIndex:
+    """프로세스 전체가 공유하는 기본 취약점 색인"""
+    global _default_index
+    with _default_lock:
+        if _default_index is None:
+            _default_index = VulnerabilityIndex()
+        return _default_index
@@ -0,0 +1,373 @@
+# 업스트림 새 릴리스 감시 (watch 모드)
+# 감시 대상 카탈로그가 참조하는 좌표를 레지스트리(SQLite) 하나에 모아 두고 주기적으로 확인한다.
+#   - 확인은 maven-metadata.xml 조건부 GET 이라 바뀌지 않은 좌표는 304 응답 하나로 끝난다
+#   - 여러 카탈로그가 같은 좌표를 써도 좌표당 한 번만 확인한다 (동시 요청은 SingleFlight 로 합쳐진다)
+#   - 좌표마다 다음 확인 시각에 지터를 줘서 요청이 한 순간에 몰리지 않고 주기 전체에 퍼진다
+#   - 저장소에 maven-metadata.xml 이 없는 좌표는 Maven 검색 묶음 쿼리로 한꺼번에 확인한다
+#   - 새 릴리스가 나온 좌표만 analyze_library 로 분석해 알리고, 처음 보는 좌표는 기준선만 기록한다
+#   - 새 최신 버전은 분석과 알림이 끝난 뒤에 기록하므로, 도중에 실패하면 다음 확인 때 다시 알린다
+#   - 호출 한도(429)에 걸린 분석은 Retry-After 만큼 기다렸다가 다시 실행한다
+#   - 확인/분석/알림 실패는 지수 백오프로 다시 시도한다
+# 카탈로그 파일은 수정 시각이 바뀐 경우에만 다시 파싱한다.
+
+import os
+import random
+import sqlite3
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from libguard.analyzer import LibraryInfo, StableLibraryAnalyzer
+from libguard.cache import default_cache_dir
+from libguard.catalog import find_catalogs, parse_catalog
+from libguard.engine import DEFAULT_MAX_REQUEUES
+from libguard.metadata import MISSING, MetadataFetcher
+from libguard.ratelimit import RateLimitExceeded
+from libguard.versions import compare_versions
+
+DEFAULT_INTERVAL_SECONDS = 60 * 60
+DEFAULT_JITTER = 0.1
+# 실패한 좌표의 재시도 간격 상한
+MAX_BACKOFF_SECONDS = 6 * 60 * 60
+# 확인할 좌표가 없을 때도 카탈로그 변경을 알아차리도록 이 간격보다 오래 잠들지 않는다
+MAX_SLEEP_SECONDS = 60
+
+# 좌표 확인 방법
+SOURCE_METADATA = "metadata"  # maven-metadata.xml 조건부 GET
+SOURCE_SEARCH = "search"      # Maven 검색 묶음 쿼리 (메타데이터가 없는 저장소/좌표)
+
+
+def default_watch_path() -> str:
+    return os.path.join(default_cache_dir(), "watch.sqlite3")
+
+
+@dataclass(frozen=True)
+class TrackedEntry:
+    catalog: str
+    key: str
+    coordinate: str
+    version: str
+
+
+@dataclass
+class ReleaseAlert:
+    coordinate: str
+    previous: str
+    latest: str
+    entries: List[TrackedEntry] = field(default_factory=list)
+    results: List[LibraryInfo] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {
+            "coordinate": self.coordinate,
+            "previous": self.previous,
+            "latest": self.latest,
+            "entries": [asdict(entry) for entry in self.entries],
+            "results": [asdict(result) for result in self.results],
+        }
+
+
+@dataclass
+class WatchCycle:
+    tracked: int = 0
+    added: int = 0
+    removed: int = 0
+    checked: int = 0
+    unchanged: int = 0
+    failed: int = 0
+    analyzed: int = 0
+    alerts: List[ReleaseAlert] = field(default_factory=list)
+    # 분석이나 알림에 실패해 다음 확인으로 미룬 좌표 → 오류
+    errors: Dict[str, str] = field(default_factory=dict)
+
+
+class WatchRegistry:
+    def __init__(self, path: Optional[str] = None):
+        """감시 중인 좌표별 마지막 최신 버전과 다음 확인 시각"""
+        self.path = path or default_watch_path()
+        self._lock = threading.Lock()
+
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS watched (
+                    coordinate TEXT PRIMARY KEY,
+                    latest TEXT NOT NULL,
+                    source TEXT NOT NULL,
+                    next_check REAL NOT NULL,
+                    checked_at REAL NOT NULL,
+                    failures INTEGER NOT NULL
+                )
+                """
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS watched_next_check ON watched (next_check)")
+
+    def sync(self, coordinates: List[str], spread: float = 0) -> Tuple[int, int]:
+        """감시 대상을 coordinates 로 맞춘다 → (추가, 제거)
+
+        새 좌표는 spread 초 안의 임의 시각에 첫 확인을 잡아 한꺼번에 몰리지 않게 한다.
+        """
+        now = time.time()
+        wanted = set(coordinates)
+        with self._lock, self._conn:
+            existing = {row[0] for row in self._conn.execute("SELECT coordinate FROM watched")}
+            added = wanted - existing
+            removed = existing - wanted
+            self._conn.executemany(
+                "INSERT INTO watched (coordinate, latest, source, next_check, checked_at, failures) "
+                "VALUES (?, '', ?, ?, 0, 0)",
+                [(coordinate, SOURCE_METADATA, now + random.uniform(0, spread)) for coordinate in sorted(added)],
+            )
+            self._conn.executemany("DELETE FROM watched WHERE coordinate = ?", [(c,) for c in removed])
+        return len(added), len(removed)
+
+    def due(self, now: Optional[float] = None) -> List[dict]:
+        """확인할 때가 된 좌표"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT coordinate, latest, source, checked_at, failures FROM watched "
+                "WHERE next_check <= ? ORDER BY next_check",
+                (time.time() if now is None else now,),
+            ).fetchall()
+        return [
+            {"coordinate": row[0], "latest": row[1], "source": row[2], "checked_at": row[3], "failures": row[4]}
+            for row in rows
+        ]
+
+    def next_due(self) -> Optional[float]:
+        with self._lock:
+            row = self._conn.execute("SELECT MIN(next_check) FROM watched").fetchone()
+        return row[0] if row else None
+
+    def record(self, coordinate: str, latest: str, source: str, next_check: float, failures: int = 0):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE watched SET latest = ?, source = ?, next_check = ?, checked_at = ?, failures = ? "
+                "WHERE coordinate = ?",
+                (latest, source, next_check, time.time(), failures, coordinate),
+            )
+
+    def postpone(self, coordinate: str, next_check: float, failures: int):
+        """확인 실패: 기존 최신 버전은 그대로 두고 다음 확인만 미룬다"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE watched SET next_check = ?, failures = ? WHERE coordinate = ?",
+                (next_check, failures, coordinate),
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM watched").fetchone()[0]
+
+
+class CatalogTracker:
+    def __init__(self, paths: List[str]):
+        """감시 경로의 카탈로그 항목 (수정 시각이 바뀐 파일만 다시 파싱)"""
+        self.paths = paths
+        self.errors: Dict[str, str] = {}
+        self._parsed: Dict[str, Tuple[float, List[TrackedEntry]]] = {}
+
+    def entries(self) -> List[TrackedEntry]:
+        entries = []
+        parsed = {}
+        for path in find_catalogs(self.paths):
+            try:
+                mtime = os.path.getmtime(path)
+            except OSError:
+                continue
+            cached = self._parsed.get(path)
+            if cached is None or cached[0] != mtime:
+                try:
+                    with open(path, encoding="utf-8") as f:
+                        catalog = parse_catalog(f.read())
+                except (OSError, ValueError) as e:
+                    # 편집 중인 파일 등은 이전 내용으로 계속 감시한다
+                    self.errors[path] = str(e)
+                    if cached is None:
+                        continue
+                else:
+                    self.errors.pop(path, None)
+                    cached = (mtime, [
+                        TrackedEntry(path, entry.key, entry.coordinate, entry.version)
+                        for entry in catalog.versioned_entries()
+                    ])
+            parsed[path] = cached
+            entries.extend(cached[1])
+        self._parsed = parsed
+        return entries
+
+
+class Watcher:
+    def __init__(
+        self,
+        analyzer: StableLibraryAnalyzer,
+        fetcher: MetadataFetcher,
+        registry: WatchRegistry,
+        tracker: CatalogTracker,
+        interval: float = DEFAULT_INTERVAL_SECONDS,
+        jitter: float = DEFAULT_JITTER,
+        max_workers: int = 8,
+        include_prereleases: bool = False,
+        on_alert: Optional[Callable[[ReleaseAlert], None]] = None,
+    ):
+        """새 릴리스 감시기 (poll_once 한 번 = 확인할 때가 된 좌표만 확인)"""
+        self.analyzer = analyzer
+        self.fetcher = fetcher
+        self.registry = registry
+        self.tracker = tracker
+        self.interval = max(1.0, interval)
+        self.jitter = min(max(0.0, jitter), 1.0)
+        self.max_workers = max(1, max_workers)
+        self.include_prereleases = include_prereleases
+        self.on_alert = on_alert
+
+    def _next_check(self, failures: int = 0) -> float:
+        """다음 확인 시각 (주기 ± 지터, 실패가 이어지면 지수 백오프)"""
+        delay = self.interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+        if failures:
+            delay = min(MAX_BACKOFF_SECONDS, max(delay, self.interval) * 2 ** (failures - 1))
+        return time.time() + delay
+
+    def poll_once(self, now: Optional[float] = None) -> WatchCycle:
+        cycle = WatchCycle()
+        entries = self.tracker.entries()
+        by_coordinate: Dict[str, List[TrackedEntry]] = {}
+        for entry in entries:
+            by_coordinate.setdefault(entry.coordinate, []).append(entry)
+
+        # 새 좌표의 첫 확인(기준선)은 지터 범위 안에 퍼뜨린다
+        cycle.added, cycle.removed = self.registry.sync(list(by_coordinate), spread=self.interval * self.jitter)
+        cycle.tracked = len(by_coordinate)
+
+        due = self.registry.due(now)
+        cycle.checked = len(due)
+        releases: List[Tuple[dict, str, str]] = []  # (행, 최신 버전, 확인 방법)
+        searched = []
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="libguard-watch") as pool:
+            metadata_due = [row for row in due if row["source"] == SOURCE_METADATA]
+            for row, outcome in zip(metadata_due, pool.map(self._check_metadata, metadata_due)):
+                if outcome is None:
+                    cycle.failed += 1
+                elif outcome == SOURCE_SEARCH:
+                    searched.append(row)
+                else:
+                    releases.append((row, outcome, SOURCE_METADATA))
+
+            searched.extend(row for row in due if row["source"] == SOURCE_SEARCH)
+            if searched:
+                failed, found = self._check_search(searched)
+                cycle.failed += failed
+                releases.extend((row, latest, SOURCE_SEARCH) for row, latest in found)
+
+            # 새 릴리스가 아니면 바로 기록하고, 새 릴리스는 분석과 알림이 끝난 뒤에 기록한다
+            alerts: List[Tuple[dict, str, ReleaseAlert]] = []
+            for row, latest, source in releases:
+                if row["latest"] and latest and compare_versions(latest, row["latest"]) > 0:
+                    entries = by_coordinate.get(row["coordinate"], [])
+                    alerts.append((row, source, ReleaseAlert(row["coordinate"], row["latest"], latest, entries)))
+                else:
+                    self.registry.record(row["coordinate"], latest, source, self._next_check())
+            cycle.unchanged = len(releases) - len(alerts)
+            cycle.analyzed, cycle.errors = self._analyze(pool, [alert for _, _, alert in alerts])
+
+        for row, source, alert in alerts:
+            if alert.coordinate not in cycle.errors:
+                error = self._deliver(alert)
+                if error is None:
+                    self.registry.record(alert.coordinate, alert.latest, source, self._next_check())
+                    cycle.alerts.append(alert)
+                    continue
+                cycle.errors[alert.coordinate] = error
+            cycle.failed += 1
+            self.registry.postpone(alert.coordinate, self._next_check(row["failures"] + 1), row["failures"] + 1)
+        return cycle
+
+    def _check_metadata(self, row: dict):
+        """maven-metadata.xml 조건부 GET → 최신 버전, 메타데이터가 없으면 SOURCE_SEARCH, 실패면 None"""
+        coordinate = row["coordinate"]
+        try:
+            fetched = self.fetcher.refresh(coordinate, force=True)
+        except Exception:
+            self.registry.postpone(coordinate, self._next_check(row["failures"] + 1), row["failures"] + 1)
+            return None
+
+        if fetched.status == MISSING or fetched.index is None:
+            return SOURCE_SEARCH
+        return fetched.index.latest(self.include_prereleases) or row["latest"]
+
+    def _check_search(self, rows: List[dict]) -> Tuple[int, List[Tuple[dict, str]]]:
+        """메타데이터가 없는 좌표는 검색 묶음 쿼리 몇 번으로 한꺼번에 확인 → (실패 수, [(행, 최신 버전)])"""
+        try:
+            latest_versions = self.analyzer.lookup_latest_versions([row["coordinate"] for row in rows])
+        except Exception:
+            for row in rows:
+                self.registry.postpone(row["coordinate"], self._next_check(row["failures"] + 1), row["failures"] + 1)
+            return len(rows), []
+
+        return 0, [(row, latest_versions.get(row["coordinate"], "") or row["latest"]) for row in rows]
+
+    def _analyze(self, pool: ThreadPoolExecutor, alerts: List[ReleaseAlert]) -> Tuple[int, Dict[str, str]]:
+        """새 릴리스가 나온 좌표의 항목만 분석 → (분석 수, 분석에 실패한 좌표 → 오류)
+
+        같은 좌표/버전은 카탈로그가 여러 개여도 한 번만 분석한다.
+        호출 한도(429)에 걸린 항목은 Retry-After 만큼 기다렸다가 최대 DEFAULT_MAX_REQUEUES 번 다시 분석한다.
+        """
+        jobs = {}
+        for alert in alerts:
+            for entry in alert.entries:
+                if entry.version and compare_versions(entry.version, alert.latest) < 0:
+                    jobs.setdefault((alert.coordinate, entry.version), (alert, entry))
+
+        pending = {
+            pool.submit(self._analyze_entry, entry, alert.latest): (alert, entry, 0) for alert, entry in jobs.values()
+        }
+        errors: Dict[str, str] = {}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                alert, entry, attempts = pending.pop(future)
+                try:
+                    alert.results.append(future.result())
+                except RateLimitExceeded as e:
+                    if attempts < DEFAULT_MAX_REQUEUES:
+                        retry = pool.submit(self._analyze_entry, entry, alert.latest, e.retry_after)
+                        pending[retry] = (alert, entry, attempts + 1)
+                    else:
+                        errors[alert.coordinate] = str(e)
+                except Exception as e:
+                    errors[alert.coordinate] = f"분석 중 예외 발생: {e}"
+        return len(jobs), errors
+
+    def _analyze_entry(self, entry: TrackedEntry, latest: str, delay: float = 0.0) -> LibraryInfo:
+        if delay > 0:
+            time.sleep(delay)
+        return self.analyzer.analyze_library(entry.key, entry.version, entry.coordinate, latest)
+
+    def _deliver(self, alert: ReleaseAlert) -> Optional[str]:
+        """on_alert 호출 (실패하면 오류 메시지 → 다음 확인 때 다시 알린다)"""
+        if self.on_alert is None:
+            return None
+        try:
+            self.on_alert(alert)
+        except Exception as e:
+            return f"알림 실패: {e}"
+        return None
+
+    def run(self, stop: Optional[threading.Event] = None, on_cycle: Optional[Callable[[WatchCycle], None]] = None):
+        """stop 이 설정될 때까지 확인할 때가 된 좌표를 계속 확인"""
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            cycle = self.poll_once()
+            if on_cycle is not None:
+                on_cycle(cycle)
+            next_due = self.registry.next_due()
+            delay = MAX_SLEEP_SECONDS if next_due is None else next_due - time.time()
+            stop.wait(min(max(1.0, delay), MAX_SLEEP_SECONDS))
@@ -1,248 +1,351 @@
 import streamlit as st
-import toml
+import hashlib
+import json
 import os
-from typing import Dict, List
-from dataclasses import dataclass
-import requests
 import time
+from typing import List, Optional
 from dotenv import load_dotenv
-import json
+
+from libguard import LibraryInfo, ResultCache
+from libguard.analyzer import OPENAI_MODEL
+from libguard.jobs import ACTIVE_STATUSES, DONE, FAILED, QUEUED, Job, JobStore, WorkerPool, owner_id
+from libguard.metrics import STAGE_CACHE, STAGE_KNOWLEDGE, STAGE_LLM, STAGE_MAVEN, STAGE_SECURITY
+from libguard.reports import REPORT_WRITERS, render_report
+from libguard.results_view import (
+    PRIORITY_RANKS, ResultFilter, display_frame, filter_frame, page_slice, results_frame, sort_frame, summary_counts,
+)
+from libguard.streaming import PartialResult
+from libguard.versions import UP_TO_DATE, UPDATE_TYPE_LABELS
 
 # .env 파일 로드
 load_dotenv()
 
+# 세션에 보관하는 마지막 분석 결과 키
+RUN_STATE_KEY = "analysis_run"
+# 세션이 따라가는 분석 작업 ID 키
+JOB_STATE_KEY = "analysis_job"
+# 요약 탭의 단계 표시 이름
+STAGE_LABELS = {
+    STAGE_CACHE: "캐시 조회",
+    STAGE_MAVEN: "Maven 조회",
+    STAGE_KNOWLEDGE: "지식 베이스",
+    STAGE_SECURITY: "취약점 색인",
+    STAGE_LLM: "AI 분석",
+}
+# 리포트 탭의 형식 선택 표시 이름
+REPORT_FORMAT_LABELS = {
+    "markdown": "Markdown",
+    "html": "HTML (페이지 나눔)",
+    "sarif": "SARIF (code scanning)",
+    "jsonl": "JSON Lines",
+}
+# 상세 결과 탭의 정렬 기준 (표시 이름, 열, 내림차순)
+RESULT_SORT_OPTIONS = {
+    "catalog": ("카탈로그 순서", None, False),
+    "risk": ("위험도 높은 순", "priority_rank", True),
+    "advisories": ("보안 권고 많은 순", "advisories", True),
+    "name": ("이름순", "name", False),
+    "update_type": ("업데이트 유형", "update_type", False),
+}
+RESULT_PAGE_SIZES = [25, 50, 100, 200]
+# 리포트 탭 미리보기에 넣는 라이브러리 수
+REPORT_PREVIEW_LIMIT = 50
+# 같은 파일/옵션의 완료된 분석을 재사용하는 기간과 보관 개수
+COMPLETED_RUN_TTL_SECONDS = 60 * 60
+# 실행 중인 작업 진행 상황을 다시 읽는 간격
+JOB_POLL_SECONDS = 1.0
+# 진행 화면에 보여줄 중간 요약 수
+LIVE_PARTIAL_LIMIT = 8
+
+
+@st.cache_resource
+def get_result_cache() -> ResultCache:
+    """프로세스 전체(모든 세션)가 공유하는 분석 결과 캐시"""
+    return ResultCache()
+
+
+@st.cache_resource
+def get_job_store() -> JobStore:
+    """분석 작업 큐 (캐시 비우기용)"""
+    return JobStore()
+
+
+@st.cache_resource
+def get_worker_pool() -> WorkerPool:
+    """모든 세션과 API 키가 공유하는 워커 프로세스 풀 (워커는 처음 작업을 제출할 때 뜬다)"""
+    return WorkerPool()
+
+
+def make_run_key(content: bytes, **options) -> str:
+    """업로드 파일 내용과 결과에 영향을 주는 옵션으로 실행 키 생성"""
+    raw = json.dumps(
+        {"content": hashlib.sha256(content).hexdigest(), **options},
+        sort_keys=True,
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def render_partials(partials: List[PartialResult]):
+    """워커가 스트리밍으로 받고 있는 요약 (작성 중인 것 먼저, 최근 것 몇 개만)"""
+    writing = [partial for partial in partials if not partial.done][:LIVE_PARTIAL_LIMIT]
+    finished = [partial for partial in partials if partial.done][:max(0, LIVE_PARTIAL_LIMIT - len(writing))]
+    for partial in writing:
+        st.expander(f"✍️ {partial.name} - 분석 중", expanded=True).markdown(partial.summary or "...")
+    for partial in finished:
+        st.expander(f"✅ {partial.name}").markdown(partial.summary)
+
+
+def follow_job(pool: WorkerPool, job: Job, openai_api_key: str) -> Optional[dict]:
+    """작업 진행 상황 표시 (끝나지 않았으면 잠시 뒤 다시 그리기), 완료되면 실행 결과 반환"""
+    if job.status == FAILED:
+        st.error(f"❌ 분석 중 오류 발생: {job.error}")
+        st.info("💡 문제가 지속되면 분당 최대 요청 수나 라이브러리 수를 줄여보세요.")
+        st.session_state.pop(JOB_STATE_KEY, None)
+        return None
+
+    if job.status == DONE:
+        return job.to_run()
+
+    pool.ensure_running(openai_api_key)
+    if job.status == QUEUED:
+        st.info(f"⏳ 분석 대기 중 (대기 작업 {pool.store.pending(job.owner)}개, 워커 {pool.alive}개)")
+    else:
+        st.progress(job.done / job.total if job.total else 0.0)
+        st.text(f"🔍 분석 중: {job.message} - {job.done}/{job.total}")
+        render_partials(pool.store.partials(job.id))
+    st.caption("분석은 별도 워커 프로세스에서 실행됩니다. 브라우저를 닫아도 계속되며, 같은 파일을 다시 올리면 이어서 볼 수 있습니다.")
+
+    time.sleep(JOB_POLL_SECONDS)
+    st.rerun()
+
+
+def get_report(run: dict, report_format: str) -> str:
+    """형식별 리포트 (처음 요청될 때 한 번만 만들어 실행 결과에 보관)"""
+    reports = run.setdefault("reports", {})
+    if report_format not in reports:
+        reports[report_format] = render_report(
+            run["results"], report_format, run["analyzed_at"], run.get("locations")
+        )
+    return reports[report_format]
+
+
+def get_results_frame(run: dict):
+    """결과 표 (실행마다 한 번만 만들어 run 에 보관)"""
+    if "frame" not in run:
+        run["frame"] = results_frame(run["results"])
+    return run["frame"]
 
-@dataclass
-class LibraryInfo:
-    name: str
-    current_version: str
-    latest_version: str = ""
-    is_hotfix: bool = False
-    priority: str = "low"
-    summary: str = ""
-    recommendation: str = ""
-
-
-class StableLibraryAnalyzer:
-    def __init__(self, openai_api_key: str):
-        """안정적인 라이브러리 분석기 (직접 HTTP 요청 사용)"""
-        self.api_key = openai_api_key
-        self.base_url = "https://api.openai.com/v1/chat/completions"
-
-    def call_openai_api(self, messages: List[dict], max_tokens: int = 500) -> str:
-        """OpenAI API 직접 호출 (proxies 오류 방지)"""
-        headers = {
-            'Authorization': f'Bearer {self.api_key}',
-            'Content-Type': 'application/json',
-        }
-
-        data = {
-            'model': 'gpt-3.5-turbo',
-            'messages': messages,
-            'max_tokens': max_tokens,
-            'temperature': 0.1
-        }
-
-        try:
-            response = requests.post(
-                self.base_url,
-                headers=headers,
-                json=data,
-                timeout=30
+
+def render_library_detail(result: LibraryInfo):
+    """라이브러리 하나의 상세 정보 (선택한 행만 그린다)"""
+    if result.latest_version:
+        st.write(f"**최신 버전**: {result.latest_version}")
+
+        # 버전 비교 표시
+        if result.update_type == UP_TO_DATE:
+            st.write("**상태**: 최신 버전 사용 중")
+        else:
+            update_label = UPDATE_TYPE_LABELS.get(result.update_type, "")
+            st.write(
+                f"**업데이트 가능**: {result.current_version} → {result.latest_version}"
+                + (f" ({update_label})" if update_label else "")
             )
 
-            if response.status_code == 200:
-                result = response.json()
-                return result['choices'][0]['message']['content']
-            else:
-                return f"API 호출 실패: {response.status_code} - {response.text}"
-
-        except Exception as e:
-            return f"네트워크 오류: {str(e)}"
-
-    def search_maven_central(self, library_name: str) -> str:
-        """Maven Central에서 라이브러리 정보 검색"""
-        try:
-            search_url = "https://search.maven.org/solrsearch/select"
-            params = {
-                'q': library_name,
-                'rows': 3,
-                'wt': 'json'
-            }
+    if result.priority and result.priority != "low":
+        priority_color = {"높음": "🔴", "중간": "🟡", "낮음": "🟢"}.get(result.priority, "")
+        st.write(f"**우선순위**: {priority_color} {result.priority}")
 
-            response = requests.get(search_url, params=params, timeout=10)
-            response.raise_for_status()
-
-            data = response.json()
-            docs = data.get('response', {}).get('docs', [])
-
-            if not docs:
-                return f"'{library_name}'에 대한 검색 결과가 없습니다."
-
-            results = []
-            for doc in docs[:2]:
-                artifact = f"{doc.get('g', 'unknown')}:{doc.get('a', 'unknown')}"
-                latest_version = doc.get('latestVersion', 'unknown')
-                results.append(f"- {artifact}: {latest_version}")
-
-            return "Maven Central 검색 결과:\n" + "\n".join(results)
-
-        except Exception as e:
-            return f"Maven Central 검색 중 오류: {str(e)}"
-
-    def get_library_info(self, library_name: str, current_version: str) -> str:
-        """라이브러리 기본 정보 제공"""
-        # 주요 안드로이드 라이브러리들의 최신 정보 (2025년 기준)
-        known_libraries = {
-            'okhttp': {
-                'latest': '4.12.0',
-                'info': 'HTTP 클라이언트 라이브러리. 최신 버전에서 보안 패치, 성능 개선, HTTP/3 지원 강화.'
-            },
-            'retrofit': {
-                'latest': '2.9.0',
-                'info': 'REST API 클라이언트. 안정적인 버전, 코루틴 지원 개선, 에러 핸들링 강화.'
-            },
-            'glide': {
-                'latest': '4.16.0',
-                'info': '이미지 로딩 라이브러리. 메모리 최적화, WebP 지원 개선, 새로운 애니메이션 기능.'
-            },
-            'gson': {
-                'latest': '2.10.1',
-                'info': 'JSON 라이브러리. 보안 패치, 성능 개선, null 안전성 강화.'
-            },
-            'picasso': {
-                'latest': '2.8',
-                'info': '이미지 로딩 라이브러리. 안정적인 버전, 큰 변경사항 없음.'
-            },
-            'androidx-core': {
-                'latest': '1.12.0',
-                'info': 'AndroidX Core 라이브러리. 새로운 API 지원, 호환성 개선.'
-            },
-            'androidx-appcompat': {
-                'latest': '1.6.1',
-                'info': 'AppCompat 라이브러리. Material Design 3 지원, 테마 개선.'
-            },
-            'material': {
-                'latest': '1.11.0',
-                'info': 'Material Design 라이브러리. Material You 지원, 새로운 컴포넌트 추가.'
-            },
-            'constraintlayout': {
-                'latest': '2.1.4',
-                'info': 'ConstraintLayout. 성능 최적화, 새로운 레이아웃 기능.'
-            },
-            'timber': {
-                'latest': '5.0.1',
-                'info': '로깅 라이브러리. 안정적인 버전, 성능 개선.'
-            }
-        }
-
-        lib_key = library_name.lower().replace('-', '').replace('_', '')
-        for key, info in known_libraries.items():
-            if key.replace('-', '').replace('_', '') in lib_key:
-                return f"최신 버전: {info['latest']}, 정보: {info['info']}"
-
-        return f"{library_name}에 대한 기본 정보를 분석 중..."
-
-    def analyze_library(self, lib_name: str, current_version: str) -> LibraryInfo:
-        """개별 라이브러리 분석"""
-        try:
-            # 1. Maven Central에서 정보 수집
-            maven_info = self.search_maven_central(lib_name)
-
-            # 2. 기본 라이브러리 정보 수집
-            lib_info = self.get_library_info(lib_name, current_version)
-
-            # 3. AI 분석 요청
-            messages = [
-                {
-                    "role": "system",
-                    "content": "당신은 안드로이드 라이브러리 업데이트 전문가입니다. 항상 JSON 형식으로 응답하세요."
-                },
-                {
-                    "role": "user",
-                    "content": f"""
-안드로이드 라이브러리를 분석해주세요.
-
-라이브러리: {lib_name}
-현재 버전: {current_version}
-
-수집된 정보:
-{maven_info}
-{lib_info}
-
-다음 형식으로 JSON 응답해주세요:
-{{
-    "latest_version": "최신 버전",
-    "is_hotfix": true/false,
-    "priority": "높음/중간/낮음",
-    "summary": "주요 변경사항과 업데이트 권장사항을 한국어로 상세히 요약",
-    "recommendation": "업데이트 권장/검토 필요/선택사항"
-}}
-
-분석 기준:
-- 핫픽스: 패치 버전만 변경 (예: 4.11.0 → 4.11.1)
-- 우선순위: 보안 패치 > 버그 수정 > 새 기능 > 문서 업데이트
-- 권장사항: 핫픽스는 권장, 메이저 업데이트는 검토 필요
-"""
-                }
-            ]
-
-            # AI API 호출
-            ai_response = self.call_openai_api(messages, max_tokens=600)
-
-            # 오류 체크
-            if "API 호출 실패" in ai_response or "네트워크 오류" in ai_response:
-                return LibraryInfo(
-                    name=lib_name,
-                    current_version=current_version,
-                    summary=ai_response
-                )
+    if result.recommendation:
+        st.write(f"**권장사항**: {result.recommendation}")
 
-            try:
-                # JSON 파싱 시도
-                analysis_data = json.loads(ai_response)
-
-                return LibraryInfo(
-                    name=lib_name,
-                    current_version=current_version,
-                    latest_version=analysis_data.get('latest_version', ''),
-                    is_hotfix=analysis_data.get('is_hotfix', False),
-                    priority=analysis_data.get('priority', '중간'),
-                    summary=analysis_data.get('summary', ''),
-                    recommendation=analysis_data.get('recommendation', '')
-                )
-            except json.JSONDecodeError:
-                # JSON 파싱 실패 시 원본 텍스트 사용
-                return LibraryInfo(
-                    name=lib_name,
-                    current_version=current_version,
-                    summary=f"AI 분석 결과:\n{ai_response}"
-                )
+    if result.advisories:
+        st.error("🛡️ 보안 권고: " + ", ".join(result.advisories))
+
+    if result.is_hotfix:
+        st.warning("🔥 핫픽스 업데이트 권장!")
+
+    st.markdown("**분석 결과**:")
+    st.markdown(result.summary)
+
+
+def render_results_table(run: dict):
+    """필터/정렬한 결과 표를 한 페이지씩 보여주고, 고른 라이브러리의 상세 정보만 그리기"""
+    frame = get_results_frame(run)
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        priorities = st.multiselect("우선순위", list(PRIORITY_RANKS), key="filter_priorities")
+    with col2:
+        update_types = st.multiselect(
+            "업데이트 유형",
+            list(UPDATE_TYPE_LABELS),
+            format_func=UPDATE_TYPE_LABELS.get,
+            key="filter_update_types"
+        )
+    with col3:
+        query = st.text_input("라이브러리 검색", key="filter_query")
 
-        except Exception as e:
-            return LibraryInfo(
-                name=lib_name,
-                current_version=current_version,
-                summary=f"분석 중 예외 발생: {str(e)}"
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        hotfix_only = st.checkbox("핫픽스 대상만", key="filter_hotfix")
+    with col2:
+        vulnerable_only = st.checkbox("보안 권고 있는 항목만", key="filter_vulnerable")
+    with col3:
+        sort_key = st.selectbox(
+            "정렬",
+            list(RESULT_SORT_OPTIONS),
+            format_func=lambda key: RESULT_SORT_OPTIONS[key][0],
+            key="result_sort"
+        )
+    with col4:
+        page_size = st.selectbox("페이지 크기", RESULT_PAGE_SIZES, key="result_page_size")
+
+    filtered = filter_frame(frame, ResultFilter(
+        priorities=priorities,
+        update_types=update_types,
+        hotfix_only=hotfix_only,
+        vulnerable_only=vulnerable_only,
+        query=query.strip(),
+    ))
+    _, column, descending = RESULT_SORT_OPTIONS[sort_key]
+    ordered = sort_frame(filtered, column, descending)
+
+    # 필터로 결과가 줄면 보던 페이지 번호를 마지막 페이지로 맞춘다
+    pages = max(1, -(-len(ordered) // page_size))
+    if st.session_state.get("result_page", 1) > pages:
+        st.session_state["result_page"] = pages
+    page = st.number_input("페이지", min_value=1, max_value=pages, step=1, key="result_page")
+    page_frame, pages = page_slice(ordered, int(page), page_size)
+    st.caption(f"{len(ordered)} / {len(frame)}개 라이브러리 · {pages}페이지 중 {min(int(page), pages)}페이지")
+
+    if page_frame.empty:
+        st.info("조건에 맞는 라이브러리가 없습니다.")
+        return
+
+    st.dataframe(display_frame(page_frame), hide_index=True, use_container_width=True)
+
+    # 상세 정보는 현재 페이지에서 고른 라이브러리 하나만 그린다
+    selected = st.selectbox(
+        "상세 보기",
+        list(page_frame.index),
+        format_func=lambda index: f"📦 {frame.at[index, 'name']} (v{frame.at[index, 'current_version']})",
+        key="result_detail"
+    )
+    if selected is not None:
+        render_library_detail(run["results"][selected])
+
+
+def render_results(run: dict):
+    """저장된 분석 결과로 요약/상세/리포트 탭 그리기 (API 호출 없음)"""
+    if run["reused"]:
+        st.info(f"♻️ 변경이 없는 {run['reused']}개 라이브러리는 이전 분석 결과를 재사용했습니다.")
+
+    if run.get("skipped"):
+        st.warning(
+            f"💸 분석 예산 밖인 {run['skipped']}개 라이브러리는 AI 분석 없이 버전 비교와 로컬 정보로만 판단했습니다. "
+            "위험도가 높은 항목부터 예산을 사용합니다."
+        )
+
+    if run["deduplicated"]:
+        st.info(f"♻️ 같은 좌표/버전을 가리키는 {run['deduplicated']}개 항목은 한 번만 분석했습니다.")
+
+    st.header("📊 분석 결과")
+
+    tab1, tab2, tab3 = st.tabs(["📋 요약", "📚 상세 결과", "📝 마크다운 리포트"])
+
+    with tab1:
+        counts = summary_counts(get_results_frame(run))
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            st.metric("총 라이브러리", counts["total"])
+
+        with col2:
+            st.metric("핫픽스 대상", counts["hotfix"])
+
+        with col3:
+            st.metric("높은 우선순위", counts["high_priority"])
+
+        if run.get("metrics"):
+            render_metrics(run)
+
+    with tab2:
+        render_results_table(run)
+
+    with tab3:
+        report_format = st.selectbox(
+            "리포트 형식",
+            list(REPORT_FORMAT_LABELS),
+            format_func=REPORT_FORMAT_LABELS.get,
+            help="SARIF 는 GitHub code scanning 에 업로드할 수 있고, HTML 은 페이지 단위로 나눠 보여줍니다"
+        )
+        writer = REPORT_WRITERS[report_format]
+        st.download_button(
+            label="📥 리포트 다운로드",
+            data=get_report(run, report_format),
+            file_name=f"libguard_report_{time.strftime('%Y%m%d_%H%M%S', time.localtime(run['analyzed_at']))}"
+                      f".{writer.extension}",
+            mime=writer.mime
+        )
+
+        # 미리보기는 앞부분만 (전체는 다운로드, 라이브러리별 확인은 상세 결과 탭)
+        if "preview" not in run:
+            run["preview"] = render_report(
+                run["results"][:REPORT_PREVIEW_LIMIT], "markdown", run["analyzed_at"], run.get("locations")
             )
+        if len(run["results"]) > REPORT_PREVIEW_LIMIT:
+            st.caption(f"미리보기는 처음 {REPORT_PREVIEW_LIMIT}개 라이브러리만 보여줍니다. 전체 내용은 리포트를 다운로드하세요.")
+        st.markdown(run["preview"])
 
-    def parse_toml_content(self, toml_content: str) -> Dict[str, str]:
-        """TOML 내용 파싱"""
-        try:
-            toml_data = toml.loads(toml_content)
-            versions = toml_data.get('versions', {})
 
-            library_versions = {}
-            for key, value in versions.items():
-                if isinstance(value, str):
-                    library_versions[key] = value
-                elif isinstance(value, dict) and 'version' in value:
-                    library_versions[key] = value['version']
+def render_metrics(run: dict):
+    """실행 계측 (소요 시간, AI 호출/토큰, 예상 비용, 캐시 적중률, 단계별 시간)과 내보내기"""
+    metrics = run["metrics"]
+    st.subheader("⏱️ 실행 계측")
 
-            return library_versions
+    col1, col2, col3, col4, col5 = st.columns(5)
+    with col1:
+        st.metric("소요 시간", f"{metrics['duration_seconds']:.1f}초")
+    with col2:
+        st.metric("AI 호출", metrics["llm_calls"])
+    with col3:
+        st.metric("토큰", f"{metrics['prompt_tokens'] + metrics['completion_tokens']:,}")
+    with col4:
+        cost = metrics["estimated_cost_usd"]
+        st.metric("예상 비용", f"${cost:.4f}" if cost is not None else "알 수 없음")
+    with col5:
+        lookups = metrics["cache_hits"] + metrics["cache_misses"]
+        st.metric("캐시 적중률", f"{metrics['cache_hits'] / lookups:.0%}" if lookups else "-")
+
+    if metrics["stages"]:
+        st.table([
+            {
+                "단계": STAGE_LABELS.get(name, name),
+                "횟수": stage["count"],
+                "합계 (초)": round(stage["total_seconds"], 3),
+                "p50 (초)": round(stage["p50_seconds"], 3),
+                "p95 (초)": round(stage["p95_seconds"], 3),
+            }
+            for name, stage in metrics["stages"].items()
+        ])
+    st.caption("단계 시간은 동시 실행된 작업의 합계라 전체 소요 시간보다 클 수 있습니다.")
 
-        except Exception as e:
-            raise Exception(f"TOML 파일 파싱 중 오류 발생: {str(e)}")
+    stamp = time.strftime('%Y%m%d_%H%M%S', time.localtime(run['analyzed_at']))
+    col1, col2 = st.columns(2)
+    with col1:
+        st.download_button(
+            label="📥 실행 로그 (JSON)",
+            data=json.dumps(metrics, ensure_ascii=False, indent=2),
+            file_name=f"libguard_metrics_{stamp}.json",
+            mime="application/json"
+        )
+    with col2:
+        st.download_button(
+            label="📥 Prometheus 메트릭",
+            data=run["metrics_prometheus"],
+            file_name=f"libguard_metrics_{stamp}.prom",
+            mime="text/plain"
+        )
 
 
 def main():
@@ -284,21 +387,98 @@ def main():
         st.header("🔧 분석 옵션")
 
         max_libraries = st.slider(
-            "최대 분석 라이브러리 수",
+            "AI 분석 최대 라이브러리 수",
             min_value=1,
-            max_value=20,
+            max_value=50,
             value=3,
-            help="비용 절약을 위해 분석할 라이브러리 수를 제한할 수 있습니다"
+            help="위험도(보안 권고, 업데이트 유형, 버전 차이)가 높은 순서로 이 수만큼만 AI 로 분석하고, "
+                 "나머지는 버전 비교와 로컬 정보로 판단합니다 (캐시된 항목은 세지 않음)"
         )
 
-        analysis_delay = st.slider(
-            "분석 간격 (초)",
-            min_value=2,
+        budget_usd = st.number_input(
+            "AI 분석 예산 (USD, 0 = 제한 없음)",
+            min_value=0.0,
+            max_value=100.0,
+            value=0.0,
+            step=0.01,
+            format="%.2f",
+            help="예상 비용이 예산을 넘지 않도록 위험도가 높은 라이브러리부터 분석합니다"
+        )
+
+        max_workers = st.slider(
+            "동시 분석 수",
+            min_value=1,
             max_value=10,
             value=4,
-            help="API 호출 제한을 피하기 위한 대기 시간"
+            help="동시에 분석할 라이브러리 수 (API 호출 제한에 걸리면 줄이세요)"
+        )
+
+        batch_size = st.slider(
+            "요청당 라이브러리 수",
+            min_value=1,
+            max_value=8,
+            value=4,
+            help="여러 라이브러리를 한 번의 API 요청으로 묶어 분석합니다 (1 = 묶지 않음)"
         )
 
+        requests_per_minute = st.number_input(
+            "분당 최대 요청 수 (0 = 자동)",
+            min_value=0,
+            max_value=10000,
+            value=0,
+            step=10,
+            help="0이면 OpenAI 응답 헤더의 실제 한도에 맞춰 자동으로 속도를 조절합니다"
+        )
+
+        # 워커 프로세스들이 공유하는 속도 제한기 (API 키별 하나, 이 키로 작업을 제출한 뒤에만 있다)
+        pool = get_worker_pool()
+        rate_limiter = pool.rate_limiter(openai_api_key) if openai_api_key else None
+        if rate_limiter is not None:
+            rate_limiter.set_request_cap(requests_per_minute or None)
+            limits = rate_limiter.snapshot()
+            if limits["requests_per_minute"]:
+                st.caption(
+                    f"호출 한도: 분당 {limits['requests_per_minute']:.0f}회 "
+                    f"(남은 요청 {limits['requests_remaining']:.0f}) · 제한 발생 {limits['throttled']}회"
+                )
+
+        use_cache = st.checkbox(
+            "분석 결과 캐시 사용",
+            value=True,
+            help="같은 라이브러리/버전의 이전 분석 결과를 재사용합니다 (API 비용 없음)"
+        )
+
+        incremental = st.checkbox(
+            "변경된 항목만 다시 분석",
+            value=True,
+            help="같은 프로젝트를 이전에 분석했다면 추가되었거나 버전이 바뀌었거나 새 버전이 나온 라이브러리만 다시 분석합니다"
+        )
+        project = st.text_input(
+            "프로젝트 이름",
+            value="",
+            disabled=not incremental,
+            help="여러 프로젝트의 libs.versions.toml 을 올린다면 프로젝트마다 다른 이름을 주세요 (비우면 파일 이름으로 구분)"
+        )
+
+        version_history = st.checkbox(
+            "릴리스 이력 사용",
+            value=False,
+            help="Maven 저장소의 maven-metadata.xml 로 몇 개 릴리스 뒤처졌는지, 현재 라인에 패치가 나왔는지 확인해 분석에 넣습니다"
+        )
+
+        result_cache = get_result_cache()
+        cache_stats = result_cache.stats()
+        st.caption(
+            f"캐시: {cache_stats['size']}개 저장 · 적중 {cache_stats['hits']} · 실패 {cache_stats['misses']}"
+        )
+
+        if st.button("🗑️ 캐시 비우기"):
+            result_cache.purge()
+            get_job_store().clear_finished()
+            st.session_state.pop(RUN_STATE_KEY, None)
+            st.session_state.pop(JOB_STATE_KEY, None)
+            st.success("✅ 캐시를 비웠습니다")
+
         st.markdown("---")
 
         # 샘플 파일 다운로드
@@ -380,7 +560,8 @@ timber = { group = "com.jakewharton.timber", name = "timber", version.ref = "tim
 
         if uploaded_file is not None:
             try:
-                toml_content = uploaded_file.read().decode('utf-8')
+                file_bytes = uploaded_file.getvalue()
+                toml_content = file_bytes.decode('utf-8')
 
                 with st.expander("📄 업로드된 파일 내용 미리보기"):
                     st.code(toml_content, language='toml')
@@ -389,135 +570,50 @@ timber = { group = "com.jakewharton.timber", name = "timber", version.ref = "tim
                     st.error("⚠️ OpenAI API 키를 먼저 입력해주세요!")
                     st.stop()
 
-                if st.button("🚀 분석 시작", type="primary"):
-                    try:
-                        with st.spinner("🔧 분석기 초기화 중..."):
-                            analyzer = StableLibraryAnalyzer(openai_api_key)
-
-                        with st.spinner("📖 TOML 파일 파싱 중..."):
-                            libraries = analyzer.parse_toml_content(toml_content)
-
-                        st.success(f"✅ {len(libraries)}개의 라이브러리를 발견했습니다!")
-
-                        limited_libraries = dict(list(libraries.items())[:max_libraries])
-
-                        if len(libraries) > max_libraries:
-                            st.warning(f"⚠️ 비용 절약을 위해 처음 {max_libraries}개 라이브러리만 분석합니다.")
-
-                        results = []
-                        progress_bar = st.progress(0)
-                        status_text = st.empty()
-
-                        for i, (lib_name, version) in enumerate(limited_libraries.items()):
-                            status_text.text(f"🔍 분석 중: {lib_name} (v{version}) - {i + 1}/{len(limited_libraries)}")
-
-                            result = analyzer.analyze_library(lib_name, version)
-                            results.append(result)
-
-                            progress = (i + 1) / len(limited_libraries)
-                            progress_bar.progress(progress)
-
-                            if i < len(limited_libraries) - 1:
-                                time.sleep(analysis_delay)
-
-                        progress_bar.progress(1.0)
-                        status_text.text("✅ 분석 완료!")
-
-                        # 결과 표시
-                        st.header("📊 분석 결과")
-
-                        tab1, tab2, tab3 = st.tabs(["📋 요약", "📚 상세 결과", "📝 마크다운 리포트"])
-
-                        with tab1:
-                            col1, col2, col3 = st.columns(3)
-
-                            with col1:
-                                st.metric("총 라이브러리", len(results))
-
-                            with col2:
-                                hotfix_count = sum(1 for r in results if r.is_hotfix or "핫픽스" in r.summary)
-                                st.metric("핫픽스 대상", hotfix_count)
-
-                            with col3:
-                                high_priority = sum(1 for r in results if "높음" in str(r.priority))
-                                st.metric("높은 우선순위", high_priority)
-
-                        with tab2:
-                            for i, result in enumerate(results, 1):
-                                with st.expander(f"📦 {i}. {result.name} (v{result.current_version})"):
-                                    if result.latest_version:
-                                        st.write(f"**최신 버전**: {result.latest_version}")
-
-                                        # 버전 비교 표시
-                                        if result.latest_version != result.current_version:
-                                            st.write(f"**업데이트 가능**: {result.current_version} → {result.latest_version}")
-                                        else:
-                                            st.write("**상태**: 최신 버전 사용 중")
-
-                                    if result.priority and result.priority != "low":
-                                        priority_color = {"높음": "🔴", "중간": "🟡", "낮음": "🟢"}.get(result.priority, "")
-                                        st.write(f"**우선순위**: {priority_color} {result.priority}")
-
-                                    if result.recommendation:
-                                        st.write(f"**권장사항**: {result.recommendation}")
-
-                                    if result.is_hotfix:
-                                        st.warning("🔥 핫픽스 업데이트 권장!")
-
-                                    st.markdown("**분석 결과**:")
-                                    st.markdown(result.summary)
-
-                        with tab3:
-                            report = "# 🛡️ LibGuard 라이브러리 업데이트 분석 리포트\n\n"
-                            report += f"**분석 일시:** {time.strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-                            report += f"**총 라이브러리 수:** {len(results)}개\n\n"
-
-                            # 요약 섹션
-                            hotfix_libs = [r for r in results if r.is_hotfix or "핫픽스" in r.summary]
-                            high_priority_libs = [r for r in results if "높음" in str(r.priority)]
-
-                            report += "## 🎯 주요 업데이트 권장사항\n\n"
-
-                            if hotfix_libs:
-                                report += "### 🔥 즉시 업데이트 권장 (핫픽스)\n"
-                                for lib in hotfix_libs:
-                                    report += f"- **{lib.name}** ({lib.current_version})\n"
-                                report += "\n"
-
-                            if high_priority_libs:
-                                report += "### ⚠️ 높은 우선순위 업데이트\n"
-                                for lib in high_priority_libs:
-                                    report += f"- **{lib.name}** ({lib.current_version})\n"
-                                report += "\n"
-
-                            report += "## 📚 상세 분석 결과\n\n"
-
-                            for i, lib in enumerate(results, 1):
-                                report += f"### {i}. {lib.name}\n"
-                                report += f"**현재 버전:** {lib.current_version}\n"
-                                if lib.latest_version:
-                                    report += f"**최신 버전:** {lib.latest_version}\n"
-                                if lib.priority and lib.priority != "low":
-                                    report += f"**우선순위:** {lib.priority}\n"
-                                if lib.recommendation:
-                                    report += f"**권장사항:** {lib.recommendation}\n"
-                                if lib.is_hotfix:
-                                    report += f"**핫픽스 여부:** 예 🔥\n"
-                                report += f"\n**분석 결과:**\n{lib.summary}\n\n"
-                                report += "---\n\n"
-
-                            st.markdown(report)
+                run_key = make_run_key(
+                    file_bytes, max_libraries=max_libraries, budget_usd=budget_usd, model=OPENAI_MODEL,
+                    version_history=version_history
+                )
+                store = pool.store
 
-                            st.download_button(
-                                label="📥 리포트 다운로드",
-                                data=report,
-                                file_name=f"libguard_report_{time.strftime('%Y%m%d_%H%M%S')}.md",
-                                mime="text/markdown"
-                            )
-
-                    except Exception as e:
-                        st.error(f"❌ 분석 중 오류 발생: {str(e)}")
-                        st.info("💡 문제가 지속되면 분석 간격을 늘리거나 라이브러리 수를 줄여보세요.")
+                if st.button("🚀 분석 시작", type="primary"):
+                    # 같은 파일/옵션으로 끝난 작업이 있으면 (다른 사용자의 작업이라도) 결과를 재사용
+                    job = store.find(run_key, statuses=(DONE,), max_age=COMPLETED_RUN_TTL_SECONDS) if use_cache else None
+                    st.session_state.pop(RUN_STATE_KEY, None)
+
+                    if job is not None:
+                        st.info(
+                            f"♻️ 같은 파일과 옵션으로 {time.strftime('%H:%M:%S', time.localtime(job.updated_at))}에 "
+                            "완료한 분석 결과를 불러왔습니다. 새로 분석하려면 '분석 결과 캐시 사용'을 끄세요."
+                        )
+                    else:
+                        job = pool.submit(openai_api_key, run_key, uploaded_file.name, toml_content, {
+                            "max_libraries": max_libraries,
+                            "budget_usd": budget_usd or None,
+                            "max_workers": max_workers,
+                            "batch_size": batch_size,
+                            "use_cache": use_cache,
+                            "incremental": incremental,
+                            "project": project,
+                            "version_history": version_history,
+                        }, requests_per_minute=requests_per_minute)
+                    st.session_state[JOB_STATE_KEY] = job.id
+
+                # 세션이 따라가던 작업, 없으면 같은 파일로 실행 중인 작업(탭을 닫았다 다시 연 경우)을 이어서 본다
+                run = st.session_state.get(RUN_STATE_KEY)
+                if run is None or run.get("key") != run_key:
+                    job_id = st.session_state.get(JOB_STATE_KEY)
+                    job = store.get(job_id) if job_id else None
+                    if job is None or job.key != run_key:
+                        job = store.find(run_key, owner=owner_id(openai_api_key), statuses=ACTIVE_STATUSES)
+                    if job is not None:
+                        run = follow_job(pool, job, openai_api_key)
+                        if run is not None:
+                            st.session_state[RUN_STATE_KEY] = run
+
+                # 위젯 조작으로 스크립트가 다시 실행되어도 저장된 결과로 바로 다시 그린다
+                if run is not None and run.get("key") == run_key:
+                    render_results(run)
 
             except Exception as e:
                 st.error(f"❌ 파일 읽기 오류: {str(e)}")
@@ -535,8 +631,8 @@ timber = { group = "com.jakewharton.timber", name = "timber", version.ref = "tim
            - `libs.versions.toml` 파일 업로드
 
         3. **분석 옵션 설정**
-           - 최대 분석 라이브러리 수 조정
-           - 분석 간격 설정 (권장: 4초)
+           - AI 분석 최대 라이브러리 수와 예산 조정
+           - 동시 분석 수 설정 (권장: 4개)
 
         4. **분석 실행**
            - '분석 시작' 버튼 클릭
@@ -562,8 +658,8 @@ timber = { group = "com.jakewharton.timber", name = "timber", version.ref = "tim
 
         st.markdown("""
         - **첫 테스트**: 3개 라이브러리로 시작
-        - **분석 간격**: 4초 이상 권장
-        - **API 비용**: 라이브러리당 약 $0.02-0.05
+        - **호출 제한**: 응답 헤더 기준으로 자동 조절
+        - **API 비용**: 분석 후 요약 탭에서 실제 토큰 사용량 기준 예상 비용을 확인할 수 있습니다
         """)
 
 
@@ -0,0 +1,16 @@
+# 공용 픽스처: 모의 업스트림(OpenAI / Maven 검색 / maven-metadata.xml) 과 임시 캐시 디렉터리
+
+import pytest
+
+from benchmarks.mock_server import MockConfig, MockUpstream
+
+
+@pytest.fixture
+def upstream(monkeypatch, tmp_path):
+    """분석기가 모의 서버만 보도록 환경 변수를 바꾼 MockUpstream"""
+    with MockUpstream(MockConfig(latency=0, maven_latency=0)) as server:
+        monkeypatch.setenv("LIBGUARD_OPENAI_URL", server.chat_url)
+        monkeypatch.setenv("LIBGUARD_MAVEN_SEARCH_URL", server.search_url)
+        monkeypatch.setenv("LIBGUARD_MAVEN_REPOSITORY_URL", server.repository_url)
+        monkeypatch.setenv("LIBGUARD_CACHE_DIR", str(tmp_path / "cache"))
+        yield server
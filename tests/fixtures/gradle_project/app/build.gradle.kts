@@ -0,0 +1,25 @@
+// 앱 모듈 (Kotlin DSL)
+val lifecycleVersion by extra("2.7.0")
+extra["composeBom"] = "2024.02.00"
+
+plugins {
+    id("com.google.devtools.ksp") version "1.9.22-1.0.17"
+    kotlin("plugin.serialization") version "1.9.22"
+}
+
+dependencies {
+    implementation(platform("androidx.compose:compose-bom:${extra["composeBom"]}"))
+    implementation("androidx.compose.ui:ui")
+    implementation("androidx.lifecycle:lifecycle-runtime-ktx:$lifecycleVersion")
+    implementation("com.squareup.retrofit2:retrofit:${property("retrofitVersion")}")
+    implementation("com.google.code.gson:gson:${rootProject.extra["gsonVersion"]}")
+    implementation(libs.okhttp)
+    implementation(libs.bundles.room)
+    implementation(project(":core"))
+    testImplementation("junit:junit:${rootProject.extra["junitVersion"]}")
+    debugImplementation("com.example:missing:$undefinedVersion")
+    // implementation("com.example:commented-out:1.0.0")
+    /* implementation("com.example:block-comment:1.0.0") */
+}
+
+val banner = "implementation(\"com.example:in-string:1.0.0\")"
@@ -0,0 +1,103 @@
+# analyzer.py: 좌표 묶음 최신 버전 조회와 묶음 프롬프트 분석
+import json
+
+from benchmarks import mock_server
+from libguard import analyzer as analyzer_module
+from libguard.analyzer import BATCH_MAX_LIBRARIES, BATCH_MAX_PROMPT_TOKENS, StableLibraryAnalyzer
+from libguard.engine import AnalysisEngine
+
+COORDINATES = ["com.squareup.okhttp3:okhttp", "com.google.code.gson:gson", "androidx.room:room-runtime"]
+
+
+def test_latest_versions_come_from_one_exact_coordinate_query(upstream):
+    analyzer = StableLibraryAnalyzer("test-key")
+
+    latest = analyzer.lookup_latest_versions(COORDINATES + [COORDINATES[0], "", "no-colon"])
+
+    assert latest == {coordinate: upstream.latest_version(coordinate) for coordinate in COORDINATES}
+    assert upstream.snapshot()["search_requests"] == 1
+
+
+def test_latest_version_lookup_pages_and_chunks_large_queries(upstream, monkeypatch):
+    monkeypatch.setattr(analyzer_module, "MAVEN_BATCH_SIZE", 5)
+    monkeypatch.setattr(analyzer_module, "MAVEN_PAGE_SIZE", 2)
+    coordinates = [f"com.example:lib{i}" for i in range(7)]
+
+    latest = StableLibraryAnalyzer("test-key").lookup_latest_versions(coordinates)
+
+    assert latest == {coordinate: upstream.latest_version(coordinate) for coordinate in coordinates}
+    # 5개 묶음은 3쪽, 남은 2개 묶음은 1쪽
+    assert upstream.snapshot()["search_requests"] == 4
+
+
+def test_engine_prefetches_latest_versions_instead_of_searching_each_library(upstream):
+    libraries = {"okhttp": "1.0.0", "gson": "1.0.0", "room": "1.0.0"}
+    coordinates = dict(zip(libraries, COORDINATES))
+
+    results = AnalysisEngine(StableLibraryAnalyzer("test-key")).analyze_all(libraries, coordinates)
+
+    assert [result.latest_version for result in results] == [upstream.latest_version(c) for c in COORDINATES]
+    assert upstream.snapshot()["search_requests"] == 1
+
+
+def _context(name, lib_info=""):
+    return {
+        "lib_name": name, "current_version": "1.0.0", "update_type": "major", "maven_info": "", "lib_info": lib_info,
+    }
+
+
+def _batch_items(upstream):
+    names = ["okhttp", "gson", "room"]
+    return [
+        (name, "1.0.0", coordinate, upstream.latest_version(coordinate))
+        for name, coordinate in zip(names, COORDINATES)
+    ]
+
+
+def _answer_batches_with(monkeypatch, rewrite):
+    """모의 서버의 묶음 응답만 rewrite(응답 dict) 결과로 바꾼다"""
+    answer = mock_server._answer
+
+    def patched(prompt):
+        content = answer(prompt)
+        data = json.loads(content)
+        return rewrite(data) if "results" in data else content
+
+    monkeypatch.setattr(mock_server, "_answer", patched)
+
+
+def test_split_batches_respects_library_and_prompt_token_limits():
+    analyzer = StableLibraryAnalyzer("test-key")
+
+    small = [_context(f"lib{i}") for i in range(BATCH_MAX_LIBRARIES * 2 + 1)]
+    assert [len(batch) for batch in analyzer._split_batches(small)] == [BATCH_MAX_LIBRARIES, BATCH_MAX_LIBRARIES, 1]
+
+    # 항목 두 개가 프롬프트 한도를 넘으면 나눠 담고, 한도보다 큰 항목도 혼자 한 묶음이 된다
+    large = [_context(f"lib{i}", "x" * (BATCH_MAX_PROMPT_TOKENS * 2)) for i in range(3)]
+    assert [len(batch) for batch in analyzer._split_batches(large)] == [1, 1, 1]
+    assert analyzer._split_batches([]) == []
+
+
+def test_library_missing_from_batch_answer_is_retried_alone(upstream, monkeypatch):
+    def without_gson(data):
+        data["results"] = [result for result in data["results"] if result["name"] != "gson"]
+        return json.dumps(data, ensure_ascii=False)
+
+    _answer_batches_with(monkeypatch, without_gson)
+
+    results = StableLibraryAnalyzer("test-key").analyze_batch(_batch_items(upstream))
+
+    assert [result.name for result in results] == ["okhttp", "gson", "room"]
+    assert not any(result.is_failed for result in results)
+    # 묶음 요청 1번 + 빠진 gson 단독 요청 1번
+    assert upstream.snapshot()["chat_requests"] == 2
+
+
+def test_unusable_batch_answer_falls_back_to_single_prompts(upstream, monkeypatch):
+    _answer_batches_with(monkeypatch, lambda data: "분석할 수 없습니다")
+
+    results = StableLibraryAnalyzer("test-key").analyze_batch(_batch_items(upstream))
+
+    assert [result.name for result in results] == ["okhttp", "gson", "room"]
+    assert not any(result.is_failed for result in results)
+    assert upstream.snapshot()["chat_requests"] == 1 + 3
@@ -0,0 +1,73 @@
+# cache.py: 분석 결과 캐시의 TTL 만료와 크기(LRU) 제한
+from types import SimpleNamespace
+
+import pytest
+
+from libguard import cache
+from libguard.cache import ResultCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """cache 모듈이 보는 현재 시각 (now.value 를 바꿔 시간을 흘린다)"""
+    now = SimpleNamespace(value=1000.0)
+    monkeypatch.setattr(cache, "time", SimpleNamespace(time=lambda: now.value))
+    return now
+
+
+def test_entry_expires_after_ttl(clock):
+    results = ResultCache(":memory:", ttl_seconds=60)
+    results.set("key", {"summary": "ok"})
+
+    clock.value += 60
+    assert results.get("key") == {"summary": "ok"}
+    clock.value += 1
+    assert not results.contains("key")
+    assert results.get("key") is None
+    assert results.stats() == {"hits": 1, "misses": 1, "size": 0}
+
+
+def test_set_removes_other_expired_entries(clock):
+    results = ResultCache(":memory:", ttl_seconds=60)
+    results.set("old", {})
+    clock.value += 30
+    results.set("recent", {})
+
+    clock.value += 31
+    results.set("new", {})
+
+    assert results.stats()["size"] == 2
+    assert results.contains("recent")
+    assert not results.contains("old")
+
+
+def test_least_recently_used_entry_is_evicted_over_max_entries(clock):
+    results = ResultCache(":memory:", max_entries=2)
+    results.set("first", {})
+    clock.value += 1
+    results.set("second", {})
+    clock.value += 1
+    results.get("first")  # 읽으면 최근 사용으로 올라간다
+
+    clock.value += 1
+    results.set("third", {})
+
+    assert results.stats()["size"] == 2
+    assert results.contains("first")
+    assert not results.contains("second")
+    assert results.contains("third")
+
+
+def test_entries_survive_reopening(tmp_path):
+    path = str(tmp_path / "results.sqlite3")
+    ResultCache(path).set("key", {"summary": "저장됨"})
+
+    assert ResultCache(path).get("key") == {"summary": "저장됨"}
+
+
+def test_key_changes_with_prompt_and_latest_version():
+    key = ResultCache.make_key("okhttp", "4.9.0", "model", "prompt", "4.12.0")
+
+    assert key == ResultCache.make_key("okhttp", "4.9.0", "model", "prompt", "4.12.0")
+    assert key != ResultCache.make_key("okhttp", "4.9.0", "model", "prompt v2", "4.12.0")
+    assert key != ResultCache.make_key("okhttp", "4.9.0", "model", "prompt", "5.0.0")
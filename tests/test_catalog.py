@@ -0,0 +1,98 @@
+# catalog.py: 버전 카탈로그의 모든 선언 형태 해석
+import os
+
+import pytest
+
+from libguard.catalog import find_catalogs, parse_catalog
+
+CATALOG = '''
+[versions]
+okhttp = "4.12.0"
+kotlin = { strictly = "1.9.22" }
+coroutines = { require = "1.7.3", prefer = "1.7.1" }
+
+[libraries]
+okhttp = { module = "com.squareup.okhttp3:okhttp", version.ref = "okhttp" }
+okhttp-mockwebserver = { group = "com.squareup.okhttp3", name = "mockwebserver", version.ref = "okhttp" }
+coroutines-core = { module = "org.jetbrains.kotlinx:kotlinx-coroutines-core", version.ref = "coroutines" }
+gson = "com.google.code.gson:gson:2.10.1"
+compose-bom = { module = "androidx.compose:compose-bom", version = "2024.02.00" }
+compose-ui = { module = "androidx.compose.ui:ui" }
+rich = { module = "com.example:rich", version = { prefer = "3.0" } }
+missing-ref = { module = "com.example:missing", version.ref = "nope" }
+broken = { version = "1.0" }
+
+[plugins]
+kotlin-android = { id = "org.jetbrains.kotlin.android", version.ref = "kotlin" }
+ksp = "com.google.devtools.ksp:1.9.22-1.0.17"
+
+[bundles]
+network = ["okhttp", "okhttp-mockwebserver", "unknown"]
+'''
+
+
+@pytest.fixture
+def catalog():
+    return parse_catalog(CATALOG)
+
+
+def test_versions(catalog):
+    assert catalog.versions == {"okhttp": "4.12.0", "kotlin": "1.9.22", "coroutines": "1.7.3"}
+
+
+@pytest.mark.parametrize("alias, coordinate, version, version_ref", [
+    ("okhttp", "com.squareup.okhttp3:okhttp", "4.12.0", "okhttp"),
+    ("okhttp-mockwebserver", "com.squareup.okhttp3:mockwebserver", "4.12.0", "okhttp"),
+    ("coroutines-core", "org.jetbrains.kotlinx:kotlinx-coroutines-core", "1.7.3", "coroutines"),
+    ("gson", "com.google.code.gson:gson", "2.10.1", ""),
+    ("compose-bom", "androidx.compose:compose-bom", "2024.02.00", ""),
+    ("compose-ui", "androidx.compose.ui:ui", "", ""),
+    ("rich", "com.example:rich", "3.0", ""),
+    ("missing-ref", "com.example:missing", "", "nope"),
+])
+def test_libraries(catalog, alias, coordinate, version, version_ref):
+    entry = catalog.libraries[alias]
+    assert (entry.coordinate, entry.version, entry.version_ref, entry.kind) == (
+        coordinate, version, version_ref, "library"
+    )
+
+
+def test_invalid_library_is_skipped(catalog):
+    assert "broken" not in catalog.libraries
+
+
+def test_plugins(catalog):
+    kotlin = catalog.plugins["kotlin-android"]
+    assert kotlin.coordinate == "org.jetbrains.kotlin.android:org.jetbrains.kotlin.android.gradle.plugin"
+    assert (kotlin.version, kotlin.key) == ("1.9.22", "plugins.kotlin-android")
+    assert catalog.plugins["ksp"].version == "1.9.22-1.0.17"
+
+
+def test_bundles(catalog):
+    assert [entry.alias for entry in catalog.bundle_entries("network")] == ["okhttp", "okhttp-mockwebserver"]
+    assert catalog.bundle_entries("none") == []
+
+
+def test_analysis_inputs_skip_unversioned_entries(catalog):
+    versions = catalog.library_versions()
+    assert "compose-ui" not in versions and "missing-ref" not in versions
+    assert versions["plugins.ksp"] == "1.9.22-1.0.17"
+    assert catalog.coordinates()["gson"] == "com.google.code.gson:gson"
+    assert list(versions) == [entry.key for entry in catalog.versioned_entries()]
+
+
+def test_invalid_toml():
+    with pytest.raises(ValueError):
+        parse_catalog("[libraries\nokhttp = ")
+
+
+def test_find_catalogs(tmp_path):
+    (tmp_path / "gradle").mkdir()
+    (tmp_path / "build").mkdir()
+    (tmp_path / "gradle" / "libs.versions.toml").write_text("")
+    (tmp_path / "gradle" / "tools.versions.toml").write_text("")
+    (tmp_path / "build" / "generated.versions.toml").write_text("")
+    single = tmp_path / "gradle" / "libs.versions.toml"
+
+    found = find_catalogs([str(tmp_path), str(single)])
+    assert [os.path.basename(path) for path in found] == ["libs.versions.toml", "tools.versions.toml"]
@@ -0,0 +1,61 @@
+# engine.py: 병렬 분석 순서와 429 작업 재실행
+import threading
+
+from libguard.engine import AnalysisEngine
+from libguard.ratelimit import RateLimitExceeded
+
+
+class FakeAnalyzer:
+    """throttled 에 있는 라이브러리는 처음 limit 번 호출 동안 429 로 실패하는 분석기"""
+
+    def __init__(self, throttled=(), limit=1):
+        self.throttled = set(throttled)
+        self.limit = limit
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def analyze_library(self, lib_name, current_version, **kwargs):
+        with self._lock:
+            self.calls.append(lib_name)
+            attempts = self.calls.count(lib_name)
+        if lib_name in self.throttled and attempts <= self.limit:
+            raise RateLimitExceeded(0.01)
+        return f"{lib_name}@{current_version}"
+
+    def failed_result(self, lib_name, current_version, reason):
+        return f"{lib_name}: {reason}"
+
+
+LIBRARIES = {"okhttp": "4.9.0", "gson": "2.10.0", "room": "2.5.0"}
+
+
+def test_requeued_job_finishes_after_other_jobs():
+    analyzer = FakeAnalyzer(throttled={"okhttp"})
+    engine = AnalysisEngine(analyzer, max_workers=1)
+
+    order = [index for index, _ in engine.iter_results(LIBRARIES)]
+
+    # 429 를 받은 작업은 다른 작업 뒤로 밀려 다시 실행된다 (gson/room 은 함께 끝날 수 있어 순서를 보지 않는다)
+    assert sorted(order[:2]) == [1, 2]
+    assert order[2] == 0
+    assert analyzer.calls == ["okhttp", "gson", "room", "okhttp"]
+    assert engine.requeued == 1
+
+
+def test_analyze_all_keeps_input_order_after_requeue():
+    engine = AnalysisEngine(FakeAnalyzer(throttled={"okhttp", "gson"}, limit=2), max_workers=2)
+
+    assert engine.analyze_all(LIBRARIES) == ["okhttp@4.9.0", "gson@2.10.0", "room@2.5.0"]
+    assert engine.requeued == 4
+
+
+def test_job_gives_up_after_max_requeues():
+    analyzer = FakeAnalyzer(throttled={"gson"}, limit=10)
+    engine = AnalysisEngine(analyzer, max_workers=2, max_requeues=2)
+
+    results = engine.analyze_all(LIBRARIES)
+
+    assert results[0] == "okhttp@4.9.0"
+    assert results[1].startswith("gson: API 호출 실패:")
+    assert analyzer.calls.count("gson") == 3
+    assert engine.requeued == 2
@@ -0,0 +1,132 @@
+# gradle.py: 토큰화와 멀티 모듈 프로젝트 스캔 (tests/fixtures/gradle_project)
+import os
+
+import pytest
+
+from libguard.gradle import GSTRING, NAME, STRING, scan_project, tokenize
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "gradle_project")
+
+
+@pytest.fixture(scope="module")
+def scan():
+    return scan_project(FIXTURE)
+
+
+def _dependency(scan, coordinate):
+    matches = [dependency for dependency in scan.dependencies if dependency.coordinate == coordinate]
+    assert len(matches) == 1, coordinate
+    return matches[0]
+
+
+def _version(scan, coordinate):
+    return _dependency(scan, coordinate).version
+
+
+def test_tokenize_skips_comments_and_keeps_strings_whole():
+    source = 'implementation "a:b:${x["y"]}" // c "d:e:1"\n/* f:g:1\n */ \'h:i:$j\'\n'
+    assert tokenize(source) == [
+        (NAME, "implementation", 1),
+        (GSTRING, 'a:b:${x["y"]}', 1),
+        (STRING, "h:i:$j", 3),
+    ]
+
+
+def test_modules(scan):
+    assert scan.modules == [":", ":app", ":core"]
+    assert scan.errors == {}
+
+
+def test_comments_and_strings_are_not_dependencies(scan):
+    coordinates = {dependency.coordinate for dependency in scan.dependencies}
+    assert "com.example:commented-out" not in coordinates
+    assert "com.example:block-comment" not in coordinates
+    assert "com.example:in-string" not in coordinates
+
+
+@pytest.mark.parametrize("coordinate, version", [
+    ("org.jetbrains.kotlin:kotlin-gradle-plugin", "1.9.22"),          # gradle.properties 점 이름
+    ("com.squareup.retrofit2:retrofit", "2.9.0"),                     # property("...")
+    ("androidx.lifecycle:lifecycle-runtime-ktx", "2.7.0"),            # val x by extra(...)
+    ("com.google.code.gson:gson", "2.10.1"),                          # rootProject.extra["x"] / ext.x
+    ("junit:junit", "4.13.2"),                                        # ext { x = } 를 하위 모듈에서
+    ("org.jetbrains.kotlinx:kotlinx-coroutines-core", "1.7.3"),       # Groovy 맵 versions.coroutines
+    ("com.github.bumptech.glide:glide", "4.16.0"),                    # 문자열 + 맵 값
+    ("androidx.room:room-compiler", "2.6.1"),                         # def x = 지역 변수
+])
+def test_variable_references(scan, coordinate, version):
+    assert _version(scan, coordinate) == version
+
+
+def test_named_arguments_across_dsls(scan):
+    gson = _dependency(scan, "com.google.code.gson:gson")
+    assert gson.modules == [":app", ":core"]
+    assert [(d.module, d.line) for d in gson.declarations] == [(":app", 15), (":core", 7)]
+
+
+@pytest.mark.parametrize("coordinate, version", [
+    ("androidx.compose:compose-bom", "2024.02.00"),   # platform(...) + extra["x"] = (Kotlin)
+    ("com.squareup.okhttp3:okhttp-bom", "4.12.0"),    # enforcedPlatform(...) (Groovy)
+])
+def test_platforms(scan, coordinate, version):
+    dependency = _dependency(scan, coordinate)
+    assert (dependency.version, dependency.kind) == (version, "platform")
+
+
+def test_bom_managed_dependency_is_not_versioned(scan):
+    assert _version(scan, "androidx.compose.ui:ui") == ""
+    assert "androidx.compose.ui:ui" not in scan.library_versions()
+
+
+def test_catalog_accessors_and_bundles(scan):
+    okhttp = _dependency(scan, "com.squareup.okhttp3:okhttp")
+    assert okhttp.version == "4.12.0"
+    assert [d.configuration for d in okhttp.declarations] == ["catalog", "implementation"]
+    assert okhttp.modules == [":app"]
+    # libs.okhttp.logging → okhttp-logging
+    assert _dependency(scan, "com.squareup.okhttp3:logging-interceptor").modules == [":core"]
+    # libs.bundles.room → 번들의 모든 항목
+    for coordinate in ("androidx.room:room-runtime", "androidx.room:room-ktx"):
+        dependency = _dependency(scan, coordinate)
+        assert (dependency.version, dependency.modules) == ("2.6.1", [":app"])
+
+
+@pytest.mark.parametrize("plugin_id, version, module", [
+    ("com.android.application", "8.2.0", ":"),                    # alias(libs.plugins.x)
+    ("org.jetbrains.kotlin.android", "1.9.22", ":"),              # Groovy id '...' version '...'
+    ("com.google.devtools.ksp", "1.9.22-1.0.17", ":app"),         # Kotlin id("...") version "..."
+    ("org.jetbrains.kotlin.plugin.serialization", "1.9.22", ":app"),  # kotlin("...") version "..."
+])
+def test_plugins(scan, plugin_id, version, module):
+    dependency = _dependency(scan, f"{plugin_id}:{plugin_id}.gradle.plugin")
+    assert (dependency.version, dependency.kind) == (version, "plugin")
+    assert module in dependency.modules
+
+
+def test_only_declared_dependencies(scan):
+    # project(":core"), fileTree(...) 는 의존성이 아니다
+    assert {dependency.coordinate for dependency in scan.dependencies if dependency.kind == "library"} == {
+        "com.squareup.okhttp3:okhttp", "com.squareup.okhttp3:logging-interceptor",
+        "androidx.room:room-runtime", "androidx.room:room-ktx", "androidx.room:room-compiler",
+        "org.jetbrains.kotlin:kotlin-gradle-plugin", "androidx.compose.ui:ui",
+        "androidx.lifecycle:lifecycle-runtime-ktx", "com.squareup.retrofit2:retrofit",
+        "com.google.code.gson:gson", "junit:junit", "org.jetbrains.kotlinx:kotlinx-coroutines-core",
+        "com.github.bumptech.glide:glide", "com.example:missing", "com.example:single-quoted",
+    }
+
+
+def test_unresolved_references(scan):
+    unresolved = {(d.coordinate, d.unresolved, d.module) for d in scan.unresolved}
+    assert unresolved == {
+        ("com.example:missing", "${undefinedVersion}", ":app"),
+        # Groovy 작은따옴표 문자열은 치환하지 않는다
+        ("com.example:single-quoted", "$notInterpolated", ":core"),
+    }
+    assert "com.example:missing" not in scan.library_versions()
+
+
+def test_library_versions_keys(scan):
+    versions = scan.library_versions()
+    assert versions["junit:junit"] == "4.13.2"
+    assert scan.coordinates()["junit:junit"] == "junit:junit"
+    assert scan.locations()["junit:junit"].line == 19
@@ -0,0 +1,97 @@
+# http_pool.py: 환경 변수 설정, 재시도/백오프, 업스트림별 세션 재사용
+import random
+import socket
+from dataclasses import asdict
+
+import pytest
+import requests
+
+from libguard import http_pool
+from libguard.http_pool import MAVEN, OPENAI, HttpSettings, backoff_delay, configure_http, get_session, http_settings
+
+
+@pytest.fixture(autouse=True)
+def restore_settings():
+    saved = http_settings()
+    yield
+    configure_http(**asdict(saved))
+
+
+@pytest.fixture
+def attempts(monkeypatch):
+    """재시도 대기 없이 백오프를 호출한 attempt 번호를 기록"""
+    calls = []
+
+    def record(attempt, settings=None):
+        calls.append(attempt)
+        return 0.0
+
+    monkeypatch.setattr(http_pool, "backoff_delay", record)
+    return calls
+
+
+@pytest.mark.parametrize("pool_size, max_retries, expected", [
+    ("4", "0", (4, 0)),
+    ("abc", "", (10, 3)),
+    ("0", "-1", (10, 3)),
+    (" 8 ", "2.5", (8, 3)),
+])
+def test_settings_from_env_fall_back_to_defaults(monkeypatch, pool_size, max_retries, expected):
+    monkeypatch.setenv("LIBGUARD_HTTP_POOL_SIZE", pool_size)
+    monkeypatch.setenv("LIBGUARD_HTTP_MAX_RETRIES", max_retries)
+    settings = HttpSettings.from_env()
+    assert (settings.pool_size, settings.max_retries) == expected
+
+
+def test_server_errors_are_retried_until_attempts_run_out(upstream, attempts):
+    configure_http(max_retries=2)
+    upstream.config.error_rate = 1.0
+
+    response = http_pool.request_with_retry(OPENAI, "POST", upstream.chat_url, json={"messages": []})
+
+    assert response.status_code == 500
+    assert upstream.snapshot()["chat_errors"] == 3
+    assert attempts == [0, 1]
+
+
+def test_successful_response_is_not_retried(upstream, attempts):
+    response = http_pool.request_with_retry(OPENAI, "POST", upstream.chat_url, json={"messages": []})
+
+    assert response.status_code == 200
+    assert upstream.snapshot()["chat_requests"] == 1
+    assert attempts == []
+
+
+def test_connection_errors_are_retried_then_raised(attempts):
+    configure_http(max_retries=1)
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    with pytest.raises(requests.ConnectionError):
+        http_pool.request_with_retry(MAVEN, "GET", f"http://127.0.0.1:{port}/", timeout=1)
+    assert attempts == [0]
+
+
+def test_backoff_delay_uses_full_jitter_under_exponential_cap():
+    settings = HttpSettings(backoff_base=0.5, backoff_max=4.0)
+    random.seed(7)
+    for attempt, cap in enumerate([0.5, 1.0, 2.0, 4.0, 4.0]):
+        delays = [backoff_delay(attempt, settings) for _ in range(50)]
+        assert all(0 <= delay <= cap for delay in delays)
+        assert len(set(delays)) > 1
+
+
+def test_sessions_are_shared_per_upstream_until_settings_change():
+    session = get_session(OPENAI)
+    assert get_session(OPENAI) is session
+    assert get_session(MAVEN) is not session
+
+    # 같은 값으로 다시 설정하면 연결 풀을 유지한다
+    configure_http(pool_size=http_settings().pool_size)
+    assert get_session(OPENAI) is session
+
+    configure_http(pool_size=http_settings().pool_size + 1)
+    renewed = get_session(OPENAI)
+    assert renewed is not session
+    assert renewed.get_adapter("https://api.openai.com")._pool_maxsize == http_settings().pool_size
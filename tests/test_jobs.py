@@ -0,0 +1,146 @@
+from libguard.analyzer import LibraryInfo
+from libguard.cache import ResultCache
+import time
+
+from libguard.jobs import DONE, JobStore, WorkerPool, _PartialWriter, execute_job, owner_id
+from libguard.ratelimit import AdaptiveRateLimiter
+from libguard.snapshot import SnapshotStore
+from libguard.streaming import PartialResult
+
+APP = """
+[libraries]
+okhttp = "com.example:okhttp:1.0.0"
+gson = "com.example:gson:1.0.0"
+"""
+OTHER = """
+[libraries]
+room = "com.example:room:1.0.0"
+"""
+
+
+def _run(store, snapshots, content, owner="owner", project=""):
+    job = store.submit(content, owner, "libs.versions.toml", content, {"incremental": True, "project": project})
+    return execute_job(job, "test-key", AdaptiveRateLimiter(), store, ResultCache(":memory:"), snapshots)
+
+
+def test_added_library_is_the_only_entry_analyzed_again(upstream):
+    store, snapshots = JobStore(":memory:"), SnapshotStore(":memory:")
+
+    _run(store, snapshots, APP)
+    upstream.reset_stats()
+    result = _run(store, snapshots, APP + 'room = "com.example:room:1.0.0"\n')
+
+    assert result["reused"] == 2
+    assert upstream.snapshot()["chat_requests"] == 1
+    assert [entry["name"] for entry in result["results"]] == ["okhttp", "gson", "room"]
+
+    # 항목을 지워도 남은 항목은 그대로 재사용된다
+    upstream.reset_stats()
+    result = _run(store, snapshots, APP)
+    assert result["reused"] == 2
+    assert upstream.snapshot()["chat_requests"] == 0
+
+
+def test_projects_with_same_file_name_keep_separate_snapshots(upstream):
+    store, snapshots = JobStore(":memory:"), SnapshotStore(":memory:")
+
+    _run(store, snapshots, APP, project="app")
+    _run(store, snapshots, OTHER, project="other")
+    upstream.reset_stats()
+    result = _run(store, snapshots, APP.replace('gson:1.0.0', 'gson:1.1.0'), project="app")
+
+    # 다른 프로젝트의 libs.versions.toml 이 스냅샷을 덮어쓰지 않았으므로 okhttp 는 그대로 재사용된다
+    assert result["reused"] == 1
+    assert upstream.snapshot()["chat_requests"] == 1
+
+
+def test_snapshots_are_not_shared_between_owners(upstream):
+    store, snapshots = JobStore(":memory:"), SnapshotStore(":memory:")
+
+    _run(store, snapshots, APP, owner=owner_id("first"))
+    result = _run(store, snapshots, APP, owner=owner_id("second"))
+
+    assert result["reused"] == 0
+
+
+def test_submit_returns_active_job_for_same_key():
+    store = JobStore(":memory:")
+    first = store.submit("key", "owner", "libs.versions.toml", APP, {})
+    again = store.submit("key", "owner", "libs.versions.toml", APP, {})
+    other = store.submit("key", "someone-else", "libs.versions.toml", APP, {})
+
+    assert again.id == first.id
+    assert other.id != first.id
+    claimed = store.claim("owner", "worker")
+    assert claimed.id == first.id
+    store.complete(claimed.id, {"results": []})
+    assert store.get(first.id).status == DONE
+
+
+def test_claim_takes_jobs_of_any_registered_owner():
+    store = JobStore(":memory:")
+    store.submit("a", "first", "libs.versions.toml", APP, {})
+    second = store.submit("b", "second", "libs.versions.toml", APP, {})
+    third = store.submit("c", "third", "libs.versions.toml", APP, {})
+
+    assert store.claim(["second", "third"], "worker").id == second.id
+    assert store.claim(["second", "third"], "worker").id == third.id
+    assert store.claim(["second", "third"], "worker") is None
+    assert store.claim([], "worker") is None
+
+
+def test_worker_pool_starts_on_first_submit_and_serves_every_key(upstream, tmp_path):
+    pool = WorkerPool(processes=1, path=str(tmp_path / "jobs.sqlite3"))
+    # 사이드바에서 키를 입력하는 것만으로는 프로세스를 띄우지 않는다
+    assert not pool.started
+    assert pool.alive == 0
+    assert pool.rate_limiter("key-a") is None
+
+    try:
+        first = pool.submit("key-a", "a", "libs.versions.toml", APP, {})
+        second = pool.submit("key-b", "b", "libs.versions.toml", OTHER, {}, requests_per_minute=600)
+        deadline = time.time() + 60
+        while time.time() < deadline and {pool.store.get(first.id).status, pool.store.get(second.id).status} != {DONE}:
+            time.sleep(0.2)
+
+        assert pool.store.get(first.id).status == DONE
+        assert pool.store.get(second.id).status == DONE
+        assert pool.alive == 1
+        assert pool.rate_limiter("key-b").snapshot()["requests_per_minute"] <= 600
+    finally:
+        pool.shutdown()
+    assert not pool.started
+
+
+def test_streamed_summaries_are_visible_while_job_runs(upstream):
+    store = JobStore(":memory:")
+    job = store.submit("key", "owner", "libs.versions.toml", APP, {})
+
+    result = execute_job(job, "test-key", AdaptiveRateLimiter(), store, ResultCache(":memory:"))
+
+    # 워커는 완료된 라이브러리의 확정 요약을 중간 요약 표에 남긴다
+    partials = {partial.name: partial for partial in store.partials(job.id)}
+    summaries = {item["name"]: item["summary"] for item in result["results"]}
+    assert set(partials) == {"okhttp", "gson"}
+    assert all(partial.done for partial in partials.values())
+    assert {name: partial.summary for name, partial in partials.items()} == summaries
+
+    store.complete(job.id, result)
+    assert store.partials(job.id) == []
+
+
+def test_partial_writer_coalesces_chunks_until_interval():
+    written = []
+
+    class Recorder:
+        def save_partials(self, job_id, partials):
+            written.append([(partial.name, partial.summary, partial.done) for partial in partials])
+
+    writer = _PartialWriter(Recorder(), "job", interval=3600)
+    writer(PartialResult("okhttp", "첫"))
+    writer(PartialResult("okhttp", "첫 문장"))
+    writer(PartialResult("gson", "요"))
+    assert written == [[("okhttp", "첫", False)]]
+
+    writer(PartialResult("okhttp", done=True, result=LibraryInfo("okhttp", "1.0.0", summary="확정 요약")))
+    assert written[-1] == [("okhttp", "확정 요약", True), ("gson", "요", False)]
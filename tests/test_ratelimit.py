@@ -0,0 +1,139 @@
+# ratelimit.py: 헤더 학습, 사용자 상한 변경, 429 뒤 한도 낮춤과 회복
+import pytest
+
+from libguard import ratelimit
+from libguard.ratelimit import (
+    RECOVERY_WINDOW_SECONDS, AdaptiveRateLimiter, parse_duration, parse_retry_after,
+)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(ratelimit.time, "monotonic", clock)
+    return clock
+
+
+def _rpm(limiter):
+    return limiter.snapshot()["requests_per_minute"]
+
+
+def _headers(limit_requests, remaining_requests=None):
+    headers = {"x-ratelimit-limit-requests": str(limit_requests)}
+    if remaining_requests is not None:
+        headers["x-ratelimit-remaining-requests"] = str(remaining_requests)
+    return headers
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("1s", 1.0), ("6m0s", 360.0), ("20ms", 0.02), ("1h2m3.5s", 3723.5), ("30", 30.0), ("", None), ("soon", None),
+])
+def test_parse_duration(value, expected):
+    assert parse_duration(value) == expected
+
+
+def test_parse_retry_after():
+    assert parse_retry_after({"retry-after-ms": "250", "retry-after": "9"}) == 0.25
+    assert parse_retry_after({"retry-after": "2"}) == 2.0
+    assert parse_retry_after({}) is None
+
+
+def test_learns_limits_from_headers(clock):
+    limiter = AdaptiveRateLimiter()
+    assert _rpm(limiter) is None
+    limiter.update_from_headers(_headers(500, 499))
+    assert _rpm(limiter) == 500
+    assert limiter.snapshot()["requests_remaining"] == 499
+
+
+def test_request_cap_can_be_lowered_and_raised_up_to_server_limit(clock):
+    limiter = AdaptiveRateLimiter()
+    limiter.update_from_headers(_headers(500))
+    limiter.set_request_cap(60)
+    assert _rpm(limiter) == 60
+    limiter.set_request_cap(200)
+    assert _rpm(limiter) == 200
+    limiter.set_request_cap(10_000)
+    assert _rpm(limiter) == 500
+    limiter.set_request_cap(None)
+    assert _rpm(limiter) == 500
+    # 상한을 올려도 남은 요청 수는 늘지 않는다 (새 속도로 채워진다)
+    limiter.set_request_cap(60)
+    assert limiter.snapshot()["requests_remaining"] <= 60
+
+
+def test_request_cap_without_server_limit(clock):
+    limiter = AdaptiveRateLimiter(requests_per_minute=30)
+    assert _rpm(limiter) == 30
+    limiter.set_request_cap(90)
+    assert _rpm(limiter) == 90
+    limiter.set_request_cap(None)
+    assert _rpm(limiter) is None
+
+
+def test_headers_never_exceed_user_cap(clock):
+    limiter = AdaptiveRateLimiter(requests_per_minute=60)
+    limiter.update_from_headers(_headers(500))
+    assert _rpm(limiter) == 60
+
+
+def test_throttle_lowers_limit_and_recovers_after_quiet_windows(clock):
+    limiter = AdaptiveRateLimiter()
+    limiter.update_from_headers(_headers(400))
+    assert limiter.on_throttled(2.0) == 2.0
+    assert _rpm(limiter) == 200
+    assert limiter.snapshot()["paused_for"] == pytest.approx(2.0)
+
+    # 창이 끝나기 전에는 그대로, 헤더가 서버 한도를 다시 알려줘도 낮춘 한도를 유지
+    clock.now += RECOVERY_WINDOW_SECONDS - 1
+    limiter.update_from_headers(_headers(400))
+    assert _rpm(limiter) == 200
+
+    clock.now += 1
+    assert _rpm(limiter) == 300
+    clock.now += RECOVERY_WINDOW_SECONDS
+    assert _rpm(limiter) == 400
+    clock.now += RECOVERY_WINDOW_SECONDS
+    assert _rpm(limiter) == 400
+
+
+def test_repeated_throttling_restarts_recovery(clock):
+    limiter = AdaptiveRateLimiter(requests_per_minute=100)
+    limiter.on_throttled()
+    clock.now += RECOVERY_WINDOW_SECONDS / 2
+    limiter.on_throttled()
+    assert _rpm(limiter) == 25
+    clock.now += RECOVERY_WINDOW_SECONDS / 2
+    assert _rpm(limiter) == 25
+    assert limiter.snapshot()["throttled"] == 2
+
+
+def test_throttle_without_known_limit_only_pauses(clock):
+    limiter = AdaptiveRateLimiter()
+    limiter.on_throttled()
+    assert _rpm(limiter) is None
+    assert limiter.snapshot()["paused_for"] > 0
+
+
+def test_acquire_waits_for_refill(clock, monkeypatch):
+    slept = []
+
+    def sleep(seconds):
+        slept.append(seconds)
+        clock.now += seconds
+
+    monkeypatch.setattr(ratelimit.time, "sleep", sleep)
+    limiter = AdaptiveRateLimiter(requests_per_minute=60)
+    for _ in range(60):
+        limiter.acquire()
+    assert slept == []
+    limiter.acquire()
+    assert sum(slept) == pytest.approx(1.0)
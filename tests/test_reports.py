@@ -0,0 +1,135 @@
+# reports.py: 스트리밍 리포트 작성기 (SARIF / JSON Lines 는 파싱 가능한 문서여야 한다)
+import io
+import json
+import threading
+
+import pytest
+
+from libguard.analyzer import LibraryInfo
+from libguard.reports import (
+    RULE_HOTFIX, RULE_OUTDATED, RULE_VULNERABLE, SARIF_VERSION, HtmlReportWriter, ReportLocation,
+    catalog_locations, create_report_writer, render_report, report_format_for_path,
+)
+from libguard.versions import MAJOR, PATCH, UP_TO_DATE
+
+RESULTS = [
+    LibraryInfo("okhttp", "4.9.0", "4.12.0", False, "중간", 'say "hi" [] {} \\ 😀', "검토 필요", MAJOR),
+    LibraryInfo("gson", "2.10.0", "2.10.1", True, "중간", "핫픽스", "업데이트 권장", PATCH),
+    LibraryInfo("log4j", "2.14.0", "2.17.1", True, "높음", "<script>alert(1)</script>", "업데이트 권장", PATCH,
+                ["GHSA-jfh8-c2jp-5v3q (CVE-2021-44228, CRITICAL)"]),
+    LibraryInfo("junit", "4.13.2", "4.13.2", False, "낮음", "최신", "선택사항", UP_TO_DATE),
+]
+LOCATIONS = {"okhttp": ReportLocation("gradle/libs.versions.toml", 7)}
+
+
+def _sarif(results, **kwargs):
+    return json.loads(render_report(results, "sarif", analyzed_at=86400, **kwargs))
+
+
+def test_sarif_is_valid_json():
+    document = _sarif(RESULTS, locations=LOCATIONS)
+    assert document["version"] == SARIF_VERSION
+    run = document["runs"][0]
+    assert run["tool"]["driver"]["name"] == "LibGuard"
+    assert run["invocations"][0]["startTimeUtc"] == "1970-01-02T00:00:00Z"
+    assert [(r["ruleId"], r["level"]) for r in run["results"]] == [
+        (RULE_OUTDATED, "note"), (RULE_HOTFIX, "warning"), (RULE_VULNERABLE, "error"),
+    ]
+    okhttp = run["results"][0]
+    assert okhttp["properties"]["summary"] == 'say "hi" [] {} \\ 😀'
+    assert okhttp["locations"][0]["physicalLocation"]["region"] == {"startLine": 7}
+
+
+def test_sarif_fingerprints_differ_across_catalogs():
+    content = '[libraries]\nokhttp = "com.squareup.okhttp3:okhttp:4.9.0"\n'
+    buffer = io.StringIO()
+    with create_report_writer("sarif", buffer, analyzed_at=86400) as writer:
+        for path in ("app/libs.versions.toml", "lib/libs.versions.toml"):
+            writer.write(RESULTS[0], catalog_locations(path, content)["okhttp"])
+        writer.write(RESULTS[0])
+
+    results = json.loads(buffer.getvalue())["runs"][0]["results"]
+    fingerprints = [result["partialFingerprints"]["libguard/v2"] for result in results]
+    assert fingerprints == [
+        "app/libs.versions.toml#com.squareup.okhttp3:okhttp@4.9.0",
+        "lib/libs.versions.toml#com.squareup.okhttp3:okhttp@4.9.0",
+        "gradle/libs.versions.toml#okhttp@4.9.0",
+    ]
+
+
+@pytest.mark.parametrize("results", [[], [RESULTS[3]], [RESULTS[0]]])
+def test_sarif_without_or_with_single_result(results):
+    assert len(_sarif(results)["runs"][0]["results"]) == (1 if results == [RESULTS[0]] else 0)
+
+
+def test_sarif_concurrent_writes():
+    buffer = io.StringIO()
+    with create_report_writer("sarif", buffer) as writer:
+        threads = [
+            threading.Thread(target=lambda i=i: [writer.write(RESULTS[1]) for _ in range(50)]) for i in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    assert len(json.loads(buffer.getvalue())["runs"][0]["results"]) == 200
+
+
+def test_jsonl_lines_parse():
+    lines = render_report(RESULTS, "jsonl", locations=LOCATIONS).splitlines()
+    records = [json.loads(line) for line in lines]
+    assert [record["name"] for record in records] == ["okhttp", "gson", "log4j", "junit"]
+    assert (records[0]["path"], records[0]["line"]) == ("gradle/libs.versions.toml", 7)
+    assert records[2]["advisories"] == RESULTS[2].advisories
+
+
+def test_markdown_summary_sections():
+    text = render_report(RESULTS, "markdown", locations=LOCATIONS)
+    assert "**총 라이브러리 수:** 4개" in text
+    assert "**위치:** gradle/libs.versions.toml:7" in text
+    assert "**업데이트 유형:** 메이저" in text
+    hotfix = text[text.index("### 🔥"):]
+    assert "- **gson (2.10.0)**" in hotfix and "- **log4j (2.14.0)**" in hotfix
+
+
+def test_html_escapes_and_pages():
+    buffer = io.StringIO()
+    with HtmlReportWriter(buffer, page_size=2) as writer:
+        for result in RESULTS:
+            writer.write(result)
+    text = buffer.getvalue()
+    assert "<script>alert(1)</script>" not in text
+    assert "&lt;script&gt;" in text
+    assert "var pageSize = 2" in text
+    assert text.count('<article class="lib') == 4
+    assert 'class="lib hotfix vulnerable"' in text
+
+
+def test_close_without_results_writes_empty_report():
+    buffer = io.StringIO()
+    writer = create_report_writer("sarif", buffer)
+    writer.close()
+    writer.close()
+    assert json.loads(buffer.getvalue())["runs"][0]["results"] == []
+
+
+def test_unknown_format():
+    with pytest.raises(ValueError):
+        create_report_writer("pdf", io.StringIO())
+
+
+@pytest.mark.parametrize("path, expected", [
+    ("report.md", "markdown"), ("out.JSONL", "jsonl"), ("a.sarif", "sarif"), ("a.htm", "html"), ("a.txt", "markdown"),
+])
+def test_report_format_for_path(path, expected):
+    assert report_format_for_path(path) == expected
+
+
+def test_catalog_locations():
+    content = '[versions]\nokhttp = "4"\n\n[libraries]\nokhttp = "a:b:1"\n"quoted-alias" = "c:d:2"\n\n[plugins]\nksp = "e:1"\n'
+    locations = catalog_locations("libs.versions.toml", content)
+    assert locations == {
+        "okhttp": ReportLocation("libs.versions.toml", 5, "a:b"),
+        "quoted-alias": ReportLocation("libs.versions.toml", 6, "c:d"),
+        "plugins.ksp": ReportLocation("libs.versions.toml", 9, "e:e.gradle.plugin"),
+    }
@@ -0,0 +1,117 @@
+# scheduler.py: 위험도 점수와 예산 배정 (네트워크/AI 호출 없음)
+import pytest
+
+from libguard.scheduler import (
+    ADVISORY_SCORE, MAX_STALENESS_SCORE, UPDATE_TYPE_SCORES, AnalysisBudget, estimate_library_tokens,
+    plan_schedule, risk_score, score_items, staleness,
+)
+from libguard.versions import MAJOR, PATCH, UP_TO_DATE
+from libguard.vulnerabilities import Advisory, CRITICAL, HIGH
+
+
+class FakeIndex:
+    def __init__(self, advisories):
+        self.advisories = advisories
+
+    def affected(self, coordinate, version):
+        return self.advisories.get((coordinate, version), [])
+
+
+class FakeAnalyzer:
+    def __init__(self, advisories=None, cached=()):
+        self.vulnerability_index = FakeIndex(advisories or {})
+        self.cached = set(cached)
+
+    def is_cached(self, lib_name, current_version, coordinate="", latest_version=None):
+        return lib_name in self.cached
+
+
+ITEMS = [
+    ("current", "1.0.0", "g:current", "1.0.0"),    # 최신 → 무료
+    ("minor", "1.0.0", "g:minor", "1.1.0"),
+    ("major", "1.0.0", "g:major", "4.0.0"),
+    ("patch", "1.0.0", "g:patch", "1.0.1"),
+    ("vulnerable", "1.0.0", "g:vulnerable", "1.1.0"),
+    ("cached", "1.0.0", "g:cached", "2.0.0"),       # 캐시 → 무료
+]
+
+
+@pytest.fixture
+def analyzer():
+    return FakeAnalyzer(
+        advisories={("g:vulnerable", "1.0.0"): [Advisory("GHSA-1", severity=HIGH)]},
+        cached={"cached"},
+    )
+
+
+@pytest.mark.parametrize("current, latest, expected", [
+    ("1.0.0", "1.0.5", 0.0),
+    ("1.0.0", "1.3.0", 0.6),
+    ("1.5.0", "3.1.0", 2.0),
+    ("1.0.0", "9.0.0", MAX_STALENESS_SCORE),
+    ("2.0.0", "1.0.0", 0.0),
+    ("1", "1.2", 0.4),
+    ("abc", "1.0", 0.0),
+])
+def test_staleness(current, latest, expected):
+    assert staleness(current, latest) == pytest.approx(expected)
+
+
+def test_risk_score_puts_advisories_first():
+    assert risk_score(PATCH, [], "1.0.0", "1.0.1") == UPDATE_TYPE_SCORES[PATCH]
+    assert risk_score(UP_TO_DATE, [HIGH], "1.0.0", "1.0.0") == ADVISORY_SCORE * 3
+    assert risk_score(PATCH, [HIGH, CRITICAL], "1.0.0", "1.0.1") == UPDATE_TYPE_SCORES[PATCH] + ADVISORY_SCORE * 4
+    # 심각도가 없는 권고도 최소 1단계로 본다
+    assert risk_score(PATCH, [""], "1.0.0", "1.0.1") == UPDATE_TYPE_SCORES[PATCH] + ADVISORY_SCORE
+    assert risk_score(MAJOR, [], "1.0.0", "9.0.0") > risk_score(MAJOR, [], "1.0.0", "2.0.0")
+
+
+def test_score_items_order_and_free_items(analyzer):
+    scored = score_items(analyzer, ITEMS)
+    names = [ITEMS[item.index][0] for item in scored]
+    assert names[0] == "vulnerable"
+    assert names.index("major") < names.index("patch") < names.index("minor")
+    assert names[-1] == "current"
+
+    by_name = {ITEMS[item.index][0]: item for item in scored}
+    assert by_name["current"].free and by_name["cached"].free
+    assert by_name["cached"].prompt_tokens == 0
+    assert (by_name["patch"].prompt_tokens, by_name["patch"].completion_tokens) == estimate_library_tokens()
+
+
+def test_ties_keep_catalog_order():
+    items = [(f"lib{i}", "1.0.0", f"g:lib{i}", "1.0.1") for i in range(4)]
+    assert [item.index for item in score_items(FakeAnalyzer(), items)] == [0, 1, 2, 3]
+
+
+def test_unlimited_budget_analyzes_everything(analyzer):
+    plan = plan_schedule(analyzer, ITEMS, AnalysisBudget())
+    assert sorted(plan.analyze) == list(range(len(ITEMS)))
+    assert plan.skipped == 0
+    assert plan.tokens == 4 * sum(estimate_library_tokens())
+
+
+def test_library_budget_takes_riskiest_and_keeps_free_items(analyzer):
+    plan = plan_schedule(analyzer, ITEMS, AnalysisBudget(max_libraries=2))
+    assert {ITEMS[i][0] for i in plan.analyze} == {"vulnerable", "major", "current", "cached"}
+    assert {ITEMS[i][0] for i in plan.estimate} == {"patch", "minor"}
+
+
+def test_token_budget(analyzer):
+    per_library = sum(estimate_library_tokens())
+    plan = plan_schedule(analyzer, ITEMS, AnalysisBudget(tokens=per_library * 3 - 1))
+    assert plan.tokens == per_library * 2
+    assert plan.skipped == 2
+
+
+def test_usd_budget(analyzer):
+    plan = plan_schedule(analyzer, ITEMS, AnalysisBudget(usd=0.0))
+    assert {ITEMS[i][0] for i in plan.analyze} == {"current", "cached"}
+    assert plan.usd == 0.0
+
+
+def test_batch_estimate_is_cheaper_per_library():
+    single_prompt, single_completion = estimate_library_tokens(1)
+    batch_prompt, batch_completion = estimate_library_tokens(8)
+    assert batch_prompt < single_prompt
+    assert batch_completion <= single_completion
@@ -0,0 +1,70 @@
+# singleflight.py: 같은 키 작업 병합과 결과/예외 전달
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from libguard.singleflight import SingleFlight
+
+
+def _run_with_follower(flights, fn):
+    """리더가 fn 안에서 멈춘 동안 팔로워 하나가 같은 키로 합류한 뒤 (리더, 팔로워) 결과 future 를 반환"""
+    started, release = threading.Event(), threading.Event()
+
+    def leader_fn():
+        started.set()
+        release.wait(5)
+        return fn()
+
+    pool = ThreadPoolExecutor(max_workers=2)
+    leader = pool.submit(flights.do, "key", leader_fn)
+    assert started.wait(5)
+    follower = pool.submit(flights.do, "key", pytest.fail, "팔로워가 직접 실행하면 안 된다")
+    deadline = time.time() + 5
+    while flights.coalesced < 1 and time.time() < deadline:
+        time.sleep(0.01)
+    release.set()
+    pool.shutdown(wait=True)
+    return leader, follower
+
+
+def test_follower_receives_leader_result():
+    flights = SingleFlight()
+    calls = []
+
+    leader, follower = _run_with_follower(flights, lambda: calls.append(1) or "result")
+
+    assert leader.result() == follower.result() == "result"
+    assert calls == [1]
+    assert flights.coalesced == 1
+    assert flights.in_flight() == 0
+
+
+def test_leader_error_is_raised_to_followers_and_key_is_released():
+    flights = SingleFlight()
+    error = ValueError("upstream failed")
+
+    def fail():
+        raise error
+
+    leader, follower = _run_with_follower(flights, fail)
+
+    assert leader.exception() is error
+    assert follower.exception() is error
+    assert flights.in_flight() == 0
+    # 실패한 작업은 남지 않으므로 다음 호출은 새로 실행한다
+    assert flights.do("key", lambda: "retried") == "retried"
+
+
+def test_finish_with_error_after_claim():
+    flights = SingleFlight()
+    future, is_leader = flights.claim("key")
+    waiting, joined = flights.claim("key")
+
+    assert is_leader and not joined and waiting is future
+    flights.finish("key", future, error=RuntimeError("batch failed"))
+
+    with pytest.raises(RuntimeError, match="batch failed"):
+        waiting.result()
+    assert flights.claim("key")[1] is True
@@ -0,0 +1,46 @@
+from libguard.analyzer import StableLibraryAnalyzer
+from libguard.cache import ResultCache
+from libguard.engine import AnalysisEngine
+from libguard.snapshot import SnapshotStore, analyze_incremental
+
+COORDINATE = "com.example:okhttp"
+
+
+def _analyze(engine, store):
+    results, reused = analyze_incremental(
+        engine, store, "libs.versions.toml", {"okhttp": "1.0.0"}, {"okhttp": COORDINATE}
+    )
+    return results[0], reused
+
+
+def test_new_upstream_release_is_not_served_from_result_cache(upstream):
+    analyzer = StableLibraryAnalyzer("test-key", cache=ResultCache(":memory:"))
+    engine = AnalysisEngine(analyzer, max_workers=1)
+    store = SnapshotStore(":memory:")
+
+    first, _ = _analyze(engine, store)
+    assert first.latest_version == upstream.latest_version(COORDINATE)
+
+    upstream.publish(COORDINATE, "9.0.0")
+    upstream.reset_stats()
+    second, reused = _analyze(engine, store)
+
+    assert reused == 0
+    assert second.latest_version == "9.0.0"
+    assert second.update_type == "major"
+    assert upstream.snapshot()["chat_requests"] == 1
+    assert store.load("libs.versions.toml")["okhttp"].latest_version == "9.0.0"
+
+
+def test_unchanged_entry_is_reused_without_requests(upstream):
+    analyzer = StableLibraryAnalyzer("test-key", cache=ResultCache(":memory:"))
+    engine = AnalysisEngine(analyzer, max_workers=1)
+    store = SnapshotStore(":memory:")
+
+    _analyze(engine, store)
+    upstream.reset_stats()
+    result, reused = _analyze(engine, store)
+
+    assert reused == 1
+    assert result.latest_version == upstream.latest_version(COORDINATE)
+    assert upstream.snapshot()["chat_requests"] == 0
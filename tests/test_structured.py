@@ -0,0 +1,86 @@
+# structured.py: 어긋난 모델 응답의 로컬 복구와 정규화
+import pytest
+
+from libguard.structured import (
+    ANALYSIS_SCHEMA, loads_lenient, normalize_analysis, parse_analysis, parse_batch, response_format,
+)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ('{"a": 1}', {"a": 1}),
+    ('```json\n{"a": 1}\n```', {"a": 1}),
+    ('다음은 결과입니다:\n{"a": 1}\n이상입니다.', {"a": 1}),
+    ('{"a": [1, 2,],}', {"a": [1, 2]}),
+    ('{"a": "잘린 문장', {"a": "잘린 문장"}),
+    ('{"a": 1, "b": [{"c": "d"}, {"c"', {"a": 1, "b": [{"c": "d"}, {}]}),
+    ('{"a": 1, "b":', {"a": 1}),
+    ('[{"a": 1}]', [{"a": 1}]),
+    ("JSON 이 없음", None),
+    (None, None),
+])
+def test_loads_lenient(text, expected):
+    assert loads_lenient(text) == expected
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("업데이트 권장", "업데이트 권장"),
+    ("Update recommended", "업데이트 권장"),
+    ("Recommend upgrading", "업데이트 권장"),
+    ("Review before update", "검토 필요"),
+    ("review the changelog, then update", "검토 필요"),
+    ("검토 후 업데이트 권장", "검토 필요"),
+    ("Optional update", "선택사항"),
+    ("선택적으로 업데이트", "선택사항"),
+    ("", "검토 필요"),
+    ("???", "검토 필요"),
+])
+def test_recommendation_keywords(value, expected):
+    assert normalize_analysis({"summary": "s", "recommendation": value})["recommendation"] == expected
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("높음", "높음"), ("우선순위: 낮음", "낮음"), ("HIGH", "높음"), ("moderate", "중간"), ("하", "낮음"), ("?", "중간"),
+])
+def test_priority_aliases(value, expected):
+    assert normalize_analysis({"summary": "s", "priority": value})["priority"] == expected
+
+
+def test_normalize_key_aliases_and_lists():
+    analysis = normalize_analysis({
+        "요약": ["첫 줄", "", "둘째 줄"], "우선순위": "high", "권장사항": "update", "최신 버전": " 2.0 ",
+        "이름": "okhttp",
+    })
+    assert analysis == {
+        "latest_version": "2.0", "priority": "높음", "summary": "첫 줄\n둘째 줄",
+        "recommendation": "업데이트 권장", "name": "okhttp",
+    }
+
+
+def test_normalize_requires_summary():
+    assert normalize_analysis({"priority": "높음"}) is None
+    assert normalize_analysis(["not", "a", "dict"]) is None
+
+
+def test_parse_analysis_accepts_single_batch_shapes():
+    single = '{"summary": "s", "priority": "낮음", "recommendation": "선택사항", "latest_version": "1"}'
+    assert parse_analysis(single)["priority"] == "낮음"
+    assert parse_analysis('{"results": [%s]}' % single)["summary"] == "s"
+    assert parse_analysis("[%s]" % single)["summary"] == "s"
+
+
+def test_parse_batch_drops_unusable_items():
+    text = '''```json
+    {"results": [
+        {"name": "a", "summary": "ok", "priority": "high"},
+        {"name": "b"},
+        {"summary": "no name"},
+        {"name": "c", "summary": "잘린'''
+    assert [analysis["name"] for analysis in parse_batch(text)] == ["a", "c"]
+    assert parse_batch('{"name": "a", "summary": "s"}')[0]["name"] == "a"
+    assert parse_batch("설명뿐") == []
+
+
+def test_response_format():
+    strict = response_format("gpt-4o-mini", ANALYSIS_SCHEMA, "analysis")
+    assert strict["type"] == "json_schema" and strict["json_schema"]["strict"] is True
+    assert response_format("gpt-3.5-turbo", ANALYSIS_SCHEMA, "analysis") == {"type": "json_object"}
@@ -0,0 +1,92 @@
+# versions.py: Maven ComparableVersion 규칙과 업데이트 유형 분류
+import pytest
+
+from libguard.versions import (
+    MAJOR, MINOR, PATCH, PRERELEASE, UNKNOWN, UP_TO_DATE, classify_update, compare_versions, is_prerelease,
+    sort_versions,
+)
+from libguard.vulnerabilities import SecurityAssessment, security_fields
+
+
+def test_qualifier_order():
+    ordered = [
+        "1.0-alpha1", "1.0-beta1", "1.0-milestone1", "1.0-rc1", "1.0-SNAPSHOT", "1.0", "1.0-sp1", "1.0.1",
+    ]
+    for lower, higher in zip(ordered, ordered[1:]):
+        assert compare_versions(lower, higher) < 0, (lower, higher)
+        assert compare_versions(higher, lower) > 0, (lower, higher)
+    assert sort_versions(list(reversed(ordered))) == ordered
+
+
+@pytest.mark.parametrize("left, right", [
+    ("1.0", "1.0.0"),
+    ("1", "1.0.0"),
+    ("1.0-ga", "1.0"),
+    ("1.0-final", "1.0"),
+    ("1.0-release", "1"),
+    ("1.0-a1", "1.0-alpha1"),
+    ("1.0-b1", "1.0-beta1"),
+    ("1.0-m1", "1.0-milestone1"),
+    ("1.0-cr1", "1.0-rc1"),
+    ("1.0-RC1", "1.0-rc1"),
+])
+def test_equivalent_versions(left, right):
+    assert compare_versions(left, right) == 0
+
+
+@pytest.mark.parametrize("lower, higher", [
+    ("1.0alpha1", "1.0-beta1"),
+    ("1.0-alpha1", "1.0beta1"),
+    ("1.0.0-rc1", "1.0.0"),
+    ("1.0-rc1", "1.0.0"),
+    ("1-1.foo-bar1baz-.1", "1-1.foo-bar1baz-.2"),
+    ("1.9", "1.10"),
+    ("1.0-alpha-2", "1.0-alpha-10"),
+    ("2.0-M1", "2.0"),
+])
+def test_mixed_separators(lower, higher):
+    assert compare_versions(lower, higher) < 0
+
+
+@pytest.mark.parametrize("version, expected", [
+    ("1.0.0-alpha01", True),
+    ("2.0-M1", True),
+    ("1.1-SNAPSHOT", True),
+    ("4.12.0-RC2", True),
+    ("1.0.0", False),
+    ("1.0-sp1", False),
+    ("1.0-final", False),
+])
+def test_is_prerelease(version, expected):
+    assert is_prerelease(version) is expected
+
+
+@pytest.mark.parametrize("current, latest, expected", [
+    ("1.0.0", "1.0.0", UP_TO_DATE),
+    ("1.0.1", "1.0.0", UP_TO_DATE),
+    ("1.0.0", "1.0.1", PATCH),
+    ("1.0.0", "1.1.0", MINOR),
+    ("1.9.0", "2.0.0", MAJOR),
+    ("1.0.0-rc1", "1.0.0", PRERELEASE),
+    ("1.0-rc1", "1.0.0", PRERELEASE),
+    ("1.0.0-alpha01", "1.0.0-beta01", PRERELEASE),
+    ("1.0.0-rc1", "1.0.1", PATCH),
+    ("2.0-M1", "3.0.0", MAJOR),
+    ("1.0.0", "1.0.1-rc1", PRERELEASE),
+    ("1.0.0", "2.0.0-alpha01", PRERELEASE),
+    ("1.0.0", "1.1.0-SNAPSHOT", PRERELEASE),
+    ("", "1.0.0", UNKNOWN),
+    ("abc", "def", UNKNOWN),
+    ("1.0.0", "latest.release", UNKNOWN),
+    ("1.0.0", "latest.integration", UNKNOWN),
+    ("1.0.0", "+", UNKNOWN),
+    ("latest.release", "1.0.0", UNKNOWN),
+])
+def test_classify_update(current, latest, expected):
+    assert classify_update(current, latest) == expected
+
+
+def test_release_of_prerelease_is_not_hotfix():
+    fields = security_fields(SecurityAssessment("com.example:lib", "1.0.0-rc1"), classify_update("1.0.0-rc1", "1.0.0"))
+    assert fields["is_hotfix"] is False
+    assert fields["recommendation"] == "업데이트 권장"
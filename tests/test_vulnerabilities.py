@@ -0,0 +1,122 @@
+# vulnerabilities.py: OSV 구간 색인의 경계, 여러 구간, 수정 버전 계산
+import json
+
+import pytest
+
+from libguard.vulnerabilities import HIGH, MODERATE, VulnerabilityIndex, build_vulnerability_index
+
+COORDINATE = "com.example:lib"
+
+
+def _record(advisory_id, events_list, severity="", versions=()):
+    return {
+        "id": advisory_id,
+        "aliases": [f"CVE-2024-{advisory_id[-1]}000"],
+        "database_specific": {"severity": severity},
+        "affected": [{
+            "package": {"ecosystem": "Maven", "name": COORDINATE},
+            "ranges": [{"type": "ECOSYSTEM", "events": events} for events in events_list],
+            "versions": list(versions),
+        }],
+    }
+
+
+@pytest.fixture
+def index(tmp_path):
+    records = [
+        # 1.0 ≤ v < 1.2.0, 2.0-rc1 ≤ v < 2.0.3  (한 권고에 구간 두 개)
+        _record("GHSA-1", [
+            [{"introduced": "1.0"}, {"fixed": "1.2.0"}],
+            [{"introduced": "2.0-rc1"}, {"fixed": "2.0.3"}],
+        ], severity=HIGH),
+        # 1.1.0 ≤ v ≤ 1.3.0 (last_affected 는 끝 포함, 수정 버전 없음)
+        _record("GHSA-2", [[{"introduced": "1.1.0"}, {"last_affected": "1.3.0"}]], severity="MEDIUM"),
+        # 0 ≤ v < 0.5, 그리고 명시된 버전 3.0.0
+        _record("GHSA-3", [[{"introduced": "0"}, {"fixed": "0.5"}]], versions=["3.0.0"]),
+        # 2.0.1 ≤ v < 2.1.0 (GHSA-1 수정 버전 2.0.3 이 여기에 걸린다)
+        _record("GHSA-4", [[{"introduced": "2.0.1"}, {"fixed": "2.1.0"}]]),
+        # 철회된 권고는 무시
+        dict(_record("GHSA-5", [[{"introduced": "0"}]]), withdrawn="2024-01-01T00:00:00Z"),
+    ]
+    dump = tmp_path / "dump.json"
+    dump.write_text(json.dumps(records), encoding="utf-8")
+    path, advisories, packages = build_vulnerability_index(str(dump), str(tmp_path / "index.json"))
+    assert (advisories, packages) == (4, 1)
+    return VulnerabilityIndex(path)
+
+
+def _ids(index, version):
+    return sorted(advisory.id for advisory in index.affected(COORDINATE, version))
+
+
+@pytest.mark.parametrize("version, expected", [
+    ("0.1", ["GHSA-3"]),            # introduced "0" 은 -∞
+    ("0.5", []),                    # fixed 는 끝 미포함
+    ("0.9", []),                    # 구간 사이
+    ("1.0", ["GHSA-1"]),            # introduced 는 시작 포함
+    ("1.0.0", ["GHSA-1"]),          # 0 채움 (1.0 == 1.0.0)
+    ("1.1.0", ["GHSA-1", "GHSA-2"]),
+    ("1.2.0", ["GHSA-2"]),
+    ("1.3.0", ["GHSA-2"]),          # last_affected 는 끝 포함
+    ("1.3.0.1", []),
+    ("1.3.1", []),
+    ("2.0-beta1", []),              # 사전 릴리스 순서: beta < rc
+    ("2.0-rc1", ["GHSA-1"]),        # 같은 권고의 두 번째 구간
+    ("2.0.0", ["GHSA-1"]),
+    ("2.0.2", ["GHSA-1", "GHSA-4"]),
+    ("2.0.3", ["GHSA-4"]),
+    ("2.1.0", []),
+    ("3.0.0", ["GHSA-3"]),          # 명시된 버전
+    ("3.0.1", []),
+    ("99.0", []),                   # 모든 구간 밖
+])
+def test_affected_boundaries(index, version, expected):
+    assert _ids(index, version) == expected
+
+
+def test_unknown_coordinate_and_empty_version(index):
+    assert index.affected("com.example:other", "1.0") == []
+    assert index.affected(COORDINATE, "") == []
+    assert not index.assess("com.example:other", "1.0").affected
+
+
+def test_missing_index_file(tmp_path):
+    index = VulnerabilityIndex(str(tmp_path / "missing.json"))
+    assert not index.available
+    assert index.affected(COORDINATE, "1.0") == []
+
+
+def test_assess_fixed_version(index):
+    assessment = index.assess(COORDINATE, "0.1")
+    assert [advisory.id for advisory in assessment.advisories] == ["GHSA-3"]
+    assert assessment.severity == ""
+    assert assessment.fixed_version == "0.5"
+    # 1.2.0 에서 GHSA-1 은 고쳐지지만 GHSA-2(last_affected 1.3.0) 에 걸리므로 수정 버전이 없다
+    assessment = index.assess(COORDINATE, "1.0.5")
+    assert assessment.severity == HIGH
+    assert assessment.fixed_version == ""
+
+
+def test_assess_follows_overlapping_ranges(index):
+    # 2.0.0 → 2.0.3 에서 고쳐지지만 2.0.3 은 GHSA-4 에 걸리므로 2.1.0 까지 가야 한다
+    assert index.assess(COORDINATE, "2.0.0").fixed_version == "2.1.0"
+
+
+def test_assess_without_fix(index):
+    # last_affected 구간에 걸리면 수정 버전을 알 수 없다
+    assessment = index.assess(COORDINATE, "1.1.0")
+    assert [advisory.id for advisory in assessment.advisories] == ["GHSA-1", "GHSA-2"]
+    assert assessment.severity == HIGH
+    assert assessment.fixed_version == ""
+    assert index.assess(COORDINATE, "1.2.5").severity == MODERATE
+
+
+def test_assess_fix_newer_than_latest(index):
+    assert index.assess(COORDINATE, "2.0.0", latest_version="2.0.9").fixed_version == ""
+    assert index.assess(COORDINATE, "2.0.0", latest_version="2.1.0").fixed_version == "2.1.0"
+
+
+def test_assess_outside_ranges(index):
+    assessment = index.assess(COORDINATE, "1.5.0")
+    assert not assessment.affected
+    assert assessment.fixed_version == ""
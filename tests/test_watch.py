@@ -0,0 +1,151 @@
+import time
+
+from libguard.analyzer import StableLibraryAnalyzer
+from libguard.cache import ResultCache
+from libguard.metadata import MetadataFetcher, MetadataStore
+from libguard.ratelimit import RateLimitExceeded
+from libguard.watch import CatalogTracker, WatchRegistry, Watcher
+
+CATALOG = """
+[libraries]
+okhttp = "com.example:okhttp:1.0.0"
+gson = "com.example:gson:1.0.0"
+"""
+
+
+def _watcher(tmp_path, alerts):
+    path = tmp_path / "libs.versions.toml"
+    path.write_text(CATALOG, encoding="utf-8")
+    fetcher = MetadataFetcher(MetadataStore(":memory:"))
+    analyzer = StableLibraryAnalyzer("test-key", cache=ResultCache(":memory:"))
+    watcher = Watcher(
+        analyzer, fetcher, WatchRegistry(":memory:"), CatalogTracker([str(path)]),
+        interval=60, jitter=0, on_alert=alerts.append,
+    )
+    return watcher, analyzer
+
+
+def _poll(watcher):
+    # 다음 확인 시각을 기다리지 않고 모든 좌표를 확인할 때가 된 것으로 본다
+    return watcher.poll_once(now=time.time() + 3600)
+
+
+def test_first_cycle_only_records_baseline(upstream, tmp_path):
+    alerts = []
+    watcher, _ = _watcher(tmp_path, alerts)
+
+    cycle = _poll(watcher)
+
+    assert cycle.added == 2 and cycle.checked == 2
+    assert alerts == [] and cycle.analyzed == 0
+    assert upstream.snapshot()["chat_requests"] == 0
+
+
+def test_new_release_alert_carries_new_version(upstream, tmp_path):
+    alerts = []
+    watcher, analyzer = _watcher(tmp_path, alerts)
+    _poll(watcher)
+    # 이전 최신 버전 기준 분석이 결과 캐시에 남아 있어도 새 릴리스 알림에는 쓰이면 안 된다
+    previous = upstream.latest_version("com.example:okhttp")
+    analyzer.analyze_library("okhttp", "1.0.0", "com.example:okhttp", previous)
+
+    upstream.publish("com.example:okhttp", "9.0.0")
+    upstream.reset_stats()
+    cycle = _poll(watcher)
+
+    assert cycle.checked == 2 and cycle.unchanged == 1 and cycle.analyzed == 1
+    assert upstream.snapshot()["metadata_not_modified"] == 1
+    assert upstream.snapshot()["chat_requests"] == 1
+    [alert] = alerts
+    assert (alert.coordinate, alert.previous, alert.latest) == ("com.example:okhttp", previous, "9.0.0")
+    payload = alert.to_dict()
+    assert payload["results"][0]["latest_version"] == "9.0.0"
+    assert payload["results"][0]["update_type"] == "major"
+
+
+def _fail_first(calls, error):
+    """첫 호출만 error 를 던지는 함수 래퍼"""
+    def wrap(function):
+        def wrapper(*args, **kwargs):
+            calls.append(args)
+            if len(calls) == 1:
+                raise error
+            return function(*args, **kwargs)
+        return wrapper
+    return wrap
+
+
+def _latest_recorded(watcher, coordinate):
+    [row] = [row for row in watcher.registry.due(now=time.time() + 10 ** 6) if row["coordinate"] == coordinate]
+    return row["latest"]
+
+
+def test_failed_analysis_keeps_release_for_next_cycle(upstream, tmp_path, monkeypatch):
+    alerts = []
+    watcher, analyzer = _watcher(tmp_path, alerts)
+    _poll(watcher)
+    previous = upstream.latest_version("com.example:okhttp")
+    calls = []
+    monkeypatch.setattr(
+        analyzer, "analyze_library", _fail_first(calls, RuntimeError("boom"))(analyzer.analyze_library)
+    )
+
+    upstream.publish("com.example:okhttp", "9.0.0")
+    cycle = _poll(watcher)
+
+    assert alerts == [] and cycle.alerts == []
+    assert cycle.failed == 1 and "boom" in cycle.errors["com.example:okhttp"]
+    assert _latest_recorded(watcher, "com.example:okhttp") == previous
+
+    cycle = _poll(watcher)
+
+    [alert] = alerts
+    assert (alert.previous, alert.latest) == (previous, "9.0.0")
+    assert alert.results[0].latest_version == "9.0.0"
+    assert cycle.failed == 0 and cycle.errors == {}
+    assert _latest_recorded(watcher, "com.example:okhttp") == "9.0.0"
+    # 알린 뒤에는 같은 릴리스를 다시 알리지 않는다
+    _poll(watcher)
+    assert len(alerts) == 1
+
+
+def test_rate_limited_analysis_is_retried_in_same_cycle(upstream, tmp_path, monkeypatch):
+    alerts = []
+    watcher, analyzer = _watcher(tmp_path, alerts)
+    _poll(watcher)
+    calls = []
+    monkeypatch.setattr(
+        analyzer, "analyze_library", _fail_first(calls, RateLimitExceeded(0.01))(analyzer.analyze_library)
+    )
+
+    upstream.publish("com.example:okhttp", "9.0.0")
+    cycle = _poll(watcher)
+
+    assert len(calls) == 2
+    assert cycle.errors == {} and cycle.analyzed == 1
+    [alert] = alerts
+    assert alert.results[0].latest_version == "9.0.0"
+
+
+def test_failed_alert_delivery_is_retried(upstream, tmp_path):
+    alerts = []
+    delivered = []
+
+    def on_alert(alert):
+        alerts.append(alert)
+        if len(alerts) == 1:
+            raise OSError("disk full")
+        delivered.append(alert)
+
+    watcher, _ = _watcher(tmp_path, [])
+    watcher.on_alert = on_alert
+    _poll(watcher)
+
+    upstream.publish("com.example:okhttp", "9.0.0")
+    cycle = _poll(watcher)
+    assert delivered == [] and cycle.alerts == []
+    assert "disk full" in cycle.errors["com.example:okhttp"]
+
+    cycle = _poll(watcher)
+    [alert] = delivered
+    assert alert.latest == "9.0.0" and cycle.alerts == [alert]